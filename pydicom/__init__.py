@@ -30,7 +30,7 @@ Quick Start
 
 
 from pydicom.dataelem import DataElement
-from pydicom.dataset import Dataset, FileDataset
+from pydicom.dataset import Dataset, FileDataset, compile_getter
 from pydicom.filereader import dcmread, read_file
 from pydicom.filewriter import dcmwrite, write_file
 from pydicom.sequence import Sequence
@@ -41,6 +41,7 @@ __all__ = ['DataElement',
            'Dataset',
            'FileDataset',
            'Sequence',
+           'compile_getter',
            'dcmread',
            'dcmwrite',
            'read_file',
@@ -0,0 +1,244 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Read DICOM files from :mod:`asyncio` code without blocking the event loop.
+
+.. versionadded:: 2.0
+"""
+
+import asyncio
+from collections import deque
+import fnmatch
+from io import BytesIO
+import os
+
+from pydicom.filereader import dcmread
+from pydicom.fileutil import path_from_pathlike
+
+
+def _read_buffered(path, kwargs):
+    """Return the dataset read from `path`.
+
+    The file is read into memory with a single call and then parsed from the
+    buffer, so the file is only open for as long as it takes to read it.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+        timestamp = os.fstat(f.fileno()).st_mtime
+
+    ds = dcmread(BytesIO(data), **kwargs)
+    # Point any deferred reads at the original file rather than the buffer
+    ds.filename = path
+    ds.fileobj_type = open
+    ds.timestamp = timestamp
+
+    return ds
+
+
+async def dcmread_async(fp, defer_size=None, stop_before_pixels=False,
+                        force=False, specific_tags=None, executor=None,
+                        semaphore=None):
+    """Read and parse a DICOM file without blocking the event loop.
+
+    .. versionadded:: 2.0
+
+    The file is read into memory and parsed from the in-memory buffer by
+    `executor`, so the event loop is free to run other tasks in the meantime.
+
+    Parameters
+    ----------
+    fp : str or PathLike
+        The path to the file to read.
+    defer_size : int or str or None, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info. Deferred
+        values are read from the original file when accessed, which will
+        block.
+    stop_before_pixels : bool, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    force : bool, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    specific_tags : list or None, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    executor : concurrent.futures.Executor or None, optional
+        The executor used to read and parse the file. If ``None`` (default)
+        then use the event loop's default executor. The number of workers
+        in the executor limits the number of files read at the same time.
+    semaphore : asyncio.Semaphore or None, optional
+        If used then `semaphore` is acquired while the file is being read,
+        which can be used to limit the number of reads that are queued or in
+        progress.
+
+    Returns
+    -------
+    FileDataset or DicomDir
+        An instance of :class:`~pydicom.dataset.FileDataset` that represents
+        a parsed DICOM file, unless the dataset is a *Media Storage
+        Directory* instance, in which case a
+        :class:`~pydicom.dicomdir.DicomDir` is returned.
+
+    Examples
+    --------
+    Read a file from within a coroutine:
+
+    >>> ds = await dcmread_async('CT_small.dcm', stop_before_pixels=True)
+    """
+    kwargs = {
+        'defer_size': defer_size,
+        'stop_before_pixels': stop_before_pixels,
+        'force': force,
+        'specific_tags': specific_tags,
+    }
+    path = path_from_pathlike(fp)
+    loop = asyncio.get_event_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(
+            executor, _read_buffered, path, kwargs
+        )
+
+    async with semaphore:
+        return await loop.run_in_executor(
+            executor, _read_buffered, path, kwargs
+        )
+
+
+def _walk(path, pattern, recursive):
+    """Yield the paths to the files in `path` matching `pattern`."""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for fname in sorted(fnmatch.filter(files, pattern)):
+            yield os.path.join(root, fname)
+
+        if not recursive:
+            return
+
+
+def _next_paths(paths, count):
+    """Return a list of up to `count` items from the iterator `paths`."""
+    return [p for _, p in zip(range(count), paths)]
+
+
+class _DirectoryScan:
+    """Asynchronous iterator returned by :func:`scan_directory_async`."""
+
+    def __init__(self, path, pattern, recursive, concurrency, executor,
+                 kwargs):
+        self._paths = _walk(path, pattern, recursive)
+        self._concurrency = concurrency
+        self._executor = executor
+        self._kwargs = kwargs
+        self._queued = deque()
+        self._pending = deque()
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_event_loop()
+        while len(self._pending) < self._concurrency:
+            if not self._queued and not self._exhausted:
+                # Listing the directory may also block, so do it off-loop
+                self._queued.extend(await loop.run_in_executor(
+                    self._executor, _next_paths, self._paths,
+                    self._concurrency
+                ))
+                self._exhausted = not self._queued
+
+            if not self._queued:
+                break
+
+            path = self._queued.popleft()
+            future = loop.run_in_executor(
+                self._executor, _read_buffered, path, self._kwargs
+            )
+            self._pending.append((path, future))
+
+        if not self._pending:
+            raise StopAsyncIteration
+
+        path, future = self._pending.popleft()
+        try:
+            return path, await future
+        except Exception as exc:
+            return path, exc
+
+    async def aclose(self):
+        """Cancel any reads in progress and stop the scan."""
+        self._exhausted = True
+        self._queued.clear()
+        while self._pending:
+            _, future = self._pending.popleft()
+            future.cancel()
+
+
+def scan_directory_async(path, pattern='*', recursive=True, concurrency=8,
+                         executor=None, defer_size=None,
+                         stop_before_pixels=False, force=False,
+                         specific_tags=None):
+    """Return an asynchronous iterator over the DICOM files in a directory.
+
+    .. versionadded:: 2.0
+
+    At most `concurrency` files are read at the same time, and no further
+    files are read until the results have been consumed, so a slow consumer
+    doesn't cause the results to accumulate in memory.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the directory to scan.
+    pattern : str, optional
+        Only read the files whose names match the :mod:`fnmatch` style
+        `pattern`, default ``'*'``.
+    recursive : bool, optional
+        If ``True`` (default) then also scan the subdirectories of `path`.
+    concurrency : int, optional
+        The maximum number of files being read at the same time, default
+        ``8``.
+    executor : concurrent.futures.Executor or None, optional
+        The executor used to read and parse the files. If ``None`` (default)
+        then use the event loop's default executor.
+    defer_size : int or str or None, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    stop_before_pixels : bool, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    force : bool, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+    specific_tags : list or None, optional
+        See :func:`~pydicom.filereader.dcmread` for parameter info.
+
+    Returns
+    -------
+    asynchronous iterator
+        Yields a ``(path, result)`` tuple for each matching file in sorted
+        order. If the file was read successfully then `result` is the
+        :class:`~pydicom.dataset.FileDataset`, otherwise it's the exception
+        raised while reading the file. The iterator has an ``aclose()``
+        coroutine method that cancels any reads in progress.
+
+    Raises
+    ------
+    ValueError
+        If `concurrency` is less than 1.
+
+    Examples
+    --------
+    Read the patient IDs of all the files in a directory from within a
+    coroutine:
+
+    >>> scan = scan_directory_async('path/to/dir', stop_before_pixels=True)
+    >>> async for path, ds in scan:
+    ...     if not isinstance(ds, Exception):
+    ...         print(ds.PatientID)
+    """
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1")
+
+    kwargs = {
+        'defer_size': defer_size,
+        'stop_before_pixels': stop_before_pixels,
+        'force': force,
+        'specific_tags': specific_tags,
+    }
+    return _DirectoryScan(
+        path_from_pathlike(path), pattern, recursive, concurrency, executor,
+        kwargs
+    )
@@ -0,0 +1,95 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the dataset module."""
+
+from io import BytesIO
+
+from pydicom import dcmread, compile_getter
+from pydicom.data import get_testdata_files
+
+
+CT_SMALL = get_testdata_files('CT_small.dcm')[0]
+RTPLAN = get_testdata_files('rtplan.dcm')[0]
+
+
+class TimeDatasetTraversal:
+    """Time tests for repeatedly traversing a dataset."""
+    def setup(self):
+        """Setup the test"""
+        self.datasets = [dcmread(CT_SMALL), dcmread(RTPLAN)]
+        for ds in self.datasets:
+            # Convert the raw elements so only the traversal is timed
+            list(ds.iterall())
+        self.no_runs = 100
+
+    def time_iter(self):
+        """Time iterating over the top-level elements."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                for elem in ds:
+                    pass
+
+    def time_iterall(self):
+        """Time iterating over all the elements."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                for elem in ds.iterall():
+                    pass
+
+    def time_walk(self):
+        """Time walking the dataset."""
+        def callback(ds, elem):
+            pass
+
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.walk(callback)
+
+    def time_modify_and_iter(self):
+        """Time adding and deleting an element between iterations."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.PatientComments = 'Test'
+                for elem in ds:
+                    pass
+                del ds.PatientComments
+
+    def time_write(self):
+        """Time writing the dataset."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                ds.save_as(BytesIO())
+
+
+class TimeCompileGetter:
+    """Time tests for extracting values with compile_getter()."""
+    def setup(self):
+        """Setup the test"""
+        self.datasets = [dcmread(RTPLAN) for ii in range(100)]
+        for ds in self.datasets:
+            list(ds.iterall())
+        self.getter = compile_getter([
+            'PatientID',
+            'StudyDate',
+            'BeamSequence[0].BeamName',
+            'FractionGroupSequence[0].ReferencedBeamSequence[0].BeamMeterset',
+        ])
+        self.no_runs = 10
+
+    def time_attribute_access(self):
+        """Time extracting the values using attribute access."""
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                (
+                    ds.PatientID,
+                    ds.StudyDate,
+                    ds.BeamSequence[0].BeamName,
+                    ds.FractionGroupSequence[0]
+                    .ReferencedBeamSequence[0].BeamMeterset,
+                )
+
+    def time_compiled_getter(self):
+        """Time extracting the values using a compiled getter."""
+        getter = self.getter
+        for ii in range(self.no_runs):
+            for ds in self.datasets:
+                getter(ds)
@@ -0,0 +1,47 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the filereader module."""
+
+from io import BytesIO
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_files
+
+
+CT_SMALL = get_testdata_files('CT_small.dcm')[0]
+MR_SMALL = get_testdata_files('MR_small.dcm')[0]
+RTPLAN = get_testdata_files('rtplan.dcm')[0]
+
+
+class TimeDcmread:
+    """Time tests for reading datasets with dcmread."""
+    def setup(self):
+        """Setup the test"""
+        self.files = []
+        for fname in [CT_SMALL, MR_SMALL, RTPLAN]:
+            with open(fname, 'rb') as f:
+                self.files.append(f.read())
+        self.no_runs = 100
+
+    def time_file(self):
+        """Time reading from a file on disk."""
+        for ii in range(self.no_runs):
+            for fname in [CT_SMALL, MR_SMALL, RTPLAN]:
+                dcmread(fname)
+
+    def time_file_like(self):
+        """Time reading from a file-like."""
+        for ii in range(self.no_runs):
+            for data in self.files:
+                dcmread(BytesIO(data))
+
+    def time_buffer(self):
+        """Time parsing from a buffer."""
+        for ii in range(self.no_runs):
+            for data in self.files:
+                dcmread(data)
+
+    def time_mmap(self):
+        """Time reading from a memory-mapped file."""
+        for ii in range(self.no_runs):
+            for fname in [CT_SMALL, MR_SMALL, RTPLAN]:
+                dcmread(fname, mmap=True)
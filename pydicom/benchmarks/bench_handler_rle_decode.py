@@ -1,12 +1,18 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Decoding benchmarks for the rle_handler module."""
 
-from pydicom import dcmread
+import numpy as np
+
+from pydicom import config, dcmread
 from pydicom.data import get_testdata_files
 from pydicom.encaps import decode_data_sequence
 from pydicom.pixel_data_handlers.rle_handler import (
     get_pixeldata,
+    rle_encode_frame,
+    _parse_rle_header,
     _rle_decode_frame,
+    _rle_decode_segment,
+    _rle_decode_segment_np,
 )
 
 
@@ -108,3 +114,100 @@ class TimeGetPixelData:
         """Time retrieval of 32-bit, 3 sample/pixel RLE data."""
         for ii in range(self.no_runs):
             get_pixeldata(self.ds_32_3_1)
+
+
+class TimeGetPixelDataNumpy(TimeGetPixelData):
+    """Time tests for rle_handler.get_pixeldata with the NumPy decoder."""
+    def setup(self):
+        """Setup the test"""
+        super(TimeGetPixelDataNumpy, self).setup()
+        self.original_decoder = config.rle_segment_decoder
+        config.rle_segment_decoder = 'numpy'
+
+    def teardown(self):
+        """Restore the environment"""
+        config.rle_segment_decoder = self.original_decoder
+
+
+class TimeGetPixelDataWorkers:
+    """Time tests for rle_handler.get_pixeldata with multiple workers."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = dcmread(EMRI_RLE_10F)
+        self.original_decoder = config.rle_segment_decoder
+        config.rle_segment_decoder = 'numpy'
+        self.no_runs = 100
+
+    def teardown(self):
+        """Restore the environment"""
+        config.rle_segment_decoder = self.original_decoder
+
+    def time_1_worker(self):
+        """Time decoding the frames in turn."""
+        for ii in range(self.no_runs):
+            get_pixeldata(self.ds)
+
+    def time_4_workers(self):
+        """Time decoding the frames using 4 threads."""
+        for ii in range(self.no_runs):
+            get_pixeldata(self.ds, workers=4)
+
+
+def _segments(data):
+    """Return a list of the segments in the RLE frame `data`."""
+    offsets = _parse_rle_header(data[:64]) + [len(data)]
+    return [data[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+class TimeRLEDecodeSegment:
+    """Compare the Python and NumPy RLE segment decoders."""
+    def setup(self):
+        # 16-bit, 512 x 512 frames: a smooth gradient with a lot of short
+        #   runs and noise with mostly long literal runs
+        gradient = np.add.outer(np.arange(512), np.arange(512)) // 4
+        self.gradient = _segments(rle_encode_frame(gradient.astype('<u2')))
+        noise = np.random.RandomState(0).randint(0, 2**16, (512, 512))
+        self.noise = _segments(rle_encode_frame(noise.astype('<u2')))
+        # 16-bit, 64 x 64 frames
+        ds = dcmread(EMRI_RLE_10F)
+        self.emri = []
+        for frame in decode_data_sequence(ds.PixelData):
+            self.emri.extend(_segments(frame))
+
+        self.no_runs = 10
+
+    def time_python_gradient(self):
+        """Time the Python decoder with a 512 x 512 gradient."""
+        for ii in range(self.no_runs):
+            for segment in self.gradient:
+                _rle_decode_segment(segment)
+
+    def time_numpy_gradient(self):
+        """Time the NumPy decoder with a 512 x 512 gradient."""
+        for ii in range(self.no_runs):
+            for segment in self.gradient:
+                _rle_decode_segment_np(segment)
+
+    def time_python_noise(self):
+        """Time the Python decoder with 512 x 512 noise."""
+        for ii in range(self.no_runs):
+            for segment in self.noise:
+                _rle_decode_segment(segment)
+
+    def time_numpy_noise(self):
+        """Time the NumPy decoder with 512 x 512 noise."""
+        for ii in range(self.no_runs):
+            for segment in self.noise:
+                _rle_decode_segment_np(segment)
+
+    def time_python_16bit_1sample_10frame(self):
+        """Time the Python decoder with 10 64 x 64 frames."""
+        for ii in range(self.no_runs):
+            for segment in self.emri:
+                _rle_decode_segment(segment)
+
+    def time_numpy_16bit_1sample_10frame(self):
+        """Time the NumPy decoder with 10 64 x 64 frames."""
+        for ii in range(self.no_runs):
+            for segment in self.emri:
+                _rle_decode_segment_np(segment)
@@ -7,6 +7,8 @@ from pydicom import dcmread
 from pydicom.data import get_testdata_files
 from pydicom.pixel_data_handlers.rle_handler import (
     rle_encode_frame,
+    rle_encode_frames,
+    _rle_encode_row,
     _rle_encode_segment,
 )
 
@@ -22,6 +24,8 @@ EXPL_16_3_1F = get_testdata_files("SC_rgb_16bit.dcm")[0]
 EXPL_32_1_1F = get_testdata_files("rtdose_1frame.dcm")[0]
 # 32/32-bit, 3 sample/pixel, 1 frame
 EXPL_32_3_1F = get_testdata_files("SC_rgb_32bit.dcm")[0]
+# 16/16-bit, 1 sample/pixel, 10 frame
+EXPL_16_1_10F = get_testdata_files("emri_small.dcm")[0]
 
 
 class TimeRLEEncodeSegment:
@@ -38,6 +42,12 @@ class TimeRLEEncodeSegment:
         for ii in range(self.no_runs):
             _rle_encode_segment(self.arr)
 
+    def time_encode_rows(self):
+        """Time encoding a full segment one row at a time."""
+        for ii in range(self.no_runs):
+            for row in self.arr:
+                _rle_encode_row(row)
+
 
 class TimeRLEEncodeFrame:
     """Time tests for rle_handler.rle_encode_frame."""
@@ -86,3 +96,26 @@ class TimeRLEEncodeFrame:
         """Time encoding 32 bit 3 sample/pixel."""
         for ii in range(self.no_runs):
             rle_encode_frame(self.arr32_3)
+
+
+class TimeRLEEncodeFrames:
+    """Time tests for rle_handler.rle_encode_frames."""
+    def setup(self):
+        # Tile the frames to get a larger amount of data to encode
+        arr = dcmread(EXPL_16_1_10F).pixel_array
+        self.frames = np.tile(arr, (10, 8, 8))
+
+    def time_sequential(self):
+        """Time encoding the frames one at a time."""
+        for frame in self.frames:
+            rle_encode_frame(frame)
+
+    def time_thread(self):
+        """Time encoding the frames using a thread pool."""
+        for frame in rle_encode_frames(self.frames, executor='thread'):
+            pass
+
+    def time_process(self):
+        """Time encoding the frames using a process pool."""
+        for frame in rle_encode_frames(self.frames, executor='process'):
+            pass
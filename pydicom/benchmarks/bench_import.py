@@ -0,0 +1,64 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the time taken to import pydicom.
+
+Each benchmark runs in a new interpreter so nothing has been imported yet.
+"""
+
+import subprocess
+import sys
+
+
+def _run(code):
+    """Run `code` in a new interpreter."""
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+class TimeImport:
+    """Time tests for importing pydicom and first use of the dictionaries."""
+    def setup(self):
+        """Setup the test"""
+        # Make sure the bytecode has been compiled
+        _run(
+            "from pydicom.datadict import private_dictionary_VR; "
+            "private_dictionary_VR(0x00091000, 'ACUSON')"
+        )
+        self.no_runs = 10
+
+    def time_python(self):
+        """Time starting the interpreter, for comparison."""
+        for ii in range(self.no_runs):
+            _run("pass")
+
+    def time_import(self):
+        """Time importing pydicom."""
+        for ii in range(self.no_runs):
+            _run("import pydicom")
+
+    def time_import_and_keyword_lookup(self):
+        """Time importing pydicom and loading the DICOM dictionary."""
+        for ii in range(self.no_runs):
+            _run(
+                "from pydicom.datadict import tag_for_keyword; "
+                "tag_for_keyword('PatientName')"
+            )
+
+    def time_import_and_private_lookup(self):
+        """Time importing pydicom and loading the private dictionaries."""
+        for ii in range(self.no_runs):
+            _run(
+                "from pydicom.datadict import private_dictionary_VR; "
+                "private_dictionary_VR(0x00091000, 'ACUSON')"
+            )
+
+    def time_import_sr_codes(self):
+        """Time importing the SR codes."""
+        for ii in range(self.no_runs):
+            _run("from pydicom.sr.codedict import codes")
+
+    def time_import_sr_codes_and_cid_lookup(self):
+        """Time importing the SR codes and loading the CID dictionaries."""
+        for ii in range(self.no_runs):
+            _run(
+                "from pydicom.sr.codedict import codes; "
+                "codes.cid270.Person"
+            )
@@ -180,6 +180,67 @@ of :class:`~pydicom.dataset.Dataset` begin with a separate section
 displaying the file meta information data elements
 """
 
+rle_segment_decoder = 'python'
+"""The implementation used by the RLE Lossless pixel data handler to decode
+the RLE segments, one of:
+
+* ``'python'``: decodes each run in turn, fastest when the data has a small
+  number of long runs, such as noisy or mostly uniform images
+* ``'numpy'``: locates the runs and builds the decoded segment using
+  vectorised NumPy operations, fastest for large images with a lot of short
+  runs, such as smooth gradients
+
+Default ``'python'``.
+
+.. versionadded:: 2.0
+"""
+
+deferred_read_handles = 8
+"""The maximum number of file handles kept open for reading deferred data
+elements.
+
+Handles are shared between all datasets read from the same file and the least
+recently used handle is closed when the limit is exceeded. A file is only
+checked for changes when its handle is opened, rather than on every deferred
+read. Set to ``0`` to open and check the file on every deferred read. Use
+:func:`~pydicom.filereader.close_deferred_handles` to close all the pooled
+handles, e.g. before deleting, moving or replacing the files.
+
+Default ``8``.
+
+.. versionadded:: 2.0
+"""
+
+pixel_cache_size = None
+"""The memory budget (in bytes) of the process-wide cache for decoded pixel
+data, see :mod:`~pydicom.pixel_data_handlers.cache`.
+
+If ``None`` (default) then the array returned by
+:attr:`Dataset.pixel_array<pydicom.dataset.Dataset.pixel_array>` is stored
+with the dataset for as long as the dataset exists. Otherwise the arrays
+returned by :attr:`~pydicom.dataset.Dataset.pixel_array` and
+:meth:`~pydicom.dataset.Dataset.get_frame` are kept in a cache shared by all
+datasets, with the least recently used arrays evicted to keep the total size
+of the cached arrays within the budget. Any changes made to an array are
+lost once it has been evicted.
+
+.. versionadded:: 2.0
+"""
+
+pixel_data_handler_ranking = None
+"""The order to try the pixel data handlers in for each transfer syntax.
+
+If ``None`` (default) then the handlers are tried in the order they appear in
+:attr:`pixel_data_handlers`. Otherwise a :class:`dict` mapping *Transfer
+Syntax UIDs* to :class:`list` of handler names, such as ``'gdcm'`` or
+``'pillow'``, with the handlers to try first at the start of the list. Any
+handlers not in the list are tried afterwards in their usual order. A ranking
+based on the measured throughput of the installed handlers can be created
+with :func:`~pydicom.pixel_data_handlers.ranking.calibrate`.
+
+.. versionadded:: 2.0
+"""
+
 # Logging system and debug function to change logging level
 logger = logging.getLogger('pydicom')
 logger.addHandler(logging.NullHandler())
@@ -1,29 +1,100 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 # -*- coding: utf-8 -*-
-"""Access dicom dictionary information"""
+"""Access dicom dictionary information
+
+.. versionchanged:: 2.0
+
+    The DICOM and private dictionaries are loaded when they're first used
+    rather than when the module is imported.
+"""
+
+import threading
 
 from pydicom.config import logger
+from pydicom.misc import lazy_attributes
 from pydicom.tag import Tag, BaseTag
 
-# the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
-from pydicom._dicom_dict import DicomDictionary
 
+# The dictionaries are empty until they're first used, when they're filled
+#   by _load_dicom_dictionary() and _load_private_dictionaries()
+# the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
+DicomDictionary = {}
 # those with tags like "(50xx, 0005)"
-from pydicom._dicom_dict import RepeatersDictionary
-from pydicom._private_dict import private_dictionaries
-
-
-# Generate mask dict for checking repeating groups etc.
+RepeatersDictionary = {}
 # Map a true bitwise mask to the DICOM mask with "x"'s in it.
 masks = {}
-for mask_x in RepeatersDictionary:
-    # mask1 is XOR'd to see that all non-"x" bits
-    # are identical (XOR result = 0 if bits same)
-    # then AND those out with 0 bits at the "x"
-    # ("we don't care") location using mask2
-    mask1 = int(mask_x.replace("x", "0"), 16)
-    mask2 = int("".join(["F0" [c == "x"] for c in mask_x]), 16)
-    masks[mask_x] = (mask1, mask2)
+# Provide for the 'reverse' lookup. Given the keyword, what is the tag?
+keyword_dict = {}
+REPEATER_KEYWORDS = []
+private_dictionaries = {}
+
+_dicom_dictionary_loaded = False
+_private_dictionaries_loaded = False
+_load_lock = threading.Lock()
+
+
+def _load_dicom_dictionary():
+    """Load the DICOM and repeaters dictionaries if not already loaded.
+
+    Any entries already added with :func:`add_dict_entries` take precedence
+    over those in the dictionary.
+    """
+    global _dicom_dictionary_loaded
+
+    with _load_lock:
+        if _dicom_dictionary_loaded:
+            return
+
+        from pydicom import _dicom_dict
+
+        entries = dict(_dicom_dict.DicomDictionary)
+        entries.update(DicomDictionary)
+        DicomDictionary.update(entries)
+        RepeatersDictionary.update(_dicom_dict.RepeatersDictionary)
+
+        # Generate mask dict for checking repeating groups etc.
+        for mask_x in RepeatersDictionary:
+            # mask1 is XOR'd to see that all non-"x" bits
+            # are identical (XOR result = 0 if bits same)
+            # then AND those out with 0 bits at the "x"
+            # ("we don't care") location using mask2
+            mask1 = int(mask_x.replace("x", "0"), 16)
+            mask2 = int("".join(["F0"[c == "x"] for c in mask_x]), 16)
+            masks[mask_x] = (mask1, mask2)
+
+        logger.debug(
+            "Reversing DICOM dictionary so can look up tag from a keyword..."
+        )
+        keyword_dict.update(
+            {val[4]: tag for tag, val in DicomDictionary.items()}
+        )
+        REPEATER_KEYWORDS.extend(
+            val[4] for val in RepeatersDictionary.values()
+        )
+
+        _dicom_dictionary_loaded = True
+
+
+def _load_private_dictionaries():
+    """Load the private dictionaries if not already loaded.
+
+    Any entries already added with :func:`add_private_dict_entries` take
+    precedence over those in the dictionaries.
+    """
+    global _private_dictionaries_loaded
+
+    with _load_lock:
+        if _private_dictionaries_loaded:
+            return
+
+        from pydicom import _private_dict
+
+        for creator, entries in _private_dict.private_dictionaries.items():
+            entries = dict(entries)
+            entries.update(private_dictionaries.get(creator, {}))
+            private_dictionaries[creator] = entries
+
+        _private_dictionaries_loaded = True
 
 
 def mask_match(tag):
@@ -40,6 +111,9 @@ def mask_match(tag):
         If the tag is in the repeaters dictionary then returns the
         corresponding masked tag, otherwise returns ``None``.
     """
+    if not _dicom_dictionary_loaded:
+        _load_dicom_dictionary()
+
     for mask_x, (mask1, mask2) in masks.items():
         if (tag ^ mask1) & mask2 == 0:
             return mask_x
@@ -136,6 +210,8 @@ def add_dict_entries(new_entries_dict):
             'Private tags cannot be added using "add_dict_entries" - '
             'use "add_private_dict_entries" instead')
 
+    _load_dicom_dictionary()
+
     # Update the dictionary itself
     DicomDictionary.update(new_entries_dict)
 
@@ -220,6 +296,8 @@ def add_private_dict_entries(private_creator, new_entries_dict):
             'Non-private tags cannot be added using "add_private_dict_entries"'
             ' - use "add_dict_entries" instead')
 
+    _load_private_dictionaries()
+
     new_entries = {'{:04x}xx{:02x}'.format(tag >> 16, tag & 0xff): value
                    for tag, value in new_entries_dict.items()}
     private_dictionaries.setdefault(
@@ -263,6 +341,10 @@ def get_entry(tag):
     try:
         return DicomDictionary[tag]
     except KeyError:
+        if not _dicom_dictionary_loaded:
+            _load_dicom_dictionary()
+            return get_entry(tag)
+
         if not tag.is_private:
             mask_x = mask_match(tag)
             if mask_x:
@@ -404,6 +486,9 @@ def dictionary_has_tag(tag):
         ``True`` if the tag corresponds to an element present in the official
         DICOM data dictionary, ``False`` otherwise.
     """
+    if not _dicom_dictionary_loaded:
+        _load_dicom_dictionary()
+
     return (tag in DicomDictionary)
 
 
@@ -428,12 +513,6 @@ def keyword_for_tag(tag):
         return ""
 
 
-# Provide for the 'reverse' lookup. Given the keyword, what is the tag?
-logger.debug("Reversing DICOM dictionary so can look up tag from a keyword...")
-keyword_dict = dict([(dictionary_keyword(tag), tag)
-                     for tag in DicomDictionary])
-
-
 def tag_for_keyword(keyword):
     """Return the tag of the element corresponding to `keyword`.
 
@@ -450,7 +529,12 @@ def tag_for_keyword(keyword):
         If the element is in the DICOM data dictionary then returns the
         corresponding element's tag, otherwise returns ``None``.
     """
-    return keyword_dict.get(keyword)
+    tag = keyword_dict.get(keyword)
+    if tag is None and not _dicom_dictionary_loaded:
+        _load_dicom_dictionary()
+        return keyword_dict.get(keyword)
+
+    return tag
 
 
 def repeater_has_tag(tag):
@@ -470,9 +554,6 @@ def repeater_has_tag(tag):
     return (mask_match(tag) in RepeatersDictionary)
 
 
-REPEATER_KEYWORDS = [val[4] for val in RepeatersDictionary.values()]
-
-
 def repeater_has_keyword(keyword):
     """Return ``True`` if `keyword` is in the DICOM repeaters data dictionary.
 
@@ -487,6 +568,9 @@ def repeater_has_keyword(keyword):
         ``True`` if the keyword corresponding to an element present in the
         official DICOM repeaters data dictionary, ``False`` otherwise.
     """
+    if not _dicom_dictionary_loaded:
+        _load_dicom_dictionary()
+
     return keyword in REPEATER_KEYWORDS
 
 
@@ -520,6 +604,9 @@ def get_private_entry(tag, private_creator):
     """
     if not isinstance(tag, BaseTag):
         tag = Tag(tag)
+    if not _private_dictionaries_loaded:
+        _load_private_dictionaries()
+
     try:
         private_dict = private_dictionaries[private_creator]
     except KeyError:
@@ -618,3 +705,13 @@ def private_dictionary_description(tag, private_creator):
         If the tag is not present in the private dictionary.
     """
     return get_private_entry(tag, private_creator)[2]
+
+
+lazy_attributes(__name__, {
+    'DicomDictionary': _load_dicom_dictionary,
+    'RepeatersDictionary': _load_dicom_dictionary,
+    'masks': _load_dicom_dictionary,
+    'keyword_dict': _load_dicom_dictionary,
+    'REPEATER_KEYWORDS': _load_dicom_dictionary,
+    'private_dictionaries': _load_private_dictionaries,
+})
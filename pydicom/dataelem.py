@@ -145,8 +145,21 @@ class DataElement:
         The element's stored value(s).
     VR : str
         The element's Value Representation.
+
+    .. versionchanged:: 2.0
+
+        The standard attributes are stored in ``__slots__`` rather than the
+        instance ``__dict__``.
     """
 
+    # The attributes set on every element are kept in slots to reduce the
+    #   memory used by large datasets, the instance __dict__ is only created
+    #   if other attributes are set, such as the display options below
+    __slots__ = (
+        'tag', 'VR', '_value', 'file_tell', 'is_undefined_length',
+        'private_creator', '__dict__'
+    )
+
     descripWidth = 35
     maxBytesToDisplay = 16
     showVR = True
@@ -213,6 +226,27 @@ class DataElement:
         self.is_undefined_length = is_undefined_length
         self.private_creator = None
 
+    def __getstate__(self):
+        """Return the element's attributes for pickling.
+
+        :class:`memoryview` values, such as those from a memory-mapped file,
+        are copied to :class:`bytes` as they can't be pickled.
+        """
+        state = {
+            name: getattr(self, name) for name in DataElement.__slots__
+            if name != '__dict__' and hasattr(self, name)
+        }
+        if isinstance(state.get('_value'), memoryview):
+            state['_value'] = state['_value'].tobytes()
+
+        state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the element's attributes when unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def from_json(cls, dataset_class, tag, vr, value, value_key,
                   bulk_data_uri_handler=None):
@@ -407,7 +441,7 @@ class DataElement:
         """Return the value multiplicity of the element as :class:`int`."""
         if self.value is None:
             return 0
-        if isinstance(self.value, (str, bytes, PersonName)):
+        if isinstance(self.value, (str, bytes, memoryview, PersonName)):
             return 1 if self.value else 0
         try:
             iter(self.value)
@@ -565,6 +599,9 @@ class DataElement:
             repVal = "Array of %d elements" % self.VM
         elif isinstance(self.value, UID):
             repVal = self.value.name
+        elif isinstance(self.value, memoryview):
+            # The same as for bytes, such as values from a memory-mapped file
+            repVal = repr(self.value.tobytes())
         else:
             repVal = repr(self.value)  # will tolerate unicode too
         return repVal
@@ -669,6 +706,19 @@ RawDataElement = namedtuple('RawDataElement', msg)
 RawDataElement.is_raw = True
 
 
+def _reduce_raw_element(raw):
+    """Return the arguments used to pickle or copy a :class:`RawDataElement`,
+    with any :class:`memoryview` value copied to :class:`bytes`.
+    """
+    if isinstance(raw.value, memoryview):
+        raw = raw._replace(value=raw.value.tobytes())
+
+    return (RawDataElement, tuple(raw))
+
+
+RawDataElement.__reduce__ = _reduce_raw_element
+
+
 # The first and third values of the following elements are always US
 #   even if the VR is SS (PS3.3 C.7.6.3.1.5, C.11.1, C.11.2).
 # (0028,1101-1103) RGB Palette Color LUT Descriptor
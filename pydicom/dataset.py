@@ -15,13 +15,14 @@ Dataset (dict subclass)
             contains its own DataElements, and so on in a recursive manner.
 """
 
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right, insort
 import io
 import inspect  # for __dir__
 from itertools import takewhile
 import json
 import os
 import os.path
+import re
 import warnings
 
 import pydicom  # for dcmwrite
@@ -36,6 +37,8 @@ from pydicom.datadict import (tag_for_keyword, keyword_for_tag,
                               repeater_has_keyword)
 from pydicom.dataelem import DataElement, DataElement_from_raw, RawDataElement
 from pydicom.fileutil import path_from_pathlike
+from pydicom.pixel_data_handlers import cache as pixel_cache
+from pydicom.pixel_data_handlers.ranking import get_handlers
 from pydicom.pixel_data_handlers.util import (
     convert_color_space, reshape_pixel_array, get_image_pixel_ids
 )
@@ -357,10 +360,15 @@ class Dataset(dict):
         self._parent_encoding = kwargs.get('parent_encoding', default_encoding)
         if not args:
             self._dict = {}
+            self._tags = []
         elif isinstance(args[0], Dataset):
             self._dict = args[0]._dict
+            # Share the tag list as well so it stays in sync with the dict
+            self._tags = args[0]._sorted_tags()
         else:
             self._dict = args[0]
+            # Sorted on first use
+            self._tags = None
         self.is_decompressed = False
 
         # the following read_XXX attributes are used internally to store
@@ -427,6 +435,8 @@ class Dataset(dict):
 
         data_element = DataElement(tag, VR, value)
         # use data_element.tag since DataElement verified it
+        if data_element.tag not in self._dict:
+            self._insert_tag(data_element.tag)
         self._dict[data_element.tag] = data_element
 
     def data_element(self, name):
@@ -540,6 +550,7 @@ class Dataset(dict):
         tag = tag_for_keyword(name)
         if tag is not None and tag in self._dict:
             del self._dict[tag]
+            self._remove_tag(tag)
         # If not a DICOM name in this dataset, check for regular instance name
         #   can't do delete directly, that will call __delattr__ again
         elif name in self.__dict__:
@@ -582,6 +593,7 @@ class Dataset(dict):
         if isinstance(key, slice):
             for tag in self._slice_dataset(key.start, key.stop, key.step):
                 del self._dict[tag]
+                self._remove_tag(tag)
                 # invalidate private blocks in case a private creator is
                 # deleted - will be re-created on next access
                 if self._private_blocks and BaseTag(tag).is_private_creator:
@@ -590,12 +602,14 @@ class Dataset(dict):
             # Assume is a standard tag (for speed in common case)
             try:
                 del self._dict[key]
+                self._remove_tag(key)
                 if self._private_blocks and BaseTag(key).is_private_creator:
                     self._private_blocks = {}
             # If not a standard tag, than convert to Tag and try again
             except KeyError:
                 tag = Tag(key)
                 del self._dict[tag]
+                self._remove_tag(tag)
                 if self._private_blocks and tag.is_private_creator:
                     self._private_blocks = {}
 
@@ -774,6 +788,9 @@ class Dataset(dict):
         if name == '_dict':
             # special handling for contained dict, needed for pickle
             return {}
+        if name == '_tags':
+            # as above, for the sorted list of tags
+            return None
         # Try the base class attribute getter (fix for issue 332)
         return object.__getattribute__(self, name)
 
@@ -1138,8 +1155,7 @@ class Dataset(dict):
         # Note this is different than the underlying dict class,
         #        which returns the key of the key:value mapping.
         #   Here the value is returned (but data_element.tag has the key)
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
+        for tag in self._iter_tags():
             yield self[tag]
 
     def elements(self):
@@ -1162,8 +1178,7 @@ class Dataset(dict):
         dataelem.DataElement or dataelem.RawDataElement
             The unconverted elements sorted by increasing tag order.
         """
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
+        for tag in self._iter_tags():
             yield self.get_item(tag)
 
     def __len__(self):
@@ -1176,6 +1191,8 @@ class Dataset(dict):
     def clear(self):
         """Delete all the elements from the :class:`Dataset`."""
         self._dict.clear()
+        if self._tags is not None:
+            del self._tags[:]
 
     def pop(self, key, *args):
         """Emulate :meth:`dict.pop` with support for tags and keywords.
@@ -1210,10 +1227,14 @@ class Dataset(dict):
             tag = Tag(key)
         except (ValueError, OverflowError):
             return self._dict.pop(key, *args)
+        if tag in self._dict:
+            self._remove_tag(tag)
         return self._dict.pop(tag, *args)
 
     def popitem(self):
-        return self._dict.popitem()
+        tag, data_element = self._dict.popitem()
+        self._remove_tag(tag)
+        return tag, data_element
 
     def setdefault(self, key, default=None):
         """Emulate :meth:`dict.setdefault` with support for tags and keywords.
@@ -1274,9 +1295,15 @@ class Dataset(dict):
             self[key] = default
         return default
 
-    def convert_pixel_data(self, handler_name=''):
+    def convert_pixel_data(self, handler_name='', workers=None, out=None):
         """Convert pixel data to a :class:`numpy.ndarray` internally.
 
+        .. versionchanged:: 2.0
+
+            Added the `workers` and `out` keyword parameters. If
+            :attr:`~pydicom.config.pixel_cache_size` is set then the array
+            replaces any array in the process-wide pixel cache.
+
         Parameters
         ----------
         handler_name : str, optional
@@ -1284,7 +1311,27 @@ class Dataset(dict):
             decode the data. Supported names are: ``'gdcm'``,
             ``'pillow'``, ``'jpeg_ls'``, ``'rle'`` and ``'numpy'``.
             If not used (the default), a matching handler is used from the
-            handlers configured in :attr:`~pydicom.config.pixel_data_handlers`.
+            handlers configured in :attr:`~pydicom.config.pixel_data_handlers`,
+            in the order given by
+            :attr:`~pydicom.config.pixel_data_handler_ranking` if it's set.
+        workers : int or None, optional
+            If greater than 1 then the handlers that decode each frame
+            separately (``'pillow'``, ``'jpeg_ls'`` and ``'rle'``) decode up
+            to `workers` frames of multi-frame pixel data at the same time
+            using a thread pool. If ``None`` (default) then decode the
+            frames in turn.
+        out : numpy.ndarray or None, optional
+            If used then the pixel data is decoded directly into `out`
+            (such as a slice of a larger volume) rather than into a new
+            array, and :attr:`~Dataset.pixel_array` will be a view of `out`.
+            Multi-sample pixel data is stored in `out` with shape (rows,
+            columns, samples) for each frame, whatever the *Planar
+            Configuration*.
+            `out` must be a writeable C-contiguous array with the same
+            number of items as the pixel data and a dtype of the same kind
+            and item size as the pixel data, although the byte order may
+            differ. The pixel data is always converted when `out` is used,
+            even if it has been converted previously.
 
         Returns
         -------
@@ -1294,7 +1341,8 @@ class Dataset(dict):
         Raises
         ------
         ValueError
-            If `handler_name` is not a valid handler name.
+            If `handler_name` is not a valid handler name, or if `out` isn't
+            suitable for the pixel data.
         NotImplementedError
             If the given handler or any handler, if none given, is unable to
             decompress pixel data with the current transfer syntax
@@ -1306,6 +1354,27 @@ class Dataset(dict):
         -----
         If the pixel data is in a compressed image format, the data is
         decompressed and any related data elements are changed accordingly.
+
+        Examples
+        --------
+        Decode a series of single frame datasets into a 3D volume:
+
+        >>> volume = np.empty((len(datasets), rows, columns), dtype='int16')
+        >>> for ds, plane in zip(datasets, volume):
+        ...     ds.convert_pixel_data(out=plane)
+        """
+        self._convert_pixel_data(handler_name, workers, out)
+        if pixel_cache.is_enabled():
+            # Replace any previously cached array
+            self._cache_pixel_array()
+
+    def _convert_pixel_data(self, handler_name='', workers=None, out=None):
+        """Convert the pixel data to a :class:`numpy.ndarray` stored with
+        the dataset, unless it's already been converted.
+
+        .. versionadded:: 2.0
+
+        See :meth:`~Dataset.convert_pixel_data` for the parameters.
         """
         # Check if already have converted to a NumPy array
         # Also check if pixel data has changed. If so, get new NumPy array
@@ -1315,15 +1384,21 @@ class Dataset(dict):
         elif self._pixel_id != get_image_pixel_ids(self):
             already_have = False
 
-        if already_have:
+        if already_have and out is None:
             return
 
+        kwargs = {}
+        if workers is not None:
+            kwargs['workers'] = workers
+        if out is not None:
+            kwargs['out'] = out
+
         if handler_name:
-            self._convert_pixel_data_using_handler(handler_name)
+            self._convert_pixel_data_using_handler(handler_name, **kwargs)
         else:
-            self._convert_pixel_data_without_handler()
+            self._convert_pixel_data_without_handler(**kwargs)
 
-    def _convert_pixel_data_using_handler(self, name):
+    def _convert_pixel_data_using_handler(self, name, **kwargs):
         """Convert the pixel data using handler with the given name.
         See :meth:`~Dataset.convert_pixel_data` for more information.
         """
@@ -1357,18 +1432,15 @@ class Dataset(dict):
                 "on installing needed packages.".format(name)
             )
         # if the conversion fails, the exception is propagated up
-        self._do_pixel_data_conversion(handler)
+        self._do_pixel_data_conversion(handler, **kwargs)
 
-    def _convert_pixel_data_without_handler(self):
+    def _convert_pixel_data_without_handler(self, **kwargs):
         """Convert the pixel data using the first matching handler.
         See :meth:`~Dataset.convert_pixel_data` for more information.
         """
         # Find all possible handlers that support the transfer syntax
         transfer_syntax = self.file_meta.TransferSyntaxUID
-        possible_handlers = [
-            hh for hh in pydicom.config.pixel_data_handlers
-            if hh.supports_transfer_syntax(transfer_syntax)
-        ]
+        possible_handlers = get_handlers(transfer_syntax)
 
         # No handlers support the transfer syntax
         if not possible_handlers:
@@ -1411,7 +1483,7 @@ class Dataset(dict):
         last_exception = None
         for handler in available_handlers:
             try:
-                self._do_pixel_data_conversion(handler)
+                self._do_pixel_data_conversion(handler, **kwargs)
                 return
             except Exception as exc:
                 logger.debug(
@@ -1433,20 +1505,31 @@ class Dataset(dict):
         )
         raise last_exception
 
-    def _do_pixel_data_conversion(self, handler):
+    def _do_pixel_data_conversion(self, handler, **kwargs):
         """Do the actual data conversion using the given handler."""
 
         # Use the handler to get a 1D numpy array of the pixel data
         # Will raise an exception if no pixel data element
-        arr = handler.get_pixeldata(self)
+        arr = handler.get_pixeldata(self, **kwargs)
         self._pixel_array = reshape_pixel_array(self, arr)
 
+        out = kwargs.get('out')
+        if out is not None and not self._pixel_array.flags.c_contiguous:
+            # Planar pixel data (such as RLE) is decoded into `out` with the
+            #   samples separated, rearrange it to (..., rows, columns,
+            #   samples) so `out` matches the pixel array
+            planar = self._pixel_array.copy()
+            self._pixel_array = out.reshape(planar.shape)
+            self._pixel_array[...] = planar
+
         # Some handler/transfer syntax combinations may need to
         #   convert the color space from YCbCr to RGB
         if handler.needs_to_convert_to_RGB(self):
-            self._pixel_array = convert_color_space(
-                self._pixel_array, 'YBR_FULL', 'RGB'
-            )
+            arr = convert_color_space(self._pixel_array, 'YBR_FULL', 'RGB')
+            if 'out' in kwargs:
+                self._pixel_array[...] = arr
+            else:
+                self._pixel_array = arr
 
         self._pixel_id = get_image_pixel_ids(self)
 
@@ -1514,6 +1597,124 @@ class Dataset(dict):
             # All is as expected, updated the Transfer Syntax
             self.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
 
+    def get_frame(self, index):
+        """Return a single frame of the pixel data as a
+        :class:`numpy.ndarray`.
+
+        .. versionadded:: 2.0
+
+        Unlike :attr:`pixel_array`, only the part of the pixel data
+        containing the frame is used. If the value of the pixel data was
+        deferred when the dataset was read (see the `defer_size` parameter of
+        :func:`~pydicom.filereader.dcmread`) then only the frame is read
+        from the file. For compressed transfer syntaxes only the requested
+        frame is decoded.
+
+        The frame is returned by the first available handler in
+        :attr:`~pydicom.config.pixel_data_handlers` that supports the
+        transfer syntax and has a ``get_frame()`` function, in the order
+        given by :attr:`~pydicom.config.pixel_data_handler_ranking` if it's
+        set.
+
+        If :attr:`~pydicom.config.pixel_cache_size` is set then the frame is
+        kept in the process-wide pixel cache and returned from there by
+        later calls.
+
+        Parameters
+        ----------
+        index : int
+            The index of the frame to return, starting at ``0`` for the first
+            frame. Negative values count back from the last frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            The frame, with shape (rows, columns) for single sample data or
+            (rows, columns, samples) for multi-sample data.
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+        NotImplementedError
+            If the transfer syntax isn't supported.
+        RuntimeError
+            If the handlers that support the transfer syntax are missing
+            required dependencies.
+        """
+        transfer_syntax = self.file_meta.TransferSyntaxUID
+        possible_handlers = [
+            hh for hh in get_handlers(transfer_syntax)
+            if hasattr(hh, 'get_frame')
+        ]
+        if not possible_handlers:
+            raise NotImplementedError(
+                "Unable to return a single frame of the pixel data with a "
+                "transfer syntax UID of '{0}' ({1})"
+                .format(transfer_syntax, transfer_syntax.name)
+            )
+
+        available_handlers = [
+            hh for hh in possible_handlers if hh.is_available()
+        ]
+        if not available_handlers:
+            pkg_msg = []
+            for hh in possible_handlers:
+                hh_deps = hh.DEPENDENCIES
+                # Missing packages
+                missing = [dd for dd in hh_deps if have_package(dd) is None]
+                # Package names
+                names = [hh_deps[name][1] for name in missing]
+                pkg_msg.append(
+                    "{} (req. {})"
+                    .format(hh.HANDLER_NAME, ', '.join(names))
+                )
+
+            raise RuntimeError(
+                "The following handlers are available to return a frame of "
+                "the pixel data however they are missing required "
+                "dependencies: " + ', '.join(pkg_msg)
+            )
+
+        # Only cache frames with a valid index so they have a single key
+        nr_frames = getattr(self, 'NumberOfFrames', 1)
+        use_cache = pixel_cache.is_enabled()
+        use_cache &= -nr_frames <= index < nr_frames
+        if use_cache:
+            index %= nr_frames
+            arr = pixel_cache.get(self, index)
+            if arr is not None:
+                return arr
+
+        handler = available_handlers[0]
+        arr = handler.get_frame(self, index)
+
+        # Some handler/transfer syntax combinations may need to
+        #   convert the color space from YCbCr to RGB
+        if handler.needs_to_convert_to_RGB(self):
+            arr = convert_color_space(arr, 'YBR_FULL', 'RGB')
+
+        if use_cache:
+            pixel_cache.put(self, arr, index)
+
+        return arr
+
+    def iter_frames(self):
+        """Yield the frames of the pixel data as :class:`numpy.ndarray`.
+
+        .. versionadded:: 2.0
+
+        The frames are returned one at a time by :meth:`get_frame`, so only
+        one frame at a time needs to be held in memory.
+
+        Yields
+        ------
+        numpy.ndarray
+            Each frame of the pixel data.
+        """
+        for index in range(getattr(self, 'NumberOfFrames', 1)):
+            yield self.get_frame(index)
+
     def overlay_array(self, group):
         """Return the *Overlay Data* in `group` as a :class:`numpy.ndarray`.
 
@@ -1605,6 +1806,12 @@ class Dataset(dict):
 
             Added support for *Float Pixel Data* and *Double Float Pixel Data*
 
+        .. versionchanged:: 2.0
+
+            If :attr:`~pydicom.config.pixel_cache_size` is set then the
+            array is kept in the process-wide pixel cache instead of with
+            the dataset.
+
         Returns
         -------
         numpy.ndarray
@@ -1612,8 +1819,29 @@ class Dataset(dict):
             Pixel Data* or (7FE0,0010) *Pixel Data* converted to a
             :class:`numpy.ndarray`.
         """
-        self.convert_pixel_data()
-        return self._pixel_array
+        if not pixel_cache.is_enabled():
+            self.convert_pixel_data()
+            return self._pixel_array
+
+        arr = pixel_cache.get(self)
+        if arr is None:
+            self._convert_pixel_data()
+            arr = self._cache_pixel_array()
+
+        return arr
+
+    def _cache_pixel_array(self):
+        """Move the converted pixel array from the dataset to the pixel
+        cache and return it.
+
+        .. versionadded:: 2.0
+        """
+        arr = self._pixel_array
+        del self._pixel_array
+        del self._pixel_id
+        pixel_cache.put(self, arr)
+
+        return arr
 
     # Format strings spec'd according to python string formatting options
     #    See http://docs.python.org/library/stdtypes.html#string-formatting-operations # noqa
@@ -1893,8 +2121,97 @@ class Dataset(dict):
                     data_element = DataElement_from_raw(
                         data_element, self._character_set)
                 data_element.private_creator = self[private_creator_tag].value
+        if tag not in self._dict:
+            self._insert_tag(tag)
         self._dict[tag] = data_element
 
+    def _sorted_tags(self):
+        """Return the tags of the elements in the :class:`Dataset`, sorted by
+        increasing tag value.
+
+        .. versionadded:: 2.0
+
+        The list is updated as elements are added and deleted, so iterating
+        over the :class:`Dataset` doesn't need to sort the tags each time.
+        If the underlying :class:`dict` was modified directly then the list
+        is rebuilt here when the number of elements differs, or by
+        :meth:`_iter_tags` when it contains a tag without an element.
+
+        Returns
+        -------
+        list of BaseTag
+            The sorted tags. This is the list used internally and should
+            not be modified.
+        """
+        tags = self._tags
+        if tags is None:
+            tags = self._tags = sorted(self._dict)
+        elif len(tags) != len(self._dict):
+            # Update in place as the list may be shared with other datasets
+            tags[:] = sorted(self._dict)
+
+        return tags
+
+    def _iter_tags(self):
+        """Yield the tags of the elements in the :class:`Dataset`, sorted by
+        increasing tag value.
+
+        .. versionadded:: 2.0
+
+        Elements may be added or deleted while iterating. If a tag no longer
+        has an element then the sorted tags are rebuilt if needed and
+        iteration continues with the tags that follow the last one yielded.
+
+        Yields
+        ------
+        BaseTag
+            The tag of each element.
+        """
+        tags = list(self._sorted_tags())
+        idx = 0
+        last = None
+        while idx < len(tags):
+            tag = tags[idx]
+            if tag in self._dict:
+                yield tag
+                last = tag
+                idx += 1
+                continue
+
+            # Either the element was deleted after the tags were copied or
+            #   the underlying dict was modified directly
+            current = self._sorted_tags()
+            jj = bisect_left(current, tag)
+            if jj < len(current) and current[jj] == tag:
+                # Update in place as the list may be shared with other datasets
+                current[:] = sorted(self._dict)
+
+            tags = list(current)
+            idx = 0 if last is None else bisect_right(current, last)
+
+    def _insert_tag(self, tag):
+        """Add `tag` to the sorted tags, before its element is added."""
+        tags = self._tags
+        if tags is None:
+            return
+
+        if not tags or tag > tags[-1]:
+            # Elements are usually added in increasing tag order
+            tags.append(tag)
+        else:
+            insort(tags, tag)
+
+    def _remove_tag(self, tag):
+        """Remove `tag` from the sorted tags, after its element is
+        deleted."""
+        tags = self._tags
+        if tags is None:
+            return
+
+        idx = bisect_left(tags, tag)
+        if idx < len(tags) and tags[idx] == tag:
+            del tags[idx]
+
     def _slice_dataset(self, start, stop, step):
         """Return the element tags in the Dataset that match the slice.
 
@@ -1921,7 +2238,7 @@ class Dataset(dict):
         if stop is not None:
             stop = Tag(stop)
 
-        all_tags = sorted(self._dict.keys())
+        all_tags = self._sorted_tags()
         # If the Dataset is empty, return an empty list
         if not all_tags:
             return []
@@ -1932,8 +2249,8 @@ class Dataset(dict):
 
         if start is None:
             if stop is None:
-                # For step=1 avoid copying the list
-                return all_tags if step == 1 else all_tags[::step]
+                # Return a copy as the list is updated on deletion
+                return all_tags[::step]
             else:  # Have a stop value, get values until that point
                 step1_list = list(takewhile(lambda x: x < stop, all_tags))
                 return step1_list if step == 1 else step1_list[::step]
@@ -2032,9 +2349,7 @@ class Dataset(dict):
             Flag to indicate whether to recurse into sequences (default
             ``True``).
         """
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
-
+        for tag in self._iter_tags():
             with tag_in_exception(tag):
                 data_element = self[tag]
                 callback(self, data_element)  # self = this Dataset
@@ -2288,7 +2603,7 @@ class FileDataset(Dataset):
         if isinstance(other, self.__class__):
             return (_dict_equal(self, other) and
                     _dict_equal(self.__dict__, other.__dict__,
-                                exclude=['_dict'])
+                                exclude=['_dict', '_tags'])
                     )
 
         return NotImplemented
@@ -2443,3 +2758,128 @@ class FileMetaDataset(Dataset):
             )
 
         super().__setitem__(key, value)
+
+
+# A single element path component, e.g. 'PatientID' or 'ReferencedSeries[0]'
+_PATH_COMPONENT = re.compile(r'^([0-9A-Za-z]+)(?:\[(-?\d+)\])?$')
+
+
+def _compile_path(path):
+    """Return the (tag, index) steps for the element path `path`."""
+    steps = []
+    components = path.split('.')
+    for ii, component in enumerate(components):
+        match = _PATH_COMPONENT.match(component.strip())
+        if not match:
+            raise ValueError("Invalid element path '{}'".format(path))
+
+        name, index = match.groups()
+        tag = Tag(name)
+        if ii < len(components) - 1:
+            # Intermediate components must select a sequence item
+            if index is None:
+                raise ValueError(
+                    "Invalid element path '{}', the sequence '{}' requires "
+                    "an item index such as '{}[0]'".format(path, name, name)
+                )
+            try:
+                VR = dictionary_VR(tag)
+            except KeyError:
+                VR = 'SQ'
+            if VR != 'SQ':
+                raise ValueError(
+                    "Invalid element path '{}', '{}' is not a sequence"
+                    .format(path, name)
+                )
+
+        steps.append((tag, None if index is None else int(index)))
+
+    return tuple(steps)
+
+
+def _get_path_value(ds, steps, default):
+    """Return the value at the compiled path `steps` in `ds`."""
+    for tag, index in steps:
+        try:
+            elem = ds._dict.get(tag)
+        except AttributeError:
+            # A private element that wasn't read as a sequence
+            return default
+
+        if elem is None:
+            return default
+
+        if not isinstance(elem, DataElement):
+            # Convert raw elements and read deferred values
+            elem = ds[tag]
+
+        value = elem.value
+        if index is not None:
+            try:
+                value = value[index]
+            except (IndexError, TypeError):
+                return default
+
+        ds = value
+
+    return ds
+
+
+def compile_getter(paths, default=None):
+    """Return a function that extracts the values of the elements at `paths`
+    from a :class:`Dataset`.
+
+    .. versionadded:: 2.0
+
+    The keywords and item indices in each path are resolved once when the
+    getter is compiled, so using the getter on many datasets is much faster
+    than the equivalent attribute access.
+
+    Parameters
+    ----------
+    paths : str or list of str
+        The path to an element, or a list of paths. Each path is one or more
+        element keywords or tags (as 8 hexadecimal digits) separated by
+        ``'.'``, with all but the last selecting an item of a sequence using
+        an index in square brackets. The last keyword may also use an index
+        to select one of the values of a multi-valued element, such as
+        ``'ImagePositionPatient[2]'``.
+    default : object, optional
+        The value to return for a path when an element is missing or an
+        index is out of range (default ``None``).
+
+    Returns
+    -------
+    callable
+        A function that takes a :class:`Dataset` and returns the value for
+        `paths` if it's a :class:`str`, or a :class:`tuple` of the values if
+        it's a :class:`list`.
+
+    Raises
+    ------
+    ValueError
+        If a path is invalid or contains an unknown keyword.
+
+    Examples
+    --------
+
+    >>> getter = compile_getter(
+    ...     ['PatientID', 'ReferencedSeriesSequence[0].SeriesInstanceUID']
+    ... )
+    >>> for ds in datasets:
+    ...     patient_id, series_uid = getter(ds)
+    """
+    if isinstance(paths, str):
+        steps = _compile_path(paths)
+
+        def getter(ds):
+            return _get_path_value(ds, steps, default)
+    else:
+        compiled = [_compile_path(path) for path in paths]
+
+        def getter(ds):
+            return tuple([
+                _get_path_value(ds, steps, default) for steps in compiled
+            ])
+
+    return getter
@@ -1,7 +1,8 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Functions for working with encapsulated (compressed) pixel data."""
 
-from struct import pack
+from io import BytesIO
+from struct import pack, unpack
 import warnings
 
 import pydicom.config
@@ -218,7 +219,8 @@ def generate_pixel_data_fragment(fp):
                              .format(tag, fp.tell() - 4))
 
 
-def generate_pixel_data_frame(bytestream, nr_frames=None):
+def generate_pixel_data_frame(bytestream, nr_frames=None,
+                              extended_offsets=None):
     """Yield an encapsulated pixel data frame.
 
     Parameters
@@ -231,6 +233,12 @@ def generate_pixel_data_frame(bytestream, nr_frames=None):
         Required for multi-frame data when the Basic Offset Table is empty
         and there are multiple frames. This should be the value of (0028,0008)
         *Number of Frames*.
+    extended_offsets : tuple, optional
+        The values of the (7FE0,0001) *Extended Offset Table* and (7FE0,0002)
+        *Extended Offset Table Lengths* elements, see
+        :func:`generate_pixel_data`.
+
+        .. versionadded:: 2.0
 
     Yields
     ------
@@ -241,11 +249,12 @@ def generate_pixel_data_frame(bytestream, nr_frames=None):
     ----------
     DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
     """
-    for fragmented_frame in generate_pixel_data(bytestream, nr_frames):
+    frames = generate_pixel_data(bytestream, nr_frames, extended_offsets)
+    for fragmented_frame in frames:
         yield b''.join(fragmented_frame)
 
 
-def generate_pixel_data(bytestream, nr_frames=None):
+def generate_pixel_data(bytestream, nr_frames=None, extended_offsets=None):
     """Yield an encapsulated pixel data frame.
 
     For the following transfer syntaxes, a fragment may not contain encoded
@@ -281,6 +290,14 @@ def generate_pixel_data(bytestream, nr_frames=None):
         Required for multi-frame data when the Basic Offset Table is empty
         and there are multiple frames. This should be the value of (0028,0008)
         *Number of Frames*.
+    extended_offsets : tuple, optional
+        The values of the (7FE0,0001) *Extended Offset Table* and (7FE0,0002)
+        *Extended Offset Table Lengths* elements, either as the encoded
+        :class:`bytes` or as two :class:`list` of :class:`int`. If used then
+        the frames are located using the offsets rather than by parsing the
+        fragments.
+
+        .. versionadded:: 2.0
 
     Yields
     -------
@@ -300,6 +317,14 @@ def generate_pixel_data(bytestream, nr_frames=None):
     ----------
     DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
     """
+    if extended_offsets is not None:
+        # One fragment per frame at the offsets given by the EOT
+        frames = get_frame_index(BytesIO(bytestream), None, extended_offsets)
+        for (offset, length), in frames:
+            yield (bytestream[offset:offset + length], )
+
+        return
+
     fp = DicomBytesIO(bytestream)
     fp.is_little_endian = True
 
@@ -390,6 +415,203 @@ def generate_pixel_data(bytestream, nr_frames=None):
             )
 
 
+def _parse_extended_offsets(extended_offsets):
+    """Return the Extended Offset Table offsets and lengths as lists of int.
+    """
+    values = []
+    for value in extended_offsets:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = unpack('<{}Q'.format(len(value) // 8), value)
+
+        values.append(list(value))
+
+    offsets, lengths = values
+    if len(offsets) != len(lengths):
+        raise ValueError(
+            "The number of values in the Extended Offset Table doesn't match "
+            "the number of values in the Extended Offset Table Lengths"
+        )
+
+    return offsets, lengths
+
+
+def get_frame_index(fp, nr_frames=None, extended_offsets=None):
+    """Return the location of the fragments of each frame in the encapsulated
+    pixel data.
+
+    .. versionadded:: 2.0
+
+    Only the item tags and lengths are read, so the index can be used to read
+    and decode a single frame without having to read the entire *Pixel Data*.
+    The frame boundaries are taken from the Extended Offset Table if
+    `extended_offsets` is used, in which case the fragments aren't read at
+    all, or from the Basic Offset Table if it has a value. Otherwise they're
+    found in the same way as :func:`generate_pixel_data`.
+
+    Parameters
+    ----------
+    fp : file-like
+        A seekable file-like containing the encapsulated pixel data,
+        positioned at the start of the Basic Offset Table item.
+    nr_frames : int, optional
+        Required for multi-frame data when the Basic Offset Table is empty
+        and there are multiple frames. This should be the value of (0028,0008)
+        *Number of Frames*.
+    extended_offsets : tuple, optional
+        The values of the (7FE0,0001) *Extended Offset Table* and (7FE0,0002)
+        *Extended Offset Table Lengths* elements, either as the encoded
+        :class:`bytes` or as two :class:`list` of :class:`int`.
+
+    Returns
+    -------
+    list of tuple of (int, int)
+        The ``(offset, length)`` of each fragment of each frame, as a
+        :class:`tuple` per frame. The `offset` is the position of the first
+        byte of the fragment's value, measured from the start of the Basic
+        Offset Table item.
+
+    Raises
+    ------
+    ValueError
+        If the encapsulated pixel data is invalid or if the frame boundaries
+        can't be determined.
+
+    References
+    ----------
+    DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
+    """
+    start = fp.tell()
+
+    def read_item(offset):
+        header = fp.read(8)
+        if len(header) < 8:
+            return None, None
+
+        group, elem, length = unpack('<HHL', header)
+        tag = group << 16 | elem
+        if tag not in (0xFFFEE000, 0xFFFEE0DD):
+            raise ValueError(
+                "Unexpected tag '{}' at offset {} when parsing the "
+                "encapsulated pixel data fragment items."
+                .format(Tag(tag), offset)
+            )
+
+        if length == 0xFFFFFFFF:
+            raise ValueError(
+                "Undefined item length at offset {} when parsing the "
+                "encapsulated pixel data fragments.".format(offset + 4)
+            )
+
+        return tag, length
+
+    # The Basic Offset Table item
+    group, elem, length = unpack('<HHL', fp.read(8))
+    if (group, elem) != (0xFFFE, 0xE000):
+        raise ValueError("Unexpected tag '{}' when parsing the Basic Table "
+                         "Offset item.".format(Tag(group, elem)))
+
+    if length % 4:
+        raise ValueError("The length of the Basic Offset Table item is not "
+                         "a multiple of 4.")
+
+    offsets = unpack('<{}L'.format(length // 4), fp.read(length))
+
+    if extended_offsets is not None:
+        # One fragment per frame, the offsets are to the fragment's item tag
+        #   from the first item after the BOT item
+        first_item = 8 + length
+        offsets, lengths = _parse_extended_offsets(extended_offsets)
+        return [
+            ((first_item + offset + 8, length), )
+            for offset, length in zip(offsets, lengths)
+        ]
+
+    # The fragment items, as (offset to the value, length of the value)
+    fragments = []
+    offset = 8 + length
+    while True:
+        tag, length = read_item(offset)
+        if tag != 0xFFFEE000:
+            # End of the data or Sequence Delimiter
+            break
+
+        fragments.append((offset + 8, length))
+        offset += 8 + length
+        fp.seek(length, 1)
+
+    if offsets:
+        # Use the BOT to determine the frame boundaries, the offsets are
+        #   from the first item after the BOT item
+        first_item = 16 + len(offsets) * 4
+        frames = [[] for _ in offsets]
+        frame_nr = 0
+        for fragment in fragments:
+            item_offset = fragment[0] - first_item
+            while (frame_nr + 1 < len(offsets)
+                   and item_offset >= offsets[frame_nr + 1]):
+                frame_nr += 1
+
+            frames[frame_nr].append(fragment)
+
+        return [tuple(frame) for frame in frames]
+
+    nr_fragments = len(fragments)
+    if nr_fragments == 1:
+        # Single fragment: 1 frame
+        return [tuple(fragments)]
+
+    if not nr_frames:
+        # Multiple fragments but unknown number of frames
+        raise ValueError(
+            "Unable to determine the frame boundaries for the "
+            "encapsulated pixel data as the Basic Offset Table is empty "
+            "and `nr_frames` parameter is None"
+        )
+
+    if nr_fragments == nr_frames:
+        # 1 fragment per frame
+        return [(fragment, ) for fragment in fragments]
+
+    if nr_frames == 1:
+        # Multiple fragments: 1 frame
+        return [tuple(fragments)]
+
+    if nr_fragments < nr_frames:
+        raise ValueError(
+            "Unable to parse encapsulated pixel data as the Basic "
+            "Offset Table is empty and there are fewer fragments then "
+            "frames; the dataset may be corrupt"
+        )
+
+    # More fragments than frames
+    # Search for JPEG/JPEG-LS/JPEG2K EOI/EOC marker
+    # Should be the last two bytes of a frame
+    # May fail if no EOI/EOC marker or not JPEG
+    frames = []
+    frame = []
+    for fragment in fragments:
+        frame.append(fragment)
+        tail = min(fragment[1], 10)
+        fp.seek(start + fragment[0] + fragment[1] - tail)
+        if b'\xff\xd9' in fp.read(tail):
+            frames.append(tuple(frame))
+            frame = []
+
+    if frame or len(frames) != nr_frames:
+        # If data in `frame` or fewer frames found then we
+        #   must've missed a frame boundary
+        warnings.warn(
+            "The end of the encapsulated pixel data has been "
+            "reached but one or more frame boundaries may have "
+            "been missed; please confirm that the generated frame "
+            "data is correct"
+        )
+        if frame:
+            frames.append(tuple(frame))
+
+    return frames
+
+
 def decode_data_sequence(data):
     """Read encapsulated data and return a list of strings.
 
@@ -671,6 +893,15 @@ def encapsulate(frames, fragments_per_frame=1, has_bot=True):
     bytes
         The encapsulated pixel data.
 
+    Raises
+    ------
+    ValueError
+        If `has_bot` is ``True`` and the encapsulated frames are too large
+        for the offsets to fit in the 32-bit Basic Offset Table, in which
+        case :func:`encapsulate_extended` should be used instead.
+
+        .. versionadded:: 2.0
+
     References
     ----------
     DICOM Standard, Part 5, :dcm:`Section 7.5 <part05/sect_7.5.html>` and
@@ -703,8 +934,69 @@ def encapsulate(frames, fragments_per_frame=1, has_bot=True):
         bot_offsets.append(bot_offsets[ii] + itemised_length)
 
     if has_bot:
+        if no_frames and bot_offsets[-2] > 2**32 - 1:
+            raise ValueError(
+                "The total length of the encapsulated frames is too large "
+                "for the offsets to fit in the Basic Offset Table, use "
+                "encapsulate_extended() to encapsulate the frames with an "
+                "Extended Offset Table instead"
+            )
+
         # Go back and write the frame offsets - don't need the last offset
         output[8:8 + 4 * no_frames] = pack('<{}I'.format(no_frames),
                                            *bot_offsets[:-1])
 
     return bytes(output)
+
+
+def encapsulate_extended(frames):
+    """Return encapsulated `frames` and the corresponding Extended Offset
+    Table values.
+
+    .. versionadded:: 2.0
+
+    The (7FE0,0001) *Extended Offset Table* uses 64-bit offsets, so unlike
+    the Basic Offset Table it can be used when the total length of the
+    encapsulated frames is greater than 4 GB. It also allows the data for
+    any frame to be found without parsing the encapsulated pixel data::
+
+      pixel_data, eot, eot_lengths = encapsulate_extended([frame1, ...])
+      ds.PixelData = pixel_data
+      ds.ExtendedOffsetTable = eot
+      ds.ExtendedOffsetTableLengths = eot_lengths
+
+    Each frame is encapsulated in a single fragment and the Basic Offset
+    Table is empty, as required when the Extended Offset Table is present.
+
+    Parameters
+    ----------
+    frames : list of bytes
+        The encoded frame data to encapsulate, one frame per item.
+
+    Returns
+    -------
+    bytes, bytes, bytes
+        The encapsulated pixel data, the value for the (7FE0,0001) *Extended
+        Offset Table* and the value for the (7FE0,0002) *Extended Offset
+        Table Lengths*.
+
+    References
+    ----------
+    DICOM Standard, Part 3, :dcm:`Annex C.7.6.3.1.8
+    <part03/sect_C.7.6.3.html#sect_C.7.6.3.1.8>`
+    """
+    nr_frames = len(frames)
+    # The offsets are to the item tag for each frame, from the first item
+    #   after the BOT item, and the lengths are the unpadded frame lengths
+    lengths = [len(frame) for frame in frames]
+    offsets = []
+    offset = 0
+    for length in lengths:
+        offsets.append(offset)
+        offset += 8 + length + length % 2
+
+    return (
+        encapsulate(frames, fragments_per_frame=1, has_bot=False),
+        pack('<{}Q'.format(nr_frames), *offsets),
+        pack('<{}Q'.format(nr_frames), *lengths),
+    )
@@ -5,7 +5,10 @@
 from pydicom.tag import Tag, BaseTag
 from struct import (unpack, pack)
 
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation
+import mmap
+import os
+import zlib
 
 
 class DicomIO:
@@ -175,3 +178,312 @@ class DicomBytesIO(DicomFileLike):
 
     def getvalue(self):
         return self.parent.getvalue()
+
+
+class DicomMemoryMap(DicomIO):
+    """Read-only file-like backed by a memory mapping of a file.
+
+    .. versionadded:: 2.0
+
+    Reading from a :class:`DicomMemoryMap` returns :class:`bytes` like any
+    other file-like, but the mapping is also available through the
+    :attr:`view` :class:`memoryview` so that values can be sliced out of the
+    mapped pages without being copied.
+
+    The mapping itself is not closed by :meth:`close` - it is released once
+    the last :class:`memoryview` referring to it is garbage collected.
+
+    When mapping a file object the position starts at its current position,
+    the same as when reading from it. Empty files can't be memory-mapped so
+    an empty buffer is used instead.
+    """
+    def __init__(self, filename_or_obj, mode='rb'):
+        super(DicomMemoryMap, self).__init__()
+        if isinstance(filename_or_obj, str):
+            fp = open(filename_or_obj, mode)
+            self._owns_file = True
+        else:
+            fp = filename_or_obj
+            self._owns_file = False
+
+        self._fp = fp
+        self.name = getattr(fp, 'name', '<no filename>')
+        try:
+            if os.fstat(fp.fileno()).st_size:
+                self._mmap = mmap.mmap(
+                    fp.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self.view = memoryview(self._mmap)
+            else:
+                self._mmap = BytesIO()
+                self.view = memoryview(b'')
+
+            self.parent_read = self._mmap.read
+            self.tell = self._mmap.tell
+            if not self._owns_file:
+                self.seek(fp.tell())
+        except Exception:
+            if self._owns_file:
+                fp.close()
+            raise
+
+    def seek(self, offset, whence=0):
+        """Change the position, clamping it to the end of the mapping."""
+        if whence == 1:
+            offset += self._mmap.tell()
+        elif whence == 2:
+            offset += len(self.view)
+        self._mmap.seek(min(offset, len(self.view)))
+
+    def close(self):
+        """Close the underlying file if it was opened by this object."""
+        if self._owns_file:
+            self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DicomBuffer(DicomIO):
+    """Read-only file-like for an encoded dataset held in memory.
+
+    .. versionadded:: 2.0
+
+    Like :class:`DicomMemoryMap`, the entire contents are available through
+    the :attr:`view` :class:`memoryview`, which allows the dataset to be
+    parsed directly from the buffer and the values of the pixel data
+    elements to be sliced from it without being copied.
+
+    The buffer is kept by :meth:`close` so that deferred values can still be
+    read.
+
+    Parameters
+    ----------
+    data : bytes or bytearray or memoryview
+        The encoded data. Anything other than :class:`bytes` is copied so
+        that later changes to it don't affect the parsed values.
+    """
+    def __init__(self, data):
+        super(DicomBuffer, self).__init__()
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
+        self._fp = BytesIO(data)
+        self.view = memoryview(data)
+        self.parent_read = self._fp.read
+        self.seek = self._fp.seek
+        self.tell = self._fp.tell
+
+    def close(self):
+        """Does nothing, the buffer remains available for deferred reads."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DicomStreamReader(DicomIO):
+    """Forward-only file-like for reading from a non-seekable stream.
+
+    .. versionadded:: 2.0
+
+    Wraps any object with a ``read()`` method, such as a socket file, a pipe
+    or a streaming HTTP response body, and provides the ``seek()`` and
+    ``tell()`` methods needed for parsing. Seeking forwards reads and
+    discards data from the stream, and the last `buffer_size` bytes read are
+    kept so that the parser can rewind over them.
+
+    The wrapped stream is not closed by :meth:`close`.
+
+    Parameters
+    ----------
+    stream : object
+        The object to read from, which must have a ``read(size)`` method that
+        returns :class:`bytes` and returns an empty :class:`bytes` at the end
+        of the stream.
+    buffer_size : int, optional
+        The maximum number of bytes that can be rewound over, default 64 KiB.
+    """
+    def __init__(self, stream, buffer_size=65536):
+        super(DicomStreamReader, self).__init__()
+        self.stream = stream
+        self.buffer_size = buffer_size
+        # The last bytes read from the stream, starting at position `_start`
+        self._buffer = bytearray()
+        self._start = 0
+        # The current position and the number of bytes read from the stream
+        self._position = 0
+        self._end = 0
+
+    def _read_stream(self, size):
+        """Return up to `size` bytes (or all if `size` < 0) from the stream.
+        """
+        stream_read = self.stream.read
+        if size < 0:
+            data = stream_read()
+        else:
+            # Streams may return fewer bytes than requested before the end
+            chunks = []
+            while size > 0:
+                chunk = stream_read(size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size -= len(chunk)
+            data = b"".join(chunks)
+
+        # Keep the last `buffer_size` bytes read to allow rewinding
+        buffer = self._buffer
+        self._end += len(data)
+        if len(data) >= self.buffer_size:
+            self._buffer = bytearray(data[len(data) - self.buffer_size:])
+        else:
+            buffer.extend(data)
+            excess = len(buffer) - self.buffer_size
+            if excess > 0:
+                del buffer[:excess]
+        self._start = self._end - len(self._buffer)
+
+        return data
+
+    def parent_read(self, size=-1):
+        """Return up to `size` bytes, or all the remaining bytes if `size` is
+        ``None`` or negative.
+        """
+        if size is None:
+            size = -1
+
+        data = b""
+        if self._position < self._end:
+            # Re-read bytes that have been rewound over
+            offset = self._position - self._start
+            stop = len(self._buffer) if size < 0 else offset + size
+            data = bytes(self._buffer[offset:stop])
+            self._position += len(data)
+            if size >= 0:
+                size -= len(data)
+            if size == 0:
+                return data
+
+        stream_data = self._read_stream(size)
+        self._position = self._end
+
+        return data + stream_data if data else stream_data
+
+    def seek(self, offset, whence=0):
+        """Change the position in the stream.
+
+        Seeking past the end of the stream moves to the end of the stream.
+
+        Raises
+        ------
+        IOError
+            If seeking to a position that has already been discarded.
+        io.UnsupportedOperation
+            If seeking relative to the end of the stream.
+        """
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            raise UnsupportedOperation(
+                "Unable to seek relative to the end of a stream"
+            )
+
+        if offset < self._start:
+            raise IOError(
+                "Unable to seek to position 0x{:x} as the stream can only be "
+                "rewound to position 0x{:x}, try a larger 'buffer_size'"
+                .format(offset, self._start)
+            )
+
+        if offset > self._end:
+            # Read and discard the bytes being skipped over
+            remaining = offset - self._end
+            while remaining > 0:
+                skipped = len(self._read_stream(min(remaining, 1048576)))
+                if not skipped:
+                    break
+                remaining -= skipped
+
+        self._position = min(offset, self._end)
+        return self._position
+
+    def tell(self):
+        """Return the current position in the stream."""
+        return self._position
+
+    def close(self):
+        """Release the buffer, the wrapped stream is left open."""
+        self._buffer = bytearray()
+        self._start = self._end
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _InflateStream:
+    """Stream of the data inflated from a raw deflate stream."""
+    def __init__(self, fp, read_size=16384):
+        self._fp = fp
+        self._read_size = read_size
+        # -MAX_WBITS for a raw deflate stream without the zlib header
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._eof = False
+
+    def read(self, size=-1):
+        """Return up to `size` inflated bytes, or all if `size` < 0."""
+        decompressor = self._decompressor
+        chunks = []
+        nr_read = 0
+        while not self._eof and (size < 0 or nr_read < size):
+            data = decompressor.unconsumed_tail
+            if not data:
+                data = self._fp.read(self._read_size)
+                if not data:
+                    chunks.append(decompressor.flush())
+                    self._eof = True
+                    break
+
+            # Only inflate as much as has been asked for
+            chunk = decompressor.decompress(
+                data, 0 if size < 0 else size - nr_read
+            )
+            chunks.append(chunk)
+            nr_read += len(chunk)
+            # Ignore any data after the end of the deflate stream
+            self._eof = decompressor.eof
+
+        return b"".join(chunks)
+
+
+class DicomInflateReader(DicomStreamReader):
+    """Forward-only file-like that inflates deflated data as it's read.
+
+    .. versionadded:: 2.0
+
+    Used to read datasets with the *Deflated Explicit VR Little Endian*
+    transfer syntax without first decompressing the entire dataset, so
+    only as much of the deflated data as needed is read and inflated.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like to read the raw deflated data from, positioned at the
+        start of the deflated data. `fp` is not closed by :meth:`close`.
+    buffer_size : int, optional
+        The maximum number of inflated bytes that can be rewound over,
+        default 64 KiB.
+    """
+    def __init__(self, fp, buffer_size=65536):
+        super(DicomInflateReader, self).__init__(
+            _InflateStream(fp), buffer_size
+        )
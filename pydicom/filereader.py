@@ -2,30 +2,71 @@
 """Read a dicom media file"""
 
 
+import atexit
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor
+)
 # Need zlib and io.BytesIO for deflate-compressed file
 from io import BytesIO
+from itertools import islice
+import json
 import os
 from struct import (Struct, unpack)
+import threading
 import warnings
 import zlib
 
 from pydicom import config
-from pydicom.charset import (default_encoding, convert_encodings)
+from pydicom.charset import (
+    default_encoding, convert_encodings, decode_string
+)
 from pydicom.config import logger
-from pydicom.datadict import dictionary_VR, tag_for_keyword
+from pydicom.datadict import dictionary_VR, dictionary_VM, tag_for_keyword
 from pydicom.dataelem import (DataElement, RawDataElement,
                               DataElement_from_raw, empty_value_for_VR)
 from pydicom.dataset import (Dataset, FileDataset, FileMetaDataset)
 from pydicom.dicomdir import DicomDir
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomFile
+from pydicom.filebase import (
+    DicomBuffer, DicomFile, DicomInflateReader, DicomMemoryMap,
+    DicomStreamReader
+)
 from pydicom.fileutil import read_undefined_length_value, path_from_pathlike
 from pydicom.misc import size_in_bytes
 from pydicom.sequence import Sequence
-from pydicom.tag import (ItemTag, SequenceDelimiterTag, TupleTag, Tag, BaseTag)
+from pydicom.tag import (
+    ItemTag, ItemDelimiterTag, SequenceDelimiterTag, TupleTag, Tag, BaseTag
+)
 import pydicom.uid
 from pydicom.util.hexutil import bytes2hex
-from pydicom.valuerep import extra_length_VRs
+from pydicom.valuerep import extra_length_VRs, PN_DELIMS, TEXT_VR_DELIMS
+
+if config.have_numpy:
+    import numpy
+
+
+# The pixel data elements, whose values are left as memoryviews when reading
+#   from a memory-mapped file or buffer, other values are copied to bytes
+_MAPPED_TAGS = (0x7FE00008, 0x7FE00009, 0x7FE00010)
+
+
+def _specific_tag_set(specific_tags):
+    """Return the set of tags to read for `specific_tags`.
+
+    (0008,0005) *Specific Character Set* is always included if
+    `specific_tags` is not ``None``.
+    """
+    tag_set = set()
+    if specific_tags is not None:
+        for tag in specific_tags:
+            if isinstance(tag, str):
+                tag = Tag(tag_for_keyword(tag))
+            if isinstance(tag, BaseTag):
+                tag_set.add(tag)
+        tag_set.add(Tag(0x08, 0x05))
+    return tag_set
 
 
 def data_element_generator(fp,
@@ -34,7 +75,8 @@ def data_element_generator(fp,
                            stop_when=None,
                            defer_size=None,
                            encoding=default_encoding,
-                           specific_tags=None):
+                           specific_tags=None,
+                           lazy_sequences=False):
 
     """Create a generator to efficiently return the raw data elements.
 
@@ -62,6 +104,8 @@ def data_element_generator(fp,
         Encoding scheme
     specific_tags : list or None
         See :func:`dcmread` for parameter info.
+    lazy_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
 
     Returns
     -------
@@ -70,11 +114,150 @@ def data_element_generator(fp,
     length : int
         The length of the DICOM data element (could be DICOM "undefined
         length" ``0xFFFFFFFFL``)
-    value_bytes : bytes or str
-        The raw bytes from the DICOM file (not parsed into Python types)
+    value_bytes : bytes or str or memoryview
+        The raw bytes from the DICOM file (not parsed into Python types). If
+        `fp` is a :class:`~pydicom.filebase.DicomMemoryMap` or
+        :class:`~pydicom.filebase.DicomBuffer` then the values of the pixel
+        data elements such as (7FE0,0010) *Pixel Data* are
+        :class:`memoryview` slices of the mapped file or buffer.
     is_little_endian : bool
         ``True`` if transfer syntax is little endian; else ``False``.
     """
+    args = (fp, is_implicit_VR, is_little_endian, stop_when, defer_size,
+            encoding, specific_tags, lazy_sequences)
+    # Data that's already in memory can be parsed in place, except when
+    #   debugging, which needs the detailed logging of the file-based parser
+    if isinstance(fp, (DicomBuffer, DicomMemoryMap)) and not config.debugging:
+        return _buffer_element_generator(*args)
+
+    return _file_element_generator(*args)
+
+
+def _buffer_element_generator(fp, is_implicit_VR, is_little_endian,
+                              stop_when, defer_size, encoding, specific_tags,
+                              lazy_sequences):
+    """Return a generator of the raw data elements in `fp`, which must have
+    a ``view`` of its entire contents.
+
+    The same as :func:`_file_element_generator`, except element headers are
+    unpacked directly from the buffer and values sliced from it, instead of
+    making two or three reads per element. Undefined length elements are
+    passed on to :func:`_file_element_generator`.
+    """
+    view = fp.view
+    # Slicing the underlying bytes or mmap copies the value in one step
+    data = view.obj
+    size = len(view)
+    endian_chr = "<" if is_little_endian else ">"
+    if is_implicit_VR:
+        header_unpack = Struct(endian_chr + "HHL").unpack_from
+    else:
+        header_unpack = Struct(endian_chr + "HH2sH").unpack_from
+        extra_length_unpack = Struct(endian_chr + "L").unpack_from
+
+    fp_seek = fp.seek
+    # Create the RawDataElement tuples directly, avoiding the slower
+    #   namedtuple constructor
+    new_raw = tuple.__new__
+    VR_names = {}
+    defer_size = size_in_bytes(defer_size)
+    tag_set = _specific_tag_set(specific_tags)
+    has_tag_set = len(tag_set) > 0
+    if has_tag_set:
+        last_tag = max(tag_set)
+
+    # The position is only synced with `fp` when handing over control
+    pos = fp.tell()
+    while True:
+        start = pos
+        if pos + 8 > size:
+            fp_seek(size)
+            return  # at end of file
+
+        if is_implicit_VR:
+            VR = None
+            group, elem, length = header_unpack(view, pos)
+            pos += 8
+        else:
+            group, elem, raw_VR, length = header_unpack(view, pos)
+            pos += 8
+            try:
+                VR = VR_names[raw_VR]
+            except KeyError:
+                VR = VR_names[raw_VR] = raw_VR.decode(default_encoding)
+            if VR in extra_length_VRs:
+                if pos + 4 > size:
+                    fp_seek(size)
+                    return
+                length = extra_length_unpack(view, pos)[0]
+                pos += 4
+
+        value_tell = pos
+        # Plain int comparisons are much faster than using BaseTag
+        tag = group << 16 | elem
+        # Rewind to the start of the element if stopping
+        if has_tag_set and tag > last_tag:
+            fp_seek(start)
+            return
+
+        if stop_when is not None and stop_when(BaseTag(tag), VR, length):
+            fp_seek(start)
+            return
+
+        if length == 0xFFFFFFFF:
+            # Undefined length values need searching for their delimiter
+            fp_seek(start)
+            elem_gen = _file_element_generator(
+                fp, is_implicit_VR, is_little_endian, stop_when, defer_size,
+                encoding, specific_tags, lazy_sequences
+            )
+            try:
+                raw = next(elem_gen)
+            except StopIteration:
+                return
+
+            yield raw
+            pos = fp.tell()
+            continue
+
+        end = pos + length
+        if end > size:
+            end = size
+        if has_tag_set and tag not in tag_set:
+            pos = end
+            continue
+
+        if (defer_size is not None and length > defer_size and
+                tag != 0x00080005):
+            value = None
+        elif length == 0:
+            value = empty_value_for_VR(VR, raw=True)
+        elif tag in _MAPPED_TAGS:
+            value = view[pos:end]
+        else:
+            value = data[pos:end]
+
+        if tag == 0x00080005:
+            from pydicom.values import convert_string
+            encoding = convert_encodings(
+                convert_string(value or b'', is_little_endian)
+            )
+
+        fp_seek(end)
+        yield new_raw(RawDataElement, (BaseTag(tag), VR, length, value,
+                                       value_tell, is_implicit_VR,
+                                       is_little_endian))
+        pos = fp.tell()
+
+
+def _file_element_generator(fp, is_implicit_VR, is_little_endian,
+                            stop_when=None, defer_size=None,
+                            encoding=default_encoding, specific_tags=None,
+                            lazy_sequences=False):
+    """Return a generator of the raw data elements read from `fp`.
+
+    See :func:`data_element_generator` for the parameters.
+    """
     # Summary of DICOM standard PS3.5-2008 chapter 7:
     # If Implicit VR, data element is:
     #    tag, 4-byte length, value.
@@ -114,16 +297,16 @@ def data_element_generator(fp,
     debugging = config.debugging
     element_struct_unpack = element_struct.unpack
     defer_size = size_in_bytes(defer_size)
+    # If memory-mapped, slice pixel data values from the mapping without
+    #   copying
+    mapped_view = (
+        fp.view if isinstance(fp, (DicomBuffer, DicomMemoryMap)) else None
+    )
 
-    tag_set = set()
-    if specific_tags is not None:
-        for tag in specific_tags:
-            if isinstance(tag, str):
-                tag = Tag(tag_for_keyword(tag))
-            if isinstance(tag, BaseTag):
-                tag_set.add(tag)
-        tag_set.add(Tag(0x08, 0x05))
+    tag_set = _specific_tag_set(specific_tags)
     has_tag_set = len(tag_set) > 0
+    if has_tag_set:
+        last_tag = max(tag_set)
 
     while True:
         # Read tag, VR, length, get ready to read value
@@ -159,6 +342,18 @@ def data_element_generator(fp,
         # Positioned to read the value, but may not want to -- check stop_when
         value_tell = fp_tell()
         tag = TupleTag((group, elem))
+        # Elements are in ascending tag order, so once past the last of the
+        #   specific tags there is nothing left to read
+        if has_tag_set and tag > last_tag:
+            if debugging:
+                logger_debug("Reading ended after the last specific tag. "
+                             "Rewinding to start of data element.")
+            rewind_length = 8
+            if not is_implicit_VR and VR in extra_length_VRs:
+                rewind_length += 4
+            fp.seek(value_tell - rewind_length)
+            return
+
         if stop_when is not None:
             # XXX VR may be None here!! Should stop_when just take tag?
             if stop_when(tag, VR, length):
@@ -188,6 +383,10 @@ def data_element_generator(fp,
                 logger_debug("Defer size exceeded. "
                              "Skipping forward to next data element.")
                 fp.seek(fp_tell() + length)
+            elif (mapped_view is not None and length > 0 and
+                    tag in _MAPPED_TAGS):
+                value = mapped_view[value_tell:value_tell + length]
+                fp.seek(value_tell + length)
             else:
                 value = (fp_read(length) if length > 0
                          else empty_value_for_VR(VR, raw=True))
@@ -230,30 +429,162 @@ def data_element_generator(fp,
                     if next_tag == ItemTag:
                         VR = 'SQ'
 
-            if VR == 'SQ':
+            is_unwanted = has_tag_set and tag not in tag_set
+            if VR == 'SQ' and (lazy_sequences or is_unwanted):
+                if debugging:
+                    msg = "{0:08x}: Skipping undefined length sequence"
+                    logger_debug(msg.format(fp_tell()))
+                skip_sequence(fp, is_implicit_VR, is_little_endian)
+                if is_unwanted:
+                    continue
+                # The sequence value without the Sequence Delimitation Item,
+                #   parsed by convert_SQ() when the element is accessed
+                end_tell = fp_tell() - 8
+                if mapped_view is not None:
+                    value = mapped_view[value_tell:end_tell]
+                else:
+                    fp.seek(value_tell)
+                    value = fp_read(end_tell - value_tell)
+                    fp.seek(end_tell + 8)
+                yield RawDataElement(tag, VR, length, value, value_tell,
+                                     is_implicit_VR, is_little_endian)
+            elif VR == 'SQ':
                 if debugging:
                     msg = "{0:08x}: Reading/parsing undefined length sequence"
                     logger_debug(msg.format(fp_tell()))
                 seq = read_sequence(fp, is_implicit_VR,
                                     is_little_endian, length, encoding)
-                if has_tag_set and tag not in tag_set:
-                    continue
                 yield DataElement(tag, VR, seq, value_tell,
                                   is_undefined_length=True)
             else:
                 delimiter = SequenceDelimiterTag
                 if debugging:
                     logger_debug("Reading undefined length data element")
-                value = read_undefined_length_value(fp, is_little_endian,
-                                                    delimiter, defer_size)
+                # don't keep the value if the tag isn't wanted
+                value = read_undefined_length_value(
+                    fp, is_little_endian, delimiter,
+                    0 if is_unwanted else defer_size
+                )
 
                 # tags with undefined length are skipped after read
-                if has_tag_set and tag not in tag_set:
+                if is_unwanted:
                     continue
                 yield RawDataElement(tag, VR, length, value, value_tell,
                                      is_implicit_VR, is_little_endian)
 
 
+def skip_sequence(fp, is_implicit_VR, is_little_endian):
+    """Skip over an undefined length sequence value without parsing it.
+
+    .. versionadded:: 2.0
+
+    Only the element headers needed to find the end of the sequence are read,
+    no :class:`~pydicom.dataset.Dataset` or
+    :class:`~pydicom.dataelem.DataElement` instances are created.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like positioned at the start of an undefined length sequence
+        value, i.e. at the first item tag or the Sequence Delimitation Item.
+        On return it will be positioned at the first byte after the
+        Sequence Delimitation Item.
+    is_implicit_VR : bool
+        ``True`` if the data is encoded as implicit VR, ``False`` otherwise.
+    is_little_endian : bool
+        ``True`` if the data is encoded as little endian, ``False`` otherwise.
+
+    Returns
+    -------
+    list of int
+        The offsets to the start of each item in the sequence.
+
+    Raises
+    ------
+    EOFError
+        If the end of the file is reached before the end of the sequence.
+    """
+    endian_chr = "<" if is_little_endian else ">"
+    item_struct = Struct(endian_chr + "HHL")
+    if is_implicit_VR:
+        element_struct = item_struct
+    else:
+        element_struct = Struct(endian_chr + "HH2sH")
+        extra_length_struct = Struct(endian_chr + "L")
+
+    def _read_header(struct):
+        bytes_read = fp.read(8)
+        if len(bytes_read) < 8:
+            raise EOFError(
+                "End of file reached before the end of the sequence "
+                "starting at position 0x{0:x}".format(sequence_tell)
+            )
+        return struct.unpack(bytes_read)
+
+    def _skip_item():
+        # Skip the elements of an undefined length item
+        while True:
+            group, elem, VR, length = _next_element()
+            tag = TupleTag((group, elem))
+            if tag == ItemDelimiterTag:
+                return
+            if length != 0xFFFFFFFF:
+                fp.seek(fp.tell() + length)
+                continue
+
+            if VR is None:
+                try:
+                    VR = dictionary_VR(tag)
+                except KeyError:
+                    # Look ahead to see if it consists of items
+                    next_tag = TupleTag(unpack(endian_chr + "HH", fp.read(4)))
+                    fp.seek(fp.tell() - 4)
+                    if next_tag == ItemTag:
+                        VR = 'SQ'
+
+            if VR == 'SQ':
+                _skip_items()
+            else:
+                read_undefined_length_value(
+                    fp, is_little_endian, SequenceDelimiterTag, defer_size=0
+                )
+
+    def _next_element():
+        if is_implicit_VR:
+            group, elem, length = _read_header(element_struct)
+            return group, elem, None, length
+
+        group, elem, VR, length = _read_header(element_struct)
+        if (group, elem) == (0xFFFE, 0xE00D):
+            # Item Delimitation Item has no VR
+            return group, elem, None, 0
+
+        VR = VR.decode(default_encoding)
+        if VR in extra_length_VRs:
+            length = extra_length_struct.unpack(fp.read(4))[0]
+
+        return group, elem, VR, length
+
+    def _skip_items():
+        # Skip the items of an undefined length sequence
+        offsets = []
+        while True:
+            item_tell = fp.tell()
+            group, elem, length = _read_header(item_struct)
+            if TupleTag((group, elem)) == SequenceDelimiterTag:
+                return offsets
+
+            offsets.append(item_tell)
+            if length != 0xFFFFFFFF:
+                fp.seek(fp.tell() + length)
+            else:
+                _skip_item()
+
+    sequence_tell = fp.tell()
+
+    return _skip_items()
+
+
 def _is_implicit_vr(fp, implicit_vr_is_assumed, is_little_endian, stop_when):
     """Check if the real VR is explicit or implicit.
 
@@ -308,7 +639,7 @@ def _is_implicit_vr(fp, implicit_vr_is_assumed, is_little_endian, stop_when):
 def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
                  stop_when=None, defer_size=None,
                  parent_encoding=default_encoding, specific_tags=None,
-                 at_top_level=True):
+                 at_top_level=True, lazy_sequences=False):
     """Return a :class:`~pydicom.dataset.Dataset` instance containing the next
     dataset in the file.
 
@@ -337,6 +668,8 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     at_top_level: bool
         If dataset is top level (not within a sequence).
         Used to turn off explicit VR heuristic within sequences
+    lazy_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
 
     Returns
     -------
@@ -357,7 +690,7 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     fp.seek(fp_start)
     de_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
                                     stop_when, defer_size, parent_encoding,
-                                    specific_tags)
+                                    specific_tags, lazy_sequences)
     try:
         while (bytelength is None) or (fp.tell() - fp_start < bytelength):
             raw_data_element = next(de_gen)
@@ -460,6 +793,99 @@ def read_sequence_item(fp, is_implicit_VR, is_little_endian, encoding,
     return ds
 
 
+def _read_indexed_dataset(fp, index, stop_when=None, defer_size=None,
+                          specific_tags=None):
+    """Return a :class:`~pydicom.dataset.Dataset` read using `index`.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like the index was created for.
+    index : dict
+        The index returned by :func:`create_index`.
+    stop_when : None, optional
+        Optional call_back function which can terminate reading. See help for
+        :func:`data_element_generator` for details
+    defer_size : int, None, optional
+        See :func:`dcmread` for parameter info.
+    specific_tags : list or None
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    dataset.Dataset
+        A Dataset instance.
+    """
+    is_implicit_VR = index['is_implicit_VR']
+    is_little_endian = index['is_little_endian']
+    tag_set = _specific_tag_set(specific_tags)
+    mapped_view = (
+        fp.view if isinstance(fp, (DicomBuffer, DicomMemoryMap)) else None
+    )
+
+    raw_data_elements = dict()
+    for key in sorted(index['elements']):
+        value_tell, length, VR = index['elements'][key]
+        tag = TupleTag((int(key[:4], 16), int(key[4:], 16)))
+        if stop_when is not None and stop_when(tag, VR, length):
+            break
+
+        if tag_set and tag not in tag_set:
+            continue
+
+        fp.seek(value_tell)
+        if length == 0xFFFFFFFF:
+            if VR == 'SQ':
+                skip_sequence(fp, is_implicit_VR, is_little_endian)
+                end_tell = fp.tell() - 8
+                fp.seek(value_tell)
+                value = fp.read(end_tell - value_tell)
+            else:
+                value = read_undefined_length_value(
+                    fp, is_little_endian, SequenceDelimiterTag, defer_size
+                )
+        elif length == 0:
+            value = empty_value_for_VR(VR, raw=True)
+        elif (defer_size is not None and length > defer_size and
+                tag != BaseTag(0x00080005)):
+            value = None
+        elif mapped_view is not None and tag in _MAPPED_TAGS:
+            value = mapped_view[value_tell:value_tell + length]
+        else:
+            value = fp.read(length)
+
+        raw_data_elements[tag] = RawDataElement(
+            tag, VR, length, value, value_tell,
+            is_implicit_VR, is_little_endian
+        )
+
+    ds = Dataset(raw_data_elements)
+    if 0x00080005 in raw_data_elements:
+        char_set = DataElement_from_raw(raw_data_elements[0x00080005]).value
+        encoding = convert_encodings(char_set)
+    else:
+        encoding = default_encoding
+    ds.set_original_encoding(is_implicit_VR, is_little_endian, encoding)
+    return ds
+
+
+def _index_matches(fp, index):
+    """Return ``True`` if `index` appears to have been created for `fp`."""
+    position = fp.tell()
+    fp.seek(0, 2)
+    size = fp.tell()
+    fp.seek(position)
+    if size != index['size']:
+        return False
+
+    filename = getattr(fp, 'name', None)
+    if (index['mtime'] is not None and isinstance(filename, str) and
+            os.path.exists(filename)):
+        return os.stat(filename).st_mtime == index['mtime']
+
+    return True
+
+
 def _read_command_set_elements(fp):
     """Return a Dataset containing any Command Set (0000,eeee) elements
     in `fp`.
@@ -631,7 +1057,8 @@ def _at_pixel_data(tag, VR, length):
 
 
 def read_partial(fileobj, stop_when=None, defer_size=None,
-                 force=False, specific_tags=None):
+                 force=False, specific_tags=None, lazy_sequences=False,
+                 index=None):
     """Parse a DICOM file until a condition is met.
 
     Parameters
@@ -646,6 +1073,10 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
         See :func:`dcmread` for parameter info.
     specific_tags : list or None
         See :func:`dcmread` for parameter info.
+    lazy_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
+    index : dict or None, optional
+        See :func:`dcmread` for parameter info.
 
     Notes
     -----
@@ -671,6 +1102,13 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
 
     # Read Dataset
 
+    if index is not None and not _index_matches(fileobj, index):
+        warnings.warn(
+            "The file has changed since the index was created, ignoring "
+            "the index"
+        )
+        index = None
+
     # Read any Command Set group (0000,eeee) elements (if present)
     command_set = _read_command_set_elements(fileobj)
 
@@ -723,12 +1161,19 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
         #     then "deflate" compression applied.
         #  All that is needed here is to decompress and then
         #     use as normal in a file-like object
-        zipped = fileobj.read()
-        # -MAX_WBITS part is from comp.lang.python answer:
-        # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
-        unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
-        fileobj = BytesIO(unzipped)  # a file-like object
+        if defer_size is None and not lazy_sequences:
+            # Nothing needs to be re-read later, so inflate on demand and
+            #   only as much as is needed
+            fileobj = DicomInflateReader(fileobj)
+        else:
+            zipped = fileobj.read()
+            # -MAX_WBITS part is from comp.lang.python answer:
+            # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
+            unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
+            fileobj = BytesIO(unzipped)  # a file-like object
         is_implicit_VR = False
+        # Offsets in the index are to the deflated data
+        index = None
     else:
         # Any other syntax should be Explicit VR Little Endian,
         #   e.g. all Encapsulated (JPEG etc) are ExplVR-LE
@@ -739,9 +1184,16 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
     try:
-        dataset = read_dataset(fileobj, is_implicit_VR, is_little_endian,
-                               stop_when=stop_when, defer_size=defer_size,
-                               specific_tags=specific_tags)
+        if index is not None:
+            # Skip parsing and read the indexed elements directly
+            dataset = _read_indexed_dataset(
+                fileobj, index, stop_when, defer_size, specific_tags
+            )
+        else:
+            dataset = read_dataset(fileobj, is_implicit_VR, is_little_endian,
+                                   stop_when=stop_when, defer_size=defer_size,
+                                   specific_tags=specific_tags,
+                                   lazy_sequences=lazy_sequences)
     except EOFError:
         if config.enforce_valid_values:
             raise
@@ -763,8 +1215,21 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
     return new_dataset
 
 
+def _is_seekable(fp):
+    """Return ``True`` if the file-like `fp` supports random access."""
+    seekable = getattr(fp, 'seekable', None)
+    if seekable is not None:
+        try:
+            return seekable()
+        except Exception:
+            return False
+
+    return hasattr(fp, 'seek') and hasattr(fp, 'tell')
+
+
 def dcmread(fp, defer_size=None, stop_before_pixels=False,
-            force=False, specific_tags=None):
+            force=False, specific_tags=None, mmap=False,
+            lazy_sequences=False, index=None):
     """Read and parse a DICOM dataset stored in the DICOM File Format.
 
     Read a DICOM dataset stored in accordance with the :dcm:`DICOM File
@@ -776,9 +1241,28 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
 
     Parameters
     ----------
-    fp : str or PathLike or file-like
-        Either a file-like object, or a string containing the file name. If a
-        file-like object, the caller is responsible for closing it.
+    fp : str or PathLike or file-like or bytes
+        Either a file-like object, a string containing the file name or the
+        encoded file as :class:`bytes`, :class:`bytearray` or
+        :class:`memoryview`. If a file-like object, the caller is responsible
+        for closing it.
+
+        .. versionchanged:: 2.0
+
+            Non-seekable streams, such as sockets and pipes, are read
+            forward-only using a :class:`~pydicom.filebase.DicomStreamReader`.
+            Deferred reads, and `lazy_sequences` or `index` with large
+            values, are not available for streams.
+
+        .. versionchanged:: 2.0
+
+            Added support for :class:`bytes`, :class:`bytearray` and
+            :class:`memoryview`, which are parsed in place using a
+            :class:`~pydicom.filebase.DicomBuffer`, with the values of the
+            pixel data elements such as *Pixel Data* being
+            :class:`memoryview` slices of the buffer. All other values are
+            :class:`bytes`, the same as when reading from a file-like. This
+            is usually faster than reading small files from a file-like.
     defer_size : int or str or None, optional
         If ``None`` (default), all elements are read into memory. If specified,
         then if a data element's stored value is larger than `defer_size`, the
@@ -797,7 +1281,42 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
         If not ``None``, only the tags in the list are returned. The list
         elements can be tags or tag names. Note that the element (0008,0005)
         *Specific Character Set* is always returned if present - this ensures
-        correct decoding of returned text values.
+        correct decoding of returned text values. Reading stops once the
+        largest of the tags has been passed and any undefined length
+        sequences that aren't required are skipped without being parsed.
+
+        .. versionchanged:: 2.0
+
+            Stop reading after the largest tag and skip unwanted sequences.
+    mmap : bool, optional
+        If ``True`` then memory-map the file instead of reading it, and use
+        read-only :class:`memoryview` slices of the mapping as the values of
+        the (7FE0,0008) *Float Pixel Data*, (7FE0,0009) *Double Float Pixel
+        Data* and (7FE0,0010) *Pixel Data* elements, so they are not copied
+        into memory. All other values are :class:`bytes` as usual. `fp` must
+        be a file name or a file object that supports ``fileno()``, and
+        reading starts from the current position of a file object. Copying
+        or pickling the dataset copies the mapped values to :class:`bytes`.
+        Default ``False``.
+
+        .. versionadded:: 2.0
+    lazy_sequences : bool, optional
+        If ``False`` (default), all sequences are parsed when the file is
+        read. If ``True`` then undefined length sequences are only skipped
+        over and their encoded values kept, with the
+        :class:`~pydicom.sequence.Sequence` and its items created the first
+        time the element is accessed, the same as for defined length
+        sequences.
+
+        .. versionadded:: 2.0
+    index : dict or None, optional
+        An index of the file as returned by :func:`create_index` or
+        :func:`load_index`. If used then the dataset's elements are read
+        directly from the offsets in the index rather than parsed from the
+        file. If the file no longer matches the index then a warning is
+        issued and the index ignored.
+
+        .. versionadded:: 2.0
 
     Returns
     -------
@@ -833,6 +1352,13 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
 
     >>> with pydicom.dcmread("rtplan.dcm") as ds:
     >>>     ds.PatientName
+
+    Memory-map a large file and get a read-only array over the mapped
+    *Pixel Data*:
+
+    >>> from pydicom.pixel_data_handlers import numpy_handler
+    >>> ds = pydicom.dcmread("CT_small.dcm", mmap=True)
+    >>> arr = numpy_handler.get_pixeldata(ds, read_only=True)
     """
     # Open file if not already a file object
     caller_owns_file = True
@@ -844,15 +1370,25 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
             logger.debug(u"Reading file '{0}'".format(fp))
         except Exception:
             logger.debug("Reading file '{0}'".format(fp))
-        fp = open(fp, 'rb')
+        fp = DicomMemoryMap(fp) if mmap else open(fp, 'rb')
+    elif isinstance(fp, (bytes, bytearray, memoryview)):
+        fp = DicomBuffer(fp)
+    elif mmap:
+        # the mapping is independent of the caller's file object
+        fp = DicomMemoryMap(fp)
+    elif not _is_seekable(fp):
+        fp = DicomStreamReader(fp)
 
     if config.debugging:
         logger.debug("\n" + "-" * 80)
         logger.debug("Call to dcmread()")
         msg = ("filename:'%s', defer_size='%s', "
-               "stop_before_pixels=%s, force=%s, specific_tags=%s")
-        logger.debug(msg % (fp.name, defer_size, stop_before_pixels,
-                            force, specific_tags))
+               "stop_before_pixels=%s, force=%s, specific_tags=%s, "
+               "mmap=%s, lazy_sequences=%s, index=%s")
+        logger.debug(msg % (getattr(fp, 'name', '<no filename>'),
+                            defer_size, stop_before_pixels,
+                            force, specific_tags, mmap, lazy_sequences,
+                            index is not None))
         if caller_owns_file:
             logger.debug("Caller passed file object")
         else:
@@ -868,7 +1404,8 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
         stop_when = _at_pixel_data
     try:
         dataset = read_partial(fp, stop_when, defer_size=defer_size,
-                               force=force, specific_tags=specific_tags)
+                               force=force, specific_tags=specific_tags,
+                               lazy_sequences=lazy_sequences, index=index)
     finally:
         if not caller_owns_file:
             fp.close()
@@ -879,6 +1416,162 @@ def dcmread(fp, defer_size=None, stop_before_pixels=False,
 read_file = dcmread  # used read_file until pydicom 1.0. Kept for compatibility
 
 
+def _dcmread_batch(paths, kwargs, raw_values):
+    """Return a list of ``(path, result)`` for each path in `paths`.
+
+    Used by :func:`dcmread_many` to read a batch of files in a worker.
+    """
+    results = []
+    for path in paths:
+        try:
+            ds = dcmread(path, **kwargs)
+            results.append((path, dict(ds._dict) if raw_values else ds))
+        except Exception as exc:
+            results.append((path, exc))
+
+    return results
+
+
+def dcmread_many(paths, specific_tags=None, workers=None, executor='process',
+                 batch_size=16, raw_values=False, defer_size=None,
+                 stop_before_pixels=False, force=False):
+    """Read DICOM files concurrently, returning a generator of the results
+    in order.
+
+    .. versionadded:: 2.0
+
+    The files are split into batches of `batch_size` files, and each batch
+    is read in a single call to a worker, reducing the overhead of passing
+    the work and results between processes. Only a limited number of
+    batches are in progress at any time, so `paths` may be a large (or
+    lazily evaluated) iterable.
+
+    Parameters
+    ----------
+    paths : iterable of str or PathLike
+        The paths to the files to read.
+    specific_tags : list or None, optional
+        See :func:`dcmread` for parameter info.
+    workers : int or None, optional
+        The maximum number of workers to use. If ``None`` (default) then use
+        the default for the executor. Ignored if `executor` is an
+        :class:`~concurrent.futures.Executor` instance.
+    executor : str or concurrent.futures.Executor, optional
+        ``'process'`` (default) to read using a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, ``'thread'`` to use
+        a :class:`~concurrent.futures.ThreadPoolExecutor`, or an existing
+        :class:`~concurrent.futures.Executor` instance to use (which will
+        not be shut down afterwards).
+    batch_size : int, optional
+        The number of files to read per batch, default ``16``.
+    raw_values : bool, optional
+        If ``False`` (default) then yield the
+        :class:`~pydicom.dataset.FileDataset` for each file. If ``True``
+        then yield only a :class:`dict` containing the dataset's top-level
+        elements, as :class:`~pydicom.dataelem.RawDataElement` (or
+        :class:`~pydicom.dataelem.DataElement` for any elements that had to
+        be converted during reading, such as (0008,0005) *Specific Character
+        Set*), which are much cheaper to pass between processes.
+    defer_size : int or str or None, optional
+        See :func:`dcmread` for parameter info.
+    stop_before_pixels : bool, optional
+        See :func:`dcmread` for parameter info.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    generator of tuple
+        Yields a ``(path, result)`` tuple for each path in `paths`, in the
+        same order as `paths`. If the file was read successfully then
+        `result` is the :class:`~pydicom.dataset.FileDataset` or
+        :class:`dict` of raw elements, otherwise it's the exception raised
+        while reading the file. The files aren't read until iteration
+        starts.
+
+    Raises
+    ------
+    ValueError
+        If `executor` or `batch_size` is not valid.
+
+    Examples
+    --------
+    Read the patient IDs from a list of files using 4 processes:
+
+    >>> results = dcmread_many(paths, specific_tags=['PatientID'], workers=4)
+    >>> for path, ds in results:
+    ...     if isinstance(ds, Exception):
+    ...         print("Unable to read {}: {}".format(path, ds))
+    ...     else:
+    ...         print(ds.PatientID)
+    """
+    # Validate here rather than in the generator so invalid options raise
+    #   when called instead of on the first iteration
+    if batch_size < 1:
+        raise ValueError("'batch_size' must be at least 1")
+
+    if (not isinstance(executor, Executor)
+            and executor not in ('process', 'thread')):
+        raise ValueError(
+            "Invalid 'executor' value '{}', must be 'process', 'thread' or "
+            "an Executor instance".format(executor)
+        )
+
+    kwargs = {
+        'defer_size': defer_size,
+        'stop_before_pixels': stop_before_pixels,
+        'force': force,
+        'specific_tags': specific_tags,
+    }
+
+    return _dcmread_many(
+        paths, kwargs, workers, executor, batch_size, raw_values
+    )
+
+
+def _dcmread_many(paths, kwargs, workers, executor, batch_size, raw_values):
+    """Yield the results for :func:`dcmread_many`, which has already
+    validated the options.
+
+    The executor is only created once iteration starts, so it's always
+    shut down afterwards.
+    """
+    owns_executor = True
+    if isinstance(executor, Executor):
+        owns_executor = False
+        pool = executor
+    elif executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    # Keep enough batches in progress to keep all the workers busy
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    paths = iter(paths)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_pending:
+                batch = [path_from_pathlike(p) for p in
+                         islice(paths, batch_size)]
+                if not batch:
+                    break
+                pending.append(
+                    pool.submit(_dcmread_batch, batch, kwargs, raw_values)
+                )
+
+            if not pending:
+                return
+
+            for result in pending.popleft().result():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            pool.shutdown()
+
+
 def read_dicomdir(filename="DICOMDIR"):
     """Read a DICOMDIR file and return a :class:`~pydicom.dicomdir.DicomDir`.
 
@@ -910,6 +1603,362 @@ def read_dicomdir(filename="DICOMDIR"):
     return ds
 
 
+def create_index(fp, force=False):
+    """Return an index of the offsets to the values of the elements in `fp`.
+
+    .. versionadded:: 2.0
+
+    The index can be passed to :func:`dcmread` to read the dataset without
+    parsing the file, and saved alongside the file with :func:`save_index`.
+
+    Parameters
+    ----------
+    fp : str or PathLike or file-like
+        Either a file-like object, or a string containing the file name. If a
+        file-like object, the caller is responsible for closing it.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    dict
+        A JSON serializable :class:`dict` containing:
+
+        * ``'size'``: the size of the file in bytes
+        * ``'mtime'``: the file modification time, or ``None`` if `fp` is not
+          a file on disk
+        * ``'is_implicit_VR'`` and ``'is_little_endian'``: the encoding of
+          the dataset
+        * ``'elements'``: a :class:`dict` of the top-level dataset elements,
+          with the tags as 8 character hex strings and the values
+          as ``[value_tell, length, VR]``. The VR is ``None`` if the dataset
+          uses implicit VR.
+
+    Raises
+    ------
+    ValueError
+        If the dataset uses the *Deflated Explicit VR Little Endian* transfer
+        syntax.
+    """
+    caller_owns_file = True
+    fp = path_from_pathlike(fp)
+    if isinstance(fp, str):
+        caller_owns_file = False
+        fp = open(fp, 'rb')
+
+    headers = {}
+
+    def _record_header(tag, VR, length):
+        """Record the value offset, length and VR of each element."""
+        headers[tag] = [fp.tell(), length, VR]
+        return False
+
+    try:
+        # defer_size=0 avoids reading anything but the element headers
+        ds = read_partial(fp, _record_header, defer_size=0, force=force,
+                          lazy_sequences=True)
+        transfer_syntax = ds.file_meta.get('TransferSyntaxUID')
+        if transfer_syntax == pydicom.uid.DeflatedExplicitVRLittleEndian:
+            raise ValueError(
+                "Indexing datasets with the Deflated Explicit VR Little "
+                "Endian transfer syntax is not supported"
+            )
+
+        elements = {}
+        is_implicit_VR = ds.is_implicit_VR
+        is_little_endian = ds.is_little_endian
+        for tag, elem in ds._dict.items():
+            if tag.group == 0x0000:
+                # Command Set elements are always parsed
+                continue
+
+            value_tell, length, VR = headers[tag]
+            if elem.is_raw:
+                # The VR of undefined length sequences may have been found
+                #   after the header was read
+                VR = elem.VR
+                is_implicit_VR = elem.is_implicit_VR
+                is_little_endian = elem.is_little_endian
+
+            elements['{:08X}'.format(tag)] = [value_tell, length, VR]
+
+        mtime = None
+        if caller_owns_file:
+            fp.seek(0, 2)
+            size = fp.tell()
+        else:
+            statinfo = os.stat(fp.name)
+            size = statinfo.st_size
+            mtime = statinfo.st_mtime
+    finally:
+        if not caller_owns_file:
+            fp.close()
+
+    return {
+        'size': size,
+        'mtime': mtime,
+        'is_implicit_VR': is_implicit_VR,
+        'is_little_endian': is_little_endian,
+        'elements': elements,
+    }
+
+
+def save_index(index, filename):
+    """Write the `index` returned by :func:`create_index` to a JSON file.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    index : dict
+        The index to save.
+    filename : str or PathLike
+        The path to the file to write the index to, such as the path to the
+        indexed file with ``'.idx'`` appended.
+    """
+    with open(path_from_pathlike(filename), 'w') as f:
+        json.dump(index, f)
+
+
+def load_index(filename):
+    """Return an index saved by :func:`save_index`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        The path to the index file.
+
+    Returns
+    -------
+    dict
+        The index, suitable for passing to :func:`dcmread`.
+    """
+    with open(path_from_pathlike(filename), 'r') as f:
+        return json.load(f)
+
+
+# struct format characters for binary numeric VRs, used by read_columns()
+_COLUMN_NUMBER_FORMATS = {
+    'FD': 'd', 'FL': 'f', 'SL': 'l', 'SS': 'h', 'SV': 'q', 'UL': 'L',
+    'US': 'H', 'UV': 'Q'
+}
+# Text VRs that have a single value, used by read_columns()
+_COLUMN_SINGLE_TEXT_VRS = ('LT', 'ST', 'UR', 'UT')
+# VRs that can't be used with read_columns()
+_COLUMN_UNSUPPORTED_VRS = (
+    'AT', 'OB', 'OD', 'OF', 'OL', 'OV', 'OW', 'SQ', 'UN'
+)
+
+
+def _column_values(VR, value, is_little_endian, encodings):
+    """Return a :class:`tuple` of the values in the raw element `value`,
+    converted to :class:`float` or :class:`str` as appropriate for `VR`.
+    """
+    if VR in _COLUMN_NUMBER_FORMATS:
+        fmt = _COLUMN_NUMBER_FORMATS[VR]
+        size = Struct(fmt).size
+        nr_values = len(value) // size
+        endian_chr = "<" if is_little_endian else ">"
+        values = unpack(endian_chr + fmt * nr_values,
+                        value[:nr_values * size])
+        return tuple(float(v) for v in values)
+
+    if VR in ('DS', 'IS'):
+        values = []
+        for v in value.decode(default_encoding).split('\\'):
+            try:
+                values.append(float(v))
+            except ValueError:
+                values.append(float('nan'))
+        return tuple(values)
+
+    delimiters = PN_DELIMS if VR == 'PN' else TEXT_VR_DELIMS
+    value = decode_string(value, encodings, delimiters).rstrip(' \x00')
+    if VR in _COLUMN_SINGLE_TEXT_VRS:
+        return (value, )
+
+    return tuple(v.strip(' \x00') for v in value.split('\\'))
+
+
+def _read_column_elements(fp, tags, force):
+    """Return a :class:`dict` of the raw element values in `fp` for `tags`.
+
+    Used by :func:`read_columns`, no :class:`~pydicom.dataset.Dataset` is
+    created.
+
+    Returns
+    -------
+    dict, bool, list of str
+        The raw element values as ``{tag: (VR, value)}``, whether the values
+        are little endian and the encodings for text values.
+    """
+    read_preamble(fp, force)
+    transfer_syntax = None
+    file_meta_gen = data_element_generator(
+        fp, False, True, stop_when=lambda tag, VR, length: tag.group != 2
+    )
+    for raw in file_meta_gen:
+        if raw.tag == 0x00020010:
+            transfer_syntax = raw.value.decode(default_encoding)
+            transfer_syntax = transfer_syntax.rstrip(' \x00')
+
+    is_implicit_VR = transfer_syntax in (
+        None, pydicom.uid.ImplicitVRLittleEndian
+    )
+    is_little_endian = transfer_syntax != pydicom.uid.ExplicitVRBigEndian
+    if transfer_syntax == pydicom.uid.DeflatedExplicitVRLittleEndian:
+        fp = DicomInflateReader(fp)
+
+    position = fp.tell()
+    is_implicit_VR = _is_implicit_vr(fp, is_implicit_VR, is_little_endian,
+                                     None)
+    fp.seek(position)
+
+    encodings = [default_encoding]
+    values = {}
+    elem_gen = data_element_generator(
+        fp, is_implicit_VR, is_little_endian, specific_tags=tags
+    )
+    for raw in elem_gen:
+        if raw.tag == 0x00080005 and raw.value:
+            encodings = convert_encodings(
+                [v.strip() for v in raw.value.decode().split('\\')]
+            )
+        values[raw.tag] = (raw.VR, raw.value)
+
+    return values, is_little_endian, encodings
+
+
+def read_columns(paths, keywords, structured=False, force=False):
+    """Return the values of elements in multiple files as columns.
+
+    .. versionadded:: 2.0
+
+    The element values are converted directly from the encoded values in
+    each file, without creating a :class:`~pydicom.dataset.Dataset` or
+    :class:`~pydicom.dataelem.DataElement` per file, and reading of each
+    file stops once the last of the elements has been read.
+
+    Each column is a :class:`numpy.ndarray` with one row per file in
+    `paths`:
+
+    * Elements with a VR of **DS**, **IS**, **FD**, **FL**, **SL**, **SS**,
+      **SV**, **UL**, **US** or **UV** and a VM of ``1`` use a
+      :class:`~numpy.float64` column, with ``NaN`` for missing values. If the
+      VM is fixed and greater than ``1``, such as for *Image Position
+      (Patient)*, then the column has shape (number of files, VM).
+    * Text elements with a VM of ``1`` use a :class:`str` column, with
+      ``''`` for missing values.
+    * Text elements with other VMs and numeric elements with variable VM use
+      an ``object`` column containing a :class:`tuple` of values, with an
+      empty :class:`tuple` for missing values.
+
+    Parameters
+    ----------
+    paths : iterable of str or PathLike
+        The paths to the files to read.
+    keywords : list of str
+        The element keywords to read, such as ``'SOPInstanceUID'`` or
+        ``'ImagePositionPatient'``. Only top-level elements can be read.
+    structured : bool, optional
+        If ``False`` (default) return a :class:`dict` of the columns,
+        otherwise return a :class:`numpy.ndarray` with a structured data type
+        with each keyword as a field.
+    force : bool, optional
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    dict or numpy.ndarray
+        The columns as ``{keyword: numpy.ndarray}``, or as a structured
+        :class:`numpy.ndarray` if `structured` is ``True``.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not available.
+    ValueError
+        If a keyword is unknown or its element can't be read into a column,
+        such as an element with a VR of **SQ** or **OB**.
+
+    Examples
+    --------
+
+    >>> columns = read_columns(
+    ...     paths, ['SOPInstanceUID', 'InstanceNumber', 'SliceThickness']
+    ... )
+    >>> columns['InstanceNumber']
+    array([1., 2., 3.])
+    """
+    if not config.have_numpy:
+        raise ImportError("read_columns() requires NumPy")
+
+    specs = []
+    for keyword in keywords:
+        tag = tag_for_keyword(keyword)
+        if tag is None:
+            raise ValueError("Unknown keyword '{}'".format(keyword))
+
+        tag = Tag(tag)
+        VR = dictionary_VR(tag)
+        VM = dictionary_VM(tag)
+        if VR in _COLUMN_UNSUPPORTED_VRS or ' or ' in VR:
+            raise ValueError(
+                "The element for '{}' has a VR of '{}' which can't be "
+                "read into a column".format(keyword, VR)
+            )
+
+        is_number = VR in _COLUMN_NUMBER_FORMATS or VR in ('DS', 'IS')
+        VM = int(VM) if VM.isdigit() else None
+        specs.append((keyword, tag, VR, VM, is_number))
+
+    tags = [spec[1] for spec in specs]
+    rows = []
+    for path in paths:
+        with open(path_from_pathlike(path), 'rb') as fp:
+            rows.append(_read_column_elements(fp, tags, force))
+
+    columns = {}
+    for keyword, tag, VR, VM, is_number in specs:
+        column = []
+        for values, is_little_endian, encodings in rows:
+            if tag in values and values[tag][1]:
+                column.append(
+                    _column_values(VR, values[tag][1], is_little_endian,
+                                   encodings)
+                )
+            else:
+                column.append(())
+
+        if is_number and VM is not None:
+            arr = numpy.full((len(column), VM), numpy.nan)
+            for ii, value in enumerate(column):
+                arr[ii, :len(value[:VM])] = value[:VM]
+            columns[keyword] = arr[:, 0] if VM == 1 else arr
+        elif not is_number and VM == 1:
+            columns[keyword] = numpy.array(
+                [value[0] if value else '' for value in column], dtype=str
+            )
+        else:
+            arr = numpy.empty(len(column), dtype=object)
+            arr[:] = column
+            columns[keyword] = arr
+
+    if not structured:
+        return columns
+
+    dtype = [
+        (kw, columns[kw].dtype, columns[kw].shape[1:]) for kw in keywords
+    ]
+    arr = numpy.zeros(len(rows), dtype=dtype)
+    for kw in keywords:
+        arr[kw] = columns[kw]
+
+    return arr
+
+
 def data_element_offset_to_value(is_implicit_VR, VR):
     """Return number of bytes from start of data element to start of value"""
     if is_implicit_VR:
@@ -922,6 +1971,195 @@ def data_element_offset_to_value(is_implicit_VR, VR):
     return offset
 
 
+class _DeferredHandle:
+    """A file handle kept open for deferred reads.
+
+    Reads using the handle must hold :attr:`lock`, the other attributes
+    are guarded by ``_deferred_handles_lock``.
+    """
+    def __init__(self, fp, mtime):
+        self.fp = fp
+        # The modification time of the file when it was opened
+        self.mtime = mtime
+        self.lock = threading.Lock()
+        # The number of deferred reads currently using the handle
+        self.users = 0
+        # False once the handle has been removed from the pool, it's then
+        #   closed by the last user
+        self.pooled = True
+
+    def discard(self):
+        """Remove the handle from use, closing it if it's not being used.
+        Must be called with ``_deferred_handles_lock`` held.
+        """
+        self.pooled = False
+        if not self.users:
+            self.fp.close()
+
+
+# Open file handles used for deferred reads, keyed by (fileobj_type, filename)
+#   with values of _DeferredHandle, most recently used last
+_deferred_handles = OrderedDict()
+_deferred_handles_lock = threading.Lock()
+
+
+def close_deferred_handles():
+    """Close all the file handles kept open for deferred reads.
+
+    .. versionadded:: 2.0
+
+    The handles are reopened as needed by the next deferred read, see
+    :attr:`~pydicom.config.deferred_read_handles`. Handles in use by a
+    deferred read in another thread are closed once that read finishes.
+
+    As a file is only checked when its handle is opened, this should also
+    be used if the files are modified or replaced while their handles are
+    open.
+    """
+    with _deferred_handles_lock:
+        while _deferred_handles:
+            _, handle = _deferred_handles.popitem(last=False)
+            handle.discard()
+
+
+atexit.register(close_deferred_handles)
+
+
+def _acquire_deferred_handle(fileobj_type, filename):
+    """Return a :class:`_DeferredHandle` for `filename` from the handle pool.
+
+    The file is only checked with :func:`os.stat` when a new handle is
+    opened, so reusing a pooled handle doesn't need any system calls. The
+    handle must be returned with :func:`_release_deferred_handle`.
+
+    Raises
+    ------
+    IOError
+        If a new handle is needed and `filename` doesn't exist.
+    """
+    key = (fileobj_type, filename)
+    with _deferred_handles_lock:
+        handle = _deferred_handles.pop(key, None)
+        if handle is None:
+            try:
+                statinfo = os.stat(filename)
+            except OSError:
+                raise IOError(u"Deferred read -- original file "
+                              "{0:s} is missing".format(filename))
+
+            handle = _DeferredHandle(
+                fileobj_type(filename, 'rb'), statinfo.st_mtime
+            )
+
+        handle.users += 1
+        _deferred_handles[key] = handle
+        # If the pool is disabled the new handle is evicted straight away
+        #   and closed on release
+        while len(_deferred_handles) > max(config.deferred_read_handles, 0):
+            _, old_handle = _deferred_handles.popitem(last=False)
+            old_handle.discard()
+
+    return handle
+
+
+def _release_deferred_handle(handle):
+    """Release a handle returned by :func:`_acquire_deferred_handle`."""
+    with _deferred_handles_lock:
+        handle.users -= 1
+        if not handle.pooled and not handle.users:
+            handle.fp.close()
+
+
+@contextmanager
+def _deferred_file(fileobj_type, filename_or_obj, timestamp):
+    """Context manager returning the open file-like for a deferred read.
+
+    Files opened by filename use a pooled handle, which is locked for the
+    duration of the read, file-likes are closed afterwards. The modification
+    time of a file is checked against `timestamp` using the time when its
+    handle was opened.
+    """
+    # If it wasn't read from a file, then return an error
+    if filename_or_obj is None:
+        raise IOError("Deferred read -- original filename not stored. "
+                      "Cannot re-open")
+    is_filename = isinstance(filename_or_obj, str)
+
+    if is_filename:
+        # Only the handle itself is locked while reading so deferred reads
+        #   from different files can run concurrently
+        handle = _acquire_deferred_handle(fileobj_type, filename_or_obj)
+        try:
+            # Check that the file is the same as when originally read
+            if timestamp is not None and handle.mtime != timestamp:
+                warnings.warn("Deferred read warning -- file modification "
+                              "time has changed.")
+
+            with handle.lock:
+                yield handle.fp
+        finally:
+            _release_deferred_handle(handle)
+
+        return
+
+    if timestamp is not None:
+        if os.stat(filename_or_obj).st_mtime != timestamp:
+            warnings.warn("Deferred read warning -- file modification time "
+                          "has changed.")
+
+    try:
+        yield filename_or_obj
+    finally:
+        filename_or_obj.close()
+
+
+def read_deferred_bytes(fileobj_type, filename_or_obj, timestamp,
+                        raw_data_elem, offset, length):
+    """Read part of a previously deferred value from the file.
+
+    .. versionadded:: 2.0
+
+    Used to read a single frame of a deferred (7FE0,0010) *Pixel Data*
+    without reading the entire value.
+
+    Parameters
+    ----------
+    fileobj_type : type
+        The type of the original file object.
+    filename_or_obj : str or file-like
+        The filename of the original file if one exists, or the file-like
+        object where the data element persists.
+    timestamp : time or None
+        The time the original file has been read, if not a file-like.
+    raw_data_elem : dataelem.RawDataElement
+        The raw data element with no value set.
+    offset : int
+        The offset from the start of the value to the first byte to read.
+    length : int
+        The number of bytes to read, fewer bytes are returned if the end of
+        the value or file is reached first.
+
+    Returns
+    -------
+    bytes
+        The read bytes.
+
+    Raises
+    ------
+    IOError
+        If `filename_or_obj` is ``None``.
+    IOError
+        If `filename_or_obj` is a filename and the corresponding file does
+        not exist.
+    """
+    if raw_data_elem.length != 0xFFFFFFFF:
+        length = max(min(length, raw_data_elem.length - offset), 0)
+
+    with _deferred_file(fileobj_type, filename_or_obj, timestamp) as fp:
+        fp.seek(raw_data_elem.value_tell + offset)
+        return fp.read(length)
+
+
 def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
                                raw_data_elem):
     """Read the previously deferred value from the file into memory
@@ -932,6 +2170,12 @@ def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
         This is called internally by pydicom and will normally not be
         needed in user code.
 
+    .. versionchanged:: 2.0
+
+        Files opened by filename are kept open in a pool of handles shared
+        between deferred reads, see
+        :attr:`~pydicom.config.deferred_read_handles`.
+
     Parameters
     ----------
     fileobj_type : type
@@ -960,35 +2204,18 @@ def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
         If the VR or tag of `raw_data_elem` does not match the read value.
     """
     logger.debug("Reading deferred element %r" % str(raw_data_elem.tag))
-    # If it wasn't read from a file, then return an error
-    if filename_or_obj is None:
-        raise IOError("Deferred read -- original filename not stored. "
-                      "Cannot re-open")
-    is_filename = isinstance(filename_or_obj, str)
-
-    # Check that the file is the same as when originally read
-    if is_filename and not os.path.exists(filename_or_obj):
-        raise IOError(u"Deferred read -- original file "
-                      "{0:s} is missing".format(filename_or_obj))
-    if timestamp is not None:
-        statinfo = os.stat(filename_or_obj)
-        if statinfo.st_mtime != timestamp:
-            warnings.warn("Deferred read warning -- file modification time "
-                          "has changed.")
-
-    # Open the file, position to the right place
-    fp = (fileobj_type(filename_or_obj, 'rb')
-          if is_filename else filename_or_obj)
     is_implicit_VR = raw_data_elem.is_implicit_VR
     is_little_endian = raw_data_elem.is_little_endian
     offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
-    fp.seek(raw_data_elem.value_tell - offset)
-    elem_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
-                                      defer_size=None)
 
-    # Read the data element and check matches what was stored before
-    data_elem = next(elem_gen)
-    fp.close()
+    with _deferred_file(fileobj_type, filename_or_obj, timestamp) as fp:
+        # Position to the right place and read the data element
+        fp.seek(raw_data_elem.value_tell - offset)
+        elem_gen = data_element_generator(
+            fp, is_implicit_VR, is_little_endian, defer_size=None
+        )
+        data_elem = next(elem_gen)
+
     if data_elem.VR != raw_data_elem.VR:
         raise ValueError("Deferred read VR {0:s} does not match "
                          "original {1:s}".format(data_elem.VR,
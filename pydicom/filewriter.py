@@ -542,9 +542,7 @@ def write_dataset(fp, dataset, parent_encoding=default_encoding):
 
     fpStart = fp.tell()
     # data_elements must be written in tag order
-    tags = sorted(dataset.keys())
-
-    for tag in tags:
+    for tag in dataset._iter_tags():
         # do not write retired Group Length (see PS3.5, 7.2)
         if tag.element == 0 and tag.group > 6:
             continue
@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Miscellaneous helper functions"""
 
+import sys
+
 
 _size_factors = dict(KB=1024, MB=1024 * 1024, GB=1024 * 1024 * 1024)
 
@@ -45,3 +47,46 @@ def is_dicom(file_path):
         fp.read(0x80)  # preamble
         magic = fp.read(4)
     return magic == b"DICM"
+
+
+def _lazy_property(name, load):
+    """Return a property for the module attribute `name` that calls `load`
+    before returning the attribute's value.
+    """
+    def fget(module):
+        load()
+        return module.__dict__[name]
+
+    def fset(module, value):
+        module.__dict__[name] = value
+
+    return property(fget, fset)
+
+
+def lazy_attributes(module_name, loaders):
+    """Load the data for module attributes when they're first accessed.
+
+    .. versionadded:: 2.0
+
+    Intended for large module-level containers that start empty and are
+    filled in place the first time they're needed. Code inside the module
+    loads the data before using it, while accessing the attributes from
+    outside the module, such as ``from module import name``, calls the
+    attribute's load function first.
+
+    Parameters
+    ----------
+    module_name : str
+        The ``__name__`` of the module.
+    loaders : dict
+        A :class:`dict` of ``{attribute name: load function}``, where each
+        function takes no arguments and loads the data if it hasn't already
+        been loaded.
+    """
+    module = sys.modules[module_name]
+    namespace = {
+        name: _lazy_property(name, load) for name, load in loaders.items()
+    }
+    # Module __class__ assignment works with Python 3.5+, unlike a module
+    #   __getattr__ which needs Python 3.7
+    module.__class__ = type('LazyModule', (type(module), ), namespace)
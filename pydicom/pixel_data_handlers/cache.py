@@ -0,0 +1,190 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""A process-wide cache for decoded pixel data with a memory budget.
+
+.. versionadded:: 2.0
+
+When :attr:`~pydicom.config.pixel_cache_size` is set, the arrays returned by
+:attr:`Dataset.pixel_array<pydicom.dataset.Dataset.pixel_array>` and
+:meth:`Dataset.get_frame()<pydicom.dataset.Dataset.get_frame>` are kept in a
+single cache shared by all datasets rather than being stored with each
+dataset. The least recently used arrays are evicted when the total size of
+the cached arrays exceeds the budget, and the arrays for a dataset are
+evicted when the dataset is garbage collected.
+"""
+
+from collections import OrderedDict, namedtuple
+import threading
+import weakref
+
+import pydicom.config
+from pydicom.pixel_data_handlers.util import get_image_pixel_ids
+
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'count', 'nbytes', 'maxbytes']
+)
+CacheInfo.__doc__ = """The statistics returned by :func:`cache_info`.
+
+Attributes
+----------
+hits : int
+    The number of lookups that returned a cached array.
+misses : int
+    The number of lookups that didn't.
+evictions : int
+    The number of arrays evicted to keep within the budget.
+count : int
+    The number of cached arrays.
+nbytes : int
+    The total size of the cached arrays, in bytes.
+maxbytes : int or None
+    The current value of :attr:`~pydicom.config.pixel_cache_size`.
+"""
+
+
+class _DatasetRef(weakref.ref):
+    """A weak reference to a dataset with cached arrays, along with the keys
+    of its entries so they can be evicted without scanning the cache.
+    """
+    __slots__ = ('ds_id', 'keys')
+
+    def __init__(self, ds, callback):
+        super(_DatasetRef, self).__init__(ds, callback)
+        self.ds_id = id(ds)
+        self.keys = set()
+
+
+# Cached arrays keyed by (id(ds), frame index or None) with values of
+#   (_DatasetRef to ds, pixel ids, ndarray), least recently used first
+_cache = OrderedDict()
+# The weakrefs to the datasets with cached arrays, keyed by id(ds)
+_refs = {}
+_lock = threading.RLock()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'nbytes': 0}
+
+
+def is_enabled():
+    """Return ``True`` if the pixel cache is in use."""
+    return pydicom.config.pixel_cache_size is not None
+
+
+def _remove(key):
+    """Remove the entry for `key`. Must be called with ``_lock`` held."""
+    ref, _, arr = _cache.pop(key)
+    ref.keys.discard(key)
+    _stats['nbytes'] -= arr.nbytes
+
+
+def _evict(ref):
+    """Remove the entries for a dataset that's been garbage collected."""
+    with _lock:
+        for key in list(ref.keys):
+            _remove(key)
+
+        # The id may already have been reused by a new dataset
+        if _refs.get(ref.ds_id) is ref:
+            del _refs[ref.ds_id]
+
+
+def get(ds, index=None):
+    """Return the cached pixel data for `ds`, or ``None`` if not cached.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The dataset the pixel data belongs to.
+    index : int or None, optional
+        The index of the frame, or ``None`` (default) for the entire pixel
+        data.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The cached array, or ``None`` if there isn't one or if the elements
+        that affect the pixel data have changed since it was cached.
+    """
+    key = (id(ds), index)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            ref, pixel_id, arr = entry
+            if ref() is ds and pixel_id == get_image_pixel_ids(ds):
+                _cache.move_to_end(key)
+                _stats['hits'] += 1
+                return arr
+
+            # The dataset or its pixel data has changed
+            _remove(key)
+
+        _stats['misses'] += 1
+
+    return None
+
+
+def put(ds, arr, index=None):
+    """Add the pixel data `arr` for `ds` to the cache.
+
+    The least recently used arrays are evicted to keep the total size of
+    the cached arrays within :attr:`~pydicom.config.pixel_cache_size`.
+    Arrays larger than the budget aren't cached.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The dataset the pixel data belongs to.
+    arr : numpy.ndarray
+        The pixel data to cache.
+    index : int or None, optional
+        The index of the frame, or ``None`` (default) for the entire pixel
+        data.
+    """
+    maxbytes = pydicom.config.pixel_cache_size
+    if maxbytes is None:
+        return
+
+    key = (id(ds), index)
+    with _lock:
+        if key in _cache:
+            _remove(key)
+
+        if arr.nbytes > maxbytes:
+            return
+
+        while _cache and _stats['nbytes'] + arr.nbytes > maxbytes:
+            _remove(next(iter(_cache)))
+            _stats['evictions'] += 1
+
+        ref = _refs.get(id(ds))
+        if ref is None or ref() is not ds:
+            ref = _refs[id(ds)] = _DatasetRef(ds, _evict)
+
+        _cache[key] = (ref, get_image_pixel_ids(ds), arr)
+        ref.keys.add(key)
+        _stats['nbytes'] += arr.nbytes
+
+
+def clear():
+    """Remove all the arrays from the cache and reset the statistics."""
+    with _lock:
+        _cache.clear()
+        for ref in _refs.values():
+            ref.keys.clear()
+        _refs.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def cache_info():
+    """Return the cache statistics.
+
+    Returns
+    -------
+    CacheInfo
+        A named tuple of ``(hits, misses, evictions, count, nbytes,
+        maxbytes)``.
+    """
+    with _lock:
+        return CacheInfo(
+            _stats['hits'], _stats['misses'], _stats['evictions'],
+            len(_cache), _stats['nbytes'], pydicom.config.pixel_cache_size
+        )
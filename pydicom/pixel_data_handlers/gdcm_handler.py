@@ -21,7 +21,9 @@ except ImportError:
     HAVE_GDCM_IN_MEMORY_SUPPORT = False
 
 import pydicom.uid
-from pydicom.pixel_data_handlers.util import get_expected_length, pixel_dtype
+from pydicom.pixel_data_handlers.util import (
+    get_expected_length, pixel_dtype, _get_output_array
+)
 
 
 HANDLER_NAME = 'GDCM'
@@ -178,9 +180,26 @@ def create_image_reader(filename):
     return image_reader
 
 
-def get_pixeldata(dicom_dataset):
+def get_pixeldata(dicom_dataset, workers=None, out=None):
     """Use the GDCM package to decode *Pixel Data*.
 
+    .. versionchanged:: 2.0
+
+        Added the `workers` and `out` keyword parameters.
+
+    Parameters
+    ----------
+    dicom_dataset : Dataset
+        The :class:`Dataset` containing an Image Pixel module and the
+        *Pixel Data* to be decompressed and returned.
+    workers : int or None, optional
+        Not used as GDCM decodes all the frames in a single call, included
+        for compatibility with the other pixel data handlers.
+    out : numpy.ndarray or None, optional
+        If used then copy the pixel data decoded by GDCM into `out` and
+        return a 1D view of it, see :meth:`Dataset.convert_pixel_data()
+        <pydicom.dataset.Dataset.convert_pixel_data>` for the requirements.
+
     Returns
     -------
     numpy.ndarray
@@ -249,7 +268,13 @@ def get_pixeldata(dicom_dataset):
                              "not match the expected data %d" %
                              (pixel_array.size, expected_length_pixels))
 
+    if out is not None:
+        out = _get_output_array(out, numpy_dtype, pixel_array.size)
+        out[:] = pixel_array
+    else:
+        out = pixel_array.copy()
+
     if should_change_PhotometricInterpretation_to_RGB(dicom_dataset):
         dicom_dataset.PhotometricInterpretation = "RGB"
 
-    return pixel_array.copy()
+    return out
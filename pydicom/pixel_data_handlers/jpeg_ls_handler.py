@@ -16,8 +16,10 @@ try:
 except ImportError:
     HAVE_JPEGLS = False
 
-import pydicom.encaps
-from pydicom.pixel_data_handlers.util import dtype_corrected_for_endianness
+from pydicom.pixel_data_handlers.util import (
+    decode_frames, dtype_corrected_for_endianness, get_expected_length,
+    _get_output_array
+)
 import pydicom.uid
 
 
@@ -70,9 +72,27 @@ def supports_transfer_syntax(transfer_syntax):
     return transfer_syntax in SUPPORTED_TRANSFER_SYNTAXES
 
 
-def get_pixeldata(dicom_dataset):
+def get_pixeldata(dicom_dataset, workers=None, out=None):
     """Return the *Pixel Data* as a :class:`numpy.ndarray`.
 
+    .. versionchanged:: 2.0
+
+        Added the `workers` and `out` keyword parameters.
+
+    Parameters
+    ----------
+    dicom_dataset : Dataset
+        The :class:`Dataset` containing an Image Pixel module and the
+        *Pixel Data* to be decompressed and returned.
+    workers : int or None, optional
+        If greater than 1 then decode up to `workers` frames at the same
+        time using a thread pool, otherwise (default) decode the frames in
+        turn. See :func:`~pydicom.pixel_data_handlers.util.decode_frames`.
+    out : numpy.ndarray or None, optional
+        If used then decode the pixel data directly into `out` and return a
+        1D view of it, see :meth:`Dataset.convert_pixel_data()
+        <pydicom.dataset.Dataset.convert_pixel_data>` for the requirements.
+
     Returns
     -------
     numpy.ndarray
@@ -124,27 +144,23 @@ def get_pixeldata(dicom_dataset):
     numpy_format = dtype_corrected_for_endianness(
         dicom_dataset.is_little_endian, numpy_format)
 
+    def decode_frame(frame):
+        return jpeg_ls.decode(numpy.frombuffer(frame, dtype=numpy.uint8))
+
+    if out is not None:
+        out = _get_output_array(
+            out, numpy_format, get_expected_length(dicom_dataset, 'pixels')
+        )
+
     # decompress here
-    UncompressedPixelData = bytearray()
-    if ('NumberOfFrames' in dicom_dataset and
-            dicom_dataset.NumberOfFrames > 1):
-        # multiple compressed frames
-        CompressedPixelDataSeq = pydicom.encaps.decode_data_sequence(
-            dicom_dataset.PixelData)
-        # print len(CompressedPixelDataSeq)
-        for frame in CompressedPixelDataSeq:
-            decompressed_image = jpeg_ls.decode(
-                numpy.frombuffer(frame, dtype=numpy.uint8))
-            UncompressedPixelData.extend(decompressed_image.tobytes())
-    else:
-        # single compressed frame
-        CompressedPixelData = pydicom.encaps.defragment_data(
-            dicom_dataset.PixelData)
-        decompressed_image = jpeg_ls.decode(
-            numpy.frombuffer(CompressedPixelData, dtype=numpy.uint8))
-        UncompressedPixelData.extend(decompressed_image.tobytes())
-
-    pixel_array = numpy.frombuffer(UncompressedPixelData, numpy_format)
+    UncompressedPixelData = decode_frames(
+        dicom_dataset, decode_frame, workers, out=out
+    )
+    pixel_array = UncompressedPixelData.view(numpy_format)
+    if out is not None and out.dtype != numpy_format:
+        # Only the byte order differs
+        pixel_array.byteswap(inplace=True)
+        pixel_array = out
     if should_change_PhotometricInterpretation_to_RGB(dicom_dataset):
         dicom_dataset.PhotometricInterpretation = "RGB"
 
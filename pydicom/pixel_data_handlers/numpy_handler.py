@@ -56,7 +56,9 @@ except ImportError:
 
 import warnings
 
-from pydicom.pixel_data_handlers.util import pixel_dtype, get_expected_length
+from pydicom.pixel_data_handlers.util import (
+    pixel_dtype, get_expected_length, _get_output_array
+)
 import pydicom.uid
 
 HANDLER_NAME = 'Numpy'
@@ -204,7 +206,164 @@ def unpack_bits(bytestream):
     return arr
 
 
-def get_pixeldata(ds, read_only=False):
+def _expand_ybr_full_422(arr):
+    """Return the YBR_FULL_422 data in `arr` resampled to YBR_FULL."""
+    # PS3.3 C.7.6.3.1.2: YBR_FULL_422 data needs to be resampled
+    # Y1 Y2 B1 R1 -> Y1 B1 R1 Y2 B1 R1
+    out = np.zeros(arr.size // 2 * 3, dtype=arr.dtype)
+    out[::6] = arr[::4]  # Y1
+    out[3::6] = arr[1::4]  # Y2
+    out[1::6], out[4::6] = arr[2::4], arr[2::4]  # B
+    out[2::6], out[5::6] = arr[3::4], arr[3::4]  # R
+    return out
+
+
+_PIXEL_DATA_TAGS = {
+    'PixelData': 0x7FE00010,
+    'FloatPixelData': 0x7FE00008,
+    'DoubleFloatPixelData': 0x7FE00009,
+}
+
+
+def _read_pixel_bytes(ds, keyword, offset, length):
+    """Return `length` bytes of the pixel data element `keyword` in `ds`,
+    starting at `offset`.
+
+    If the element's value has been deferred then only the requested bytes
+    are read from the file, otherwise they're sliced from the value without
+    copying.
+    """
+    elem = ds._dict[_PIXEL_DATA_TAGS[keyword]]
+    if isinstance(elem, tuple) and elem.value is None and elem.length:
+        from pydicom.filereader import read_deferred_bytes
+        return read_deferred_bytes(
+            ds.fileobj_type, ds.filename, ds.timestamp, elem, offset, length
+        )
+
+    return memoryview(elem.value or b'')[offset:offset + length]
+
+
+def get_frame(ds, index, read_only=False):
+    """Return a single frame of the pixel data as a :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    Only the part of the pixel data containing the frame is used, so if the
+    value of the pixel data element was deferred when the dataset was read,
+    only the frame is read from the file.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The :class:`Dataset` containing an Image Pixel, Floating Point Image
+        Pixel or Double Floating Point Image Pixel module and the
+        *Pixel Data*, *Float Pixel Data* or *Double Float Pixel Data*. If
+        (0028,0004) *Photometric Interpretation* is `'YBR_FULL_422'` then
+        the frame will be resampled to 3 channel data.
+    index : int
+        The index of the frame to return, starting at ``0`` for the first
+        frame. Negative values count back from the last frame.
+    read_only : bool, optional
+        If ``False`` (default) then returns a writeable array that doesn't
+        use the original memory. If ``True`` and the value of (0028,0100)
+        *Bits Allocated* > 1 then returns a read-only array that uses the
+        memory of the pixel data (or the bytes read from the file).
+
+    Returns
+    -------
+    np.ndarray
+        The frame, with shape (rows, columns) for single sample data or
+        (rows, columns, samples) for multi-sample data.
+
+    Raises
+    ------
+    AttributeError
+        If `ds` is missing a required element.
+    IndexError
+        If `index` is out of range.
+    NotImplementedError
+        If `ds` contains pixel data in an unsupported format.
+    ValueError
+        If the pixel data is too short to contain the frame.
+    """
+    transfer_syntax = ds.file_meta.TransferSyntaxUID
+    if transfer_syntax not in SUPPORTED_TRANSFER_SYNTAXES:
+        raise NotImplementedError(
+            "Unable to convert the pixel data as the transfer syntax "
+            "is not supported by the numpy pixel data handler."
+        )
+
+    px_keyword = [kw for kw in _PIXEL_DATA_TAGS if kw in ds]
+    if len(px_keyword) != 1:
+        raise AttributeError(
+            "Unable to convert the pixel data: one of Pixel Data, Float "
+            "Pixel Data or Double Float Pixel Data must be present in "
+            "the dataset"
+        )
+
+    required_elements = [
+        'BitsAllocated', 'Rows', 'Columns', 'PixelRepresentation',
+        'SamplesPerPixel', 'PhotometricInterpretation'
+    ]
+    missing = [elem for elem in required_elements if elem not in ds]
+    if missing:
+        raise AttributeError(
+            "Unable to convert the pixel data as the following required "
+            "elements are missing from the dataset: " + ", ".join(missing)
+        )
+
+    nr_frames = getattr(ds, 'NumberOfFrames', 1)
+    if not -nr_frames <= index < nr_frames:
+        raise IndexError(
+            "Unable to return frame {} as the pixel data only contains {} "
+            "frame(s)".format(index, nr_frames)
+        )
+    index %= nr_frames
+
+    nr_samples = ds.SamplesPerPixel
+    frame_pixels = ds.Rows * ds.Columns * nr_samples
+    bits_allocated = ds.BitsAllocated
+    if bits_allocated == 1:
+        # Frames aren't necessarily aligned to byte boundaries
+        first_bit = index * frame_pixels
+        offset = first_bit // 8
+        length = (first_bit + frame_pixels + 7) // 8 - offset
+    else:
+        length = frame_pixels * bits_allocated // 8
+        if ds.PhotometricInterpretation == 'YBR_FULL_422':
+            length = length // 3 * 2
+        offset = index * length
+
+    frame = _read_pixel_bytes(ds, px_keyword[0], offset, length)
+    if len(frame) < length:
+        raise ValueError(
+            "The length of the pixel data in the dataset is too short to "
+            "contain frame {}".format(index)
+        )
+
+    if bits_allocated == 1:
+        start = first_bit % 8
+        arr = unpack_bits(frame)[start:start + frame_pixels]
+    else:
+        dtype = pixel_dtype(ds, as_float=('Float' in px_keyword[0]))
+        arr = np.frombuffer(frame, dtype=dtype)
+        if ds.PhotometricInterpretation == 'YBR_FULL_422':
+            arr = _expand_ybr_full_422(arr)
+        elif not read_only:
+            arr = arr.copy()
+
+    if nr_samples == 1:
+        return arr.reshape(ds.Rows, ds.Columns)
+
+    # The same as reshape_pixel_array() for a single frame
+    if ds.PlanarConfiguration == 1:
+        arr = arr.reshape(nr_samples, ds.Rows, ds.Columns)
+        return arr.transpose(1, 2, 0)
+
+    return arr.reshape(ds.Rows, ds.Columns, nr_samples)
+
+
+def get_pixeldata(ds, read_only=False, workers=None, out=None):
     """Return a :class:`numpy.ndarray` of the pixel data.
 
     .. versionchanged:: 1.4
@@ -213,6 +372,10 @@ def get_pixeldata(ds, read_only=False):
           Interpretation* of ``YBR_FULL_422``.
         * Added support for *Float Pixel Data* and *Double Float Pixel Data*
 
+    .. versionchanged:: 2.0
+
+        Added the `workers` and `out` keyword parameters.
+
 
     Parameters
     ----------
@@ -230,6 +393,14 @@ def get_pixeldata(ds, read_only=False):
         *Bits Allocated* > 1 then returns a read-only array that uses the
         original memory buffer of the pixel data. If *Bits Allocated* = 1 then
         always returns a writeable array.
+    workers : int or None, optional
+        Not used as the pixel data doesn't need decoding, included for
+        compatibility with the other pixel data handlers.
+    out : numpy.ndarray or None, optional
+        If used then copy the pixel data into `out` and return a 1D view of
+        it, see :meth:`Dataset.convert_pixel_data()
+        <pydicom.dataset.Dataset.convert_pixel_data>` for the requirements.
+        `read_only` is ignored.
 
     Returns
     -------
@@ -333,21 +504,20 @@ def get_pixeldata(ds, read_only=False):
     else:
         # Skip the trailing padding byte(s) if present
         dtype = pixel_dtype(ds, as_float=('Float' in px_keyword[0]))
-        arr = np.frombuffer(pixel_data[:expected_len], dtype=dtype)
+        arr = np.frombuffer(
+            pixel_data, dtype=dtype, count=expected_len // dtype.itemsize
+        )
         if ds.PhotometricInterpretation == 'YBR_FULL_422':
-            # PS3.3 C.7.6.3.1.2: YBR_FULL_422 data needs to be resampled
-            # Y1 Y2 B1 R1 -> Y1 B1 R1 Y2 B1 R1
-            out = np.zeros(expected_len // 2 * 3, dtype=dtype)
-            out[::6] = arr[::4]  # Y1
-            out[3::6] = arr[1::4]  # Y2
-            out[1::6], out[4::6] = arr[2::4], arr[2::4]  # B
-            out[2::6], out[5::6] = arr[3::4], arr[3::4]  # R
-            arr = out
+            arr = _expand_ybr_full_422(arr)
+
+    if out is not None:
+        out = _get_output_array(out, arr.dtype, arr.size)
+        out[:] = arr
+        arr = out
+    elif not read_only and ds.BitsAllocated > 1:
+        arr = arr.copy()
 
     if should_change_PhotometricInterpretation_to_RGB(ds):
         ds.PhotometricInterpretation = "RGB"
 
-    if not read_only and ds.BitsAllocated > 1:
-        return arr.copy()
-
     return arr
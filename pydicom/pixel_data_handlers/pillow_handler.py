@@ -3,6 +3,7 @@
 to decode *Pixel Data*.
 """
 
+from functools import partial
 import io
 import logging
 import warnings
@@ -25,7 +26,10 @@ except ImportError:
     HAVE_JPEG2K = False
 
 from pydicom.encaps import defragment_data, decode_data_sequence
-from pydicom.pixel_data_handlers.util import pixel_dtype
+from pydicom.pixel_data_handlers.util import (
+    decode_frames, get_encapsulated_frame, get_expected_length, pixel_dtype,
+    reshape_pixel_array, _get_output_array
+)
 import pydicom.uid
 
 
@@ -89,27 +93,8 @@ def should_change_PhotometricInterpretation_to_RGB(ds):
     return False
 
 
-def get_pixeldata(ds):
-    """Return a :class:`numpy.ndarray` of the *Pixel Data*.
-
-    Parameters
-    ----------
-    ds : Dataset
-        The :class:`Dataset` containing an Image Pixel module and the
-        *Pixel Data* to be decompressed and returned.
-
-    Returns
-    -------
-    numpy.ndarray
-       The contents of (7FE0,0010) *Pixel Data* as a 1D array.
-
-    Raises
-    ------
-    ImportError
-        If Pillow is not available.
-    NotImplementedError
-        If the transfer syntax is not supported
-    """
+def _check_dataset(ds):
+    """Raise an exception if the pixel data in `ds` can't be decoded."""
     logger.debug("Trying to use Pillow to read pixel array "
                  "(has pillow = %s)", HAVE_PIL)
     transfer_syntax = ds.file_meta.TransferSyntaxUID
@@ -139,32 +124,19 @@ def get_pixeldata(ds):
             .format(pydicom.uid.JPEGExtended, pydicom.uid.JPEGExtended.name)
         )
 
-    pixel_bytes = bytearray()
-    if getattr(ds, 'NumberOfFrames', 1) > 1:
-        j2k_precision = None
-        # multiple compressed frames
-        for frame in decode_data_sequence(ds.PixelData):
-            im = Image.open(io.BytesIO(frame))
-            if 'YBR' in ds.PhotometricInterpretation:
-                im.draft('YCbCr', (ds.Rows, ds.Columns))
-            pixel_bytes.extend(im.tobytes())
-
-            if not j2k_precision:
-                j2k_precision = _get_j2k_precision(frame)
-    else:
-        # single compressed frame
-        pixel_data = defragment_data(ds.PixelData)
-        im = Image.open(io.BytesIO(pixel_data))
-        if 'YBR' in ds.PhotometricInterpretation:
-            im.draft('YCbCr', (ds.Rows, ds.Columns))
-        pixel_bytes.extend(im.tobytes())
 
-        j2k_precision = _get_j2k_precision(pixel_data)
+def _decode_frame(ds, frame):
+    """Return the decoded pixel bytes for the encoded `frame`."""
+    im = Image.open(io.BytesIO(frame))
+    if 'YBR' in ds.PhotometricInterpretation:
+        im.draft('YCbCr', (ds.Rows, ds.Columns))
 
-    logger.debug("Successfully read %s pixel bytes", len(pixel_bytes))
+    return im.tobytes()
 
-    arr = numpy.frombuffer(pixel_bytes, pixel_dtype(ds))
 
+def _correct_pixels(ds, arr, j2k_precision):
+    """Undo Pillow's conversion of the decoded pixels in `arr` in-place."""
+    transfer_syntax = ds.file_meta.TransferSyntaxUID
     if transfer_syntax in PillowJPEG2000TransferSyntaxes:
         # Pillow converts N-bit data to 8- or 16-bit unsigned data
         # See Pillow src/libImaging/Jpeg2KDecode.c::j2ku_gray_i
@@ -190,6 +162,114 @@ def get_pixeldata(ds):
     if should_change_PhotometricInterpretation_to_RGB(ds):
         ds.PhotometricInterpretation = "RGB"
 
+
+def get_frame(ds, index):
+    """Return a single frame of the *Pixel Data* as a
+    :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    Only the requested frame is decoded, see
+    :func:`~pydicom.pixel_data_handlers.util.get_encapsulated_frame`.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The :class:`Dataset` containing an Image Pixel module and the
+        *Pixel Data* to be decompressed.
+    index : int
+        The index of the frame to return, starting at ``0`` for the first
+        frame. Negative values count back from the last frame.
+
+    Returns
+    -------
+    numpy.ndarray
+        The frame, with shape (rows, columns) for single sample data or
+        (rows, columns, samples) for multi-sample data.
+
+    Raises
+    ------
+    ImportError
+        If Pillow is not available.
+    IndexError
+        If `index` is out of range.
+    NotImplementedError
+        If the transfer syntax is not supported
+    """
+    _check_dataset(ds)
+
+    frame = get_encapsulated_frame(ds, index)
+    pixel_bytes = bytearray(_decode_frame(ds, frame))
+    arr = numpy.frombuffer(pixel_bytes, pixel_dtype(ds))
+    _correct_pixels(ds, arr, _get_j2k_precision(frame))
+
+    return reshape_pixel_array(ds, arr, nr_frames=1)
+
+
+def get_pixeldata(ds, workers=None, out=None):
+    """Return a :class:`numpy.ndarray` of the *Pixel Data*.
+
+    .. versionchanged:: 2.0
+
+        Added the `workers` and `out` keyword parameters.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The :class:`Dataset` containing an Image Pixel module and the
+        *Pixel Data* to be decompressed and returned.
+    workers : int or None, optional
+        If greater than 1 then decode up to `workers` frames at the same
+        time using a thread pool, otherwise (default) decode the frames in
+        turn. See :func:`~pydicom.pixel_data_handlers.util.decode_frames`.
+    out : numpy.ndarray or None, optional
+        If used then decode the pixel data directly into `out` and return a
+        1D view of it, see :meth:`Dataset.convert_pixel_data()
+        <pydicom.dataset.Dataset.convert_pixel_data>` for the requirements.
+
+    Returns
+    -------
+    numpy.ndarray
+       The contents of (7FE0,0010) *Pixel Data* as a 1D array.
+
+    Raises
+    ------
+    ImportError
+        If Pillow is not available.
+    NotImplementedError
+        If the transfer syntax is not supported
+    """
+    _check_dataset(ds)
+
+    dtype = pixel_dtype(ds)
+    if out is not None:
+        out = _get_output_array(
+            out, dtype, get_expected_length(ds, 'pixels')
+        )
+
+    if getattr(ds, 'NumberOfFrames', 1) > 1:
+        # multiple compressed frames
+        frames = decode_data_sequence(ds.PixelData)
+    else:
+        # single compressed frame
+        frames = [defragment_data(ds.PixelData)]
+
+    j2k_precision = None
+    for frame in frames:
+        j2k_precision = _get_j2k_precision(frame)
+        if j2k_precision:
+            break
+
+    arr = decode_frames(ds, partial(_decode_frame, ds), workers, frames, out)
+    arr = arr.view(dtype)
+    logger.debug("Successfully read %s pixel bytes", arr.nbytes)
+
+    _correct_pixels(ds, arr, j2k_precision)
+    if out is not None and out.dtype != dtype:
+        # Only the byte order differs
+        arr.byteswap(inplace=True)
+        arr = out
+
     return arr
 
 
@@ -0,0 +1,264 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Rank the pixel data handlers for each transfer syntax by their measured
+decoding throughput.
+
+.. versionadded:: 2.0
+
+By default the handlers in :attr:`~pydicom.config.pixel_data_handlers` are
+tried in the same order for every transfer syntax. When more than one
+handler is installed the fastest one often depends on the transfer syntax,
+so :func:`calibrate` can be used to time the available handlers on sample
+datasets and return a ranking for each transfer syntax. Setting
+:attr:`~pydicom.config.pixel_data_handler_ranking` to the ranking then
+changes the order the handlers are tried in. The ranking can be saved with
+:func:`save_ranking` and loaded again with :func:`load_ranking`.
+
+Examples
+--------
+Calibrate the handlers once and save the ranking:
+
+>>> from pydicom.pixel_data_handlers import ranking
+>>> result = ranking.calibrate([dcmread(path) for path in sample_paths])
+>>> ranking.save_ranking(result, 'handler_ranking.json')
+
+Then use the saved ranking in later sessions:
+
+>>> from pydicom import config
+>>> config.pixel_data_handler_ranking = ranking.load_ranking(
+...     'handler_ranking.json'
+... )
+"""
+
+from copy import copy, deepcopy
+import json
+import threading
+import time
+
+import pydicom.config
+from pydicom.config import logger
+
+
+# The handlers supporting each transfer syntax in the order they should be
+#   tried, and copies of the configuration the table was built from
+_table = {}
+_table_handlers = None
+_table_ranking = None
+_table_lock = threading.Lock()
+
+
+def handler_name(handler):
+    """Return the name used for `handler` in a ranking.
+
+    The name is the handler's module name without the ``'_handler'``
+    suffix, which is the same as the names used by
+    :meth:`Dataset.convert_pixel_data()
+    <pydicom.dataset.Dataset.convert_pixel_data>`, such as ``'gdcm'`` or
+    ``'pillow'``.
+
+    Parameters
+    ----------
+    handler : module
+        The pixel data handler.
+
+    Returns
+    -------
+    str
+        The name of the handler.
+    """
+    name = handler.__name__.rsplit('.', 1)[-1]
+    if name.endswith('_handler'):
+        name = name[:-len('_handler')]
+
+    return name
+
+
+def get_handlers(transfer_syntax):
+    """Return the pixel data handlers that support `transfer_syntax`, in the
+    order they should be tried.
+
+    The handlers in :attr:`~pydicom.config.pixel_data_handler_ranking` for
+    `transfer_syntax` come first, in the order they're ranked, followed by
+    any other handlers in :attr:`~pydicom.config.pixel_data_handlers` that
+    support the transfer syntax. The result for each transfer syntax is
+    kept in a dispatch table which is rebuilt if either of the configuration
+    options change, including changes made in place.
+
+    Parameters
+    ----------
+    transfer_syntax : uid.UID
+        The *Transfer Syntax UID* of the pixel data.
+
+    Returns
+    -------
+    list of module
+        The handlers that support `transfer_syntax`, which may not have
+        their dependencies met.
+    """
+    global _table_handlers, _table_ranking
+
+    handlers = pydicom.config.pixel_data_handlers
+    ranking = pydicom.config.pixel_data_handler_ranking
+    with _table_lock:
+        # Compare with copies so changes made in place are also picked up,
+        #   the comparisons are cheap compared to rebuilding the table
+        if handlers != _table_handlers or ranking != _table_ranking:
+            _table.clear()
+            _table_handlers = copy(handlers)
+            _table_ranking = deepcopy(ranking)
+
+        result = _table.get(transfer_syntax)
+        if result is None:
+            result = [
+                hh for hh in handlers
+                if hh.supports_transfer_syntax(transfer_syntax)
+            ]
+            order = list((ranking or {}).get(transfer_syntax, []))
+            result.sort(
+                key=lambda hh: (
+                    order.index(handler_name(hh))
+                    if handler_name(hh) in order else len(order)
+                )
+            )
+            _table[transfer_syntax] = result
+
+    return list(result)
+
+
+def calibrate(datasets, repeats=3):
+    """Time the available pixel data handlers on `datasets` and return the
+    handlers for each transfer syntax ranked by their throughput.
+
+    Each available handler in :attr:`~pydicom.config.pixel_data_handlers`
+    that supports the transfer syntax of a dataset is used to decode the
+    dataset's pixel data `repeats` times and the fastest time is kept. The
+    throughput of a handler for a transfer syntax is the total number of
+    bytes it decoded divided by the total time taken over all the datasets
+    with that transfer syntax. Handlers that raise an exception when
+    decoding a dataset aren't ranked for its transfer syntax.
+
+    Parameters
+    ----------
+    datasets : iterable of Dataset
+        The sample datasets to decode, which should be representative of
+        the data to be decoded.
+    repeats : int, optional
+        The number of times each dataset is decoded by each handler,
+        default ``3``.
+
+    Returns
+    -------
+    dict
+        A :class:`dict` mapping each *Transfer Syntax UID* in `datasets` to
+        a :class:`list` of handler names, fastest first, suitable for use
+        with :attr:`~pydicom.config.pixel_data_handler_ranking`.
+
+    Raises
+    ------
+    ValueError
+        If `repeats` is less than 1.
+    """
+    if repeats < 1:
+        raise ValueError("'repeats' must be at least 1")
+
+    # {transfer syntax: {handler name: [nr bytes, seconds]}}
+    totals = {}
+    failed = {}
+    for ds in datasets:
+        transfer_syntax = ds.file_meta.TransferSyntaxUID
+        results = totals.setdefault(transfer_syntax, {})
+        excluded = failed.setdefault(transfer_syntax, set())
+        for handler in pydicom.config.pixel_data_handlers:
+            name = handler_name(handler)
+            if (name in excluded
+                    or not handler.supports_transfer_syntax(transfer_syntax)
+                    or not handler.is_available()):
+                continue
+
+            # Handlers may modify the dataset so use a copy
+            sample = deepcopy(ds)
+            try:
+                best = None
+                for ii in range(repeats):
+                    start = time.perf_counter()
+                    arr = handler.get_pixeldata(sample)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            except Exception as exc:
+                logger.debug(
+                    "Exception raised by pixel data handler '{}' during "
+                    "calibration".format(name), exc_info=exc
+                )
+                excluded.add(name)
+                results.pop(name, None)
+                continue
+
+            total = results.setdefault(name, [0, 0.0])
+            total[0] += arr.nbytes
+            total[1] += best
+
+    ranking = {}
+    for transfer_syntax, results in totals.items():
+        throughput = {
+            name: nbytes / max(seconds, 1e-9)
+            for name, (nbytes, seconds) in results.items()
+        }
+        for name, value in sorted(throughput.items()):
+            logger.debug(
+                "Pixel data handler '{}' decoded '{}' at {:.1f} MB/s"
+                .format(name, transfer_syntax.name, value / 1e6)
+            )
+
+        ranking[str(transfer_syntax)] = sorted(
+            throughput, key=lambda name: throughput[name], reverse=True
+        )
+
+    return ranking
+
+
+def save_ranking(ranking, path):
+    """Save a handler ranking as JSON.
+
+    Parameters
+    ----------
+    ranking : dict
+        The ranking to save, as returned by :func:`calibrate`.
+    path : str or PathLike
+        The path to the file to write.
+    """
+    with open(path, 'w') as f:
+        json.dump(ranking, f, indent=2, sort_keys=True)
+
+
+def load_ranking(path):
+    """Return a handler ranking saved by :func:`save_ranking`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the file to read.
+
+    Returns
+    -------
+    dict
+        The ranking, suitable for use with
+        :attr:`~pydicom.config.pixel_data_handler_ranking`.
+
+    Raises
+    ------
+    ValueError
+        If the file doesn't contain a valid ranking.
+    """
+    with open(path, 'r') as f:
+        ranking = json.load(f)
+
+    valid = isinstance(ranking, dict) and all(
+        isinstance(names, list) and all(isinstance(nn, str) for nn in names)
+        for names in ranking.values()
+    )
+    if not valid:
+        raise ValueError(
+            "The file '{}' doesn't contain a valid handler ranking"
+            .format(path)
+        )
+
+    return ranking
@@ -35,7 +35,12 @@ in the table below.
 
 """
 
-from itertools import groupby
+from collections import deque
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor
+)
+from itertools import groupby, islice
+import os
 from struct import pack, unpack
 import sys
 
@@ -45,8 +50,11 @@ try:
 except ImportError:
     HAVE_RLE = False
 
-from pydicom.encaps import decode_data_sequence, defragment_data
-from pydicom.pixel_data_handlers.util import pixel_dtype
+import pydicom.config
+from pydicom.pixel_data_handlers.util import (
+    decode_frames, get_encapsulated_frame, get_expected_length, pixel_dtype,
+    reshape_pixel_array, _get_output_array
+)
 import pydicom.uid
 
 
@@ -96,9 +104,84 @@ def should_change_PhotometricInterpretation_to_RGB(ds):
     return False
 
 
-def get_pixeldata(ds, rle_segment_order='>'):
+def _check_dataset(ds):
+    """Raise an exception if the pixel data in `ds` can't be converted."""
+    transfer_syntax = ds.file_meta.TransferSyntaxUID
+    # The check of transfer syntax must be first
+    if transfer_syntax not in SUPPORTED_TRANSFER_SYNTAXES:
+        raise NotImplementedError(
+            "Unable to convert the pixel data as the transfer syntax "
+            "is not supported by the RLE pixel data handler."
+        )
+
+    # Check required elements
+    required_elements = ['PixelData', 'BitsAllocated', 'Rows', 'Columns',
+                         'PixelRepresentation', 'SamplesPerPixel']
+    missing = [elem for elem in required_elements if elem not in ds]
+    if missing:
+        raise AttributeError(
+            "Unable to convert the pixel data as the following required "
+            "elements are missing from the dataset: " + ", ".join(missing)
+        )
+
+
+def get_frame(ds, index, rle_segment_order='>'):
+    """Return a single frame of the *Pixel Data* as a
+    :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    Only the requested frame is decoded, see
+    :func:`~pydicom.pixel_data_handlers.util.get_encapsulated_frame`.
+
+    Parameters
+    ----------
+    ds : dataset.Dataset
+        The :class:`Dataset` containing an Image Pixel module and the RLE
+        encoded *Pixel Data* to be converted.
+    index : int
+        The index of the frame to return, starting at ``0`` for the first
+        frame. Negative values count back from the last frame.
+    rle_segment_order : str
+        The order of segments used by the RLE decoder when dealing with *Bits
+        Allocated* > 8, see :func:`get_pixeldata`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The frame, with shape (rows, columns) for single sample data or
+        (rows, columns, samples) for multi-sample data.
+
+    Raises
+    ------
+    AttributeError
+        If `ds` is missing a required element.
+    IndexError
+        If `index` is out of range.
+    NotImplementedError
+        If `ds` contains pixel data in an unsupported format.
+    ValueError
+        If the actual length of the frame doesn't match the expected length.
+    """
+    _check_dataset(ds)
+
+    frame = _rle_decode_frame(
+        get_encapsulated_frame(ds, index), ds.Rows, ds.Columns,
+        ds.SamplesPerPixel, ds.BitsAllocated
+    )
+    dtype = pixel_dtype(ds).newbyteorder(rle_segment_order)
+    arr = np.frombuffer(frame, dtype)
+
+    return reshape_pixel_array(ds, arr, nr_frames=1)
+
+
+def get_pixeldata(ds, rle_segment_order='>', workers=None, out=None):
     """Return an :class:`numpy.ndarray` of the *Pixel Data*.
 
+    .. versionchanged:: 2.0
+
+        Added the `workers` and `out` keyword parameters.
+
     Parameters
     ----------
     ds : dataset.Dataset
@@ -112,6 +195,18 @@ def get_pixeldata(ds, rle_segment_order='>'):
         (default) while a value of ``'<'`` means interpret the segments as
         being in little endian order which may be possible if the encoded data
         is non-conformant.
+    workers : int or None, optional
+        If greater than 1 then decode up to `workers` frames at the same
+        time using a thread pool, otherwise (default) decode the frames in
+        turn. See :func:`~pydicom.pixel_data_handlers.util.decode_frames`.
+    out : numpy.ndarray or None, optional
+        If used then decode the pixel data directly into `out` and return a
+        1D view of it, see :meth:`Dataset.convert_pixel_data()
+        <pydicom.dataset.Dataset.convert_pixel_data>` for the requirements.
+        As with the returned array, multi-sample data is stored in `out`
+        with the samples of each frame as separate planes, which
+        :meth:`~pydicom.dataset.Dataset.convert_pixel_data` rearranges to
+        (rows, columns, samples).
 
     Returns
     -------
@@ -128,47 +223,27 @@ def get_pixeldata(ds, rle_segment_order='>'):
         If the actual length of the pixel data doesn't match the expected
         length.
     """
-    transfer_syntax = ds.file_meta.TransferSyntaxUID
-    # The check of transfer syntax must be first
-    if transfer_syntax not in SUPPORTED_TRANSFER_SYNTAXES:
-        raise NotImplementedError(
-            "Unable to convert the pixel data as the transfer syntax "
-            "is not supported by the RLE pixel data handler."
-        )
+    _check_dataset(ds)
 
-    # Check required elements
-    required_elements = ['PixelData', 'BitsAllocated', 'Rows', 'Columns',
-                         'PixelRepresentation', 'SamplesPerPixel']
-    missing = [elem for elem in required_elements if elem not in ds]
-    if missing:
-        raise AttributeError(
-            "Unable to convert the pixel data as the following required "
-            "elements are missing from the dataset: " + ", ".join(missing)
+    def decode_frame(data):
+        return _rle_decode_frame(
+            data, ds.Rows, ds.Columns, ds.SamplesPerPixel, ds.BitsAllocated
         )
 
-    nr_bits = ds.BitsAllocated
-    nr_samples = ds.SamplesPerPixel
-    nr_frames = getattr(ds, 'NumberOfFrames', 1)
-    rows = ds.Rows
-    cols = ds.Columns
-
-    # Decompress each frame of the pixel data
-    pixel_data = bytearray()
-    if nr_frames > 1:
-        for rle_frame in decode_data_sequence(ds.PixelData):
-            frame = _rle_decode_frame(rle_frame, rows, cols, nr_samples,
-                                      nr_bits)
-            pixel_data.extend(frame)
-    else:
-        frame = _rle_decode_frame(defragment_data(ds.PixelData),
-                                  rows, cols, nr_samples, nr_bits)
-
-        pixel_data.extend(frame)
-
     # The segment order should be big endian by default but make it possible
     #   to switch if the RLE is non-conformant
     dtype = pixel_dtype(ds).newbyteorder(rle_segment_order)
-    arr = np.frombuffer(pixel_data, dtype)
+    if out is not None:
+        out = _get_output_array(
+            out, dtype, get_expected_length(ds, 'pixels')
+        )
+
+    # Decompress each frame of the pixel data
+    arr = decode_frames(ds, decode_frame, workers, out=out).view(dtype)
+    if out is not None and out.dtype != dtype:
+        # Only the byte order differs
+        arr.byteswap(inplace=True)
+        arr = out
 
     if should_change_PhotometricInterpretation_to_RGB(ds):
         ds.PhotometricInterpretation = "RGB"
@@ -278,6 +353,15 @@ def _rle_decode_frame(data, rows, columns, nr_samples, nr_bits):
             "'Bits Allocated' value of {}".format(nr_bits)
         )
 
+    try:
+        decoder = pydicom.config.rle_segment_decoder
+        decode_segment = _SEGMENT_DECODERS[decoder]
+    except KeyError:
+        raise ValueError(
+            "Invalid 'config.rle_segment_decoder' value '{}', must be one "
+            "of: {}".format(decoder, ", ".join(sorted(_SEGMENT_DECODERS)))
+        )
+
     # Parse the RLE Header
     offsets = _parse_rle_header(data[:64])
     nr_segments = len(offsets)
@@ -317,7 +401,7 @@ def _rle_decode_frame(data, rows, columns, nr_samples, nr_bits):
             # Decode the segment
             # ii is 0, 1, 2, 3, ..., (nr_segments - 1)
             ii = sample_number * bytes_per_sample + byte_offset
-            segment = _rle_decode_segment(data[offsets[ii]:offsets[ii + 1]])
+            segment = decode_segment(data[offsets[ii]:offsets[ii + 1]])
             # Check that the number of decoded pixels is correct
             if len(segment) != rows * columns:
                 raise ValueError(
@@ -329,7 +413,9 @@ def _rle_decode_frame(data, rows, columns, nr_samples, nr_bits):
             # For 100 pixel/plane, 32-bit, 3 sample data `start` will be
             #   0, 1, 2, 3, 400, 401, 402, 403, 800, 801, 802, 803
             start = byte_offset + sample_number * stride
-            decoded[start:start + stride:bytes_per_sample] = segment
+            decoded[start:start + stride:bytes_per_sample] = (
+                memoryview(segment)
+            )
 
     return decoded
 
@@ -375,18 +461,100 @@ def _rle_decode_segment(data):
     return result
 
 
+def _rle_decode_segment_np(data):
+    """Return a single segment of decoded RLE data as
+    :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    The same as :func:`_rle_decode_segment` but vectorised using NumPy.
+
+    Parameters
+    ----------
+    data : bytes
+        The segment data to be decoded.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded segment as a 1D array of ``uint8``.
+    """
+    data = np.frombuffer(data, dtype='uint8')
+    nr_bytes = len(data)
+
+    # The position of the next header byte if there's a header byte at each
+    #   position: header N is followed by either (N + 1) literal bytes if N
+    #   is 0 to 127, one byte to be repeated if N is 129 to 255, or nothing
+    #   if N is 128. The end of the data is used as a sink
+    next_header = np.arange(1, nr_bytes + 2, dtype='int64')
+    next_header[:-1] += np.where(
+        data < 128, data.astype('int64') + 1, data > 128
+    )
+    np.minimum(next_header, nr_bytes, out=next_header)
+
+    # Only every 32nd header has to be found one at a time, the headers
+    #   in between are found by following `next_header` for all of them
+    #   at once
+    skip = next_header
+    for _ in range(5):
+        skip = skip[skip]
+
+    positions = []
+    pos = 0
+    while pos < nr_bytes:
+        positions.append(pos)
+        pos = int(skip[pos])
+
+    headers = [np.asarray(positions, dtype='int64')]
+    for _ in range(31):
+        headers.append(next_header[headers[-1]])
+
+    headers = np.stack(headers, axis=1).ravel()
+    headers = headers[headers < nr_bytes]
+
+    # Build the segment with a single `repeat` of the encoded data: header
+    #   bytes are used 0 times, literal bytes once and the byte after a
+    #   replicate run's header (257 - N) times
+    header_bytes = data[headers]
+    first = headers + 1
+    literal = header_bytes < 128
+    counts = np.zeros(nr_bytes + 1, dtype='int64')
+    counts[first[literal]] = 1
+    counts[next_header[headers[literal]]] -= 1
+    np.cumsum(counts, out=counts)
+
+    replicate = (header_bytes > 128) & (first < nr_bytes)
+    counts[first[replicate]] = 257 - header_bytes[replicate].astype('int64')
+
+    return np.repeat(data, counts[:-1])
+
+
+_SEGMENT_DECODERS = {
+    'python': _rle_decode_segment,
+    'numpy': _rle_decode_segment_np,
+}
+
+
 # RLE encoding functions
-def rle_encode_frame(arr):
+def rle_encode_frame(arr, executor=None):
     """Return an :class:`numpy.ndarray` image frame as RLE encoded
     :class:`bytearray`.
 
     .. versionadded:: 1.3
 
+    .. versionchanged:: 2.0
+
+        Added the `executor` keyword parameter.
+
     Parameters
     ----------
     arr : numpy.ndarray
         A 2D (if *Samples Per Pixel* = 1) or 3D (if *Samples Per Pixel* = 3)
         ndarray containing a single frame of the image to be RLE encoded.
+    executor : concurrent.futures.Executor or None, optional
+        If used then the segments of the frame are encoded concurrently by
+        `executor`, otherwise (default) they're encoded in turn. To encode
+        multiple frames concurrently use :func:`rle_encode_frames` instead.
 
     Returns
     -------
@@ -415,21 +583,28 @@ def rle_encode_frame(arr):
             "a maximum of 15 segments in RLE encoded data"
         )
 
-    rle_data = bytearray()
-    seg_lengths = []
     if len(shape) == 3:
         # Samples Per Pixel > 1
-        for ii in range(arr.shape[-1]):
-            # Need a contiguous array in order to be able to split it up
-            # into byte segments
-            for segment in _rle_encode_plane(arr[..., ii].copy()):
-                rle_data.extend(segment)
-                seg_lengths.append(len(segment))
+        # Need a contiguous array in order to be able to split it up
+        # into byte segments
+        segments = [
+            segment for ii in range(arr.shape[-1])
+            for segment in _rle_plane_segments(arr[..., ii].copy())
+        ]
     else:
         # Samples Per Pixel = 1
-        for segment in _rle_encode_plane(arr):
-            rle_data.extend(segment)
-            seg_lengths.append(len(segment))
+        segments = _rle_plane_segments(arr)
+
+    if executor is None:
+        segments = map(_rle_encode_segment, segments)
+    else:
+        segments = executor.map(_rle_encode_segment, segments)
+
+    rle_data = bytearray()
+    seg_lengths = []
+    for segment in segments:
+        rle_data.extend(segment)
+        seg_lengths.append(len(segment))
 
     # Add the number of segments to the header
     rle_header = bytearray(pack('<L', len(seg_lengths)))
@@ -447,6 +622,85 @@ def rle_encode_frame(arr):
     return rle_header + rle_data
 
 
+def rle_encode_frames(frames, workers=None, executor='process'):
+    """Yield RLE encoded frames, encoding the frames concurrently.
+
+    .. versionadded:: 2.0
+
+    Only a limited number of frames are in progress at any time, so `frames`
+    may be a large (or lazily evaluated) iterable.
+
+    Parameters
+    ----------
+    frames : numpy.ndarray or iterable of numpy.ndarray
+        The frames to encode, either as an ndarray containing multiple frames
+        with shape (frames, rows, columns) or (frames, rows, columns,
+        samples), or as an iterable of frames suitable for use with
+        :func:`rle_encode_frame`.
+    workers : int or None, optional
+        The maximum number of workers to use. If ``None`` (default) then use
+        the default for the executor. Ignored if `executor` is an
+        :class:`~concurrent.futures.Executor` instance.
+    executor : str or concurrent.futures.Executor, optional
+        ``'process'`` (default) to encode using a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, ``'thread'`` to use
+        a :class:`~concurrent.futures.ThreadPoolExecutor`, or an existing
+        :class:`~concurrent.futures.Executor` instance to use (which will
+        not be shut down afterwards).
+
+    Yields
+    ------
+    bytearray
+        The RLE encoded frames, including the RLE header, in the same order
+        as `frames`.
+
+    Raises
+    ------
+    ValueError
+        If `executor` is not valid.
+
+    Examples
+    --------
+    Encode the frames of a multi-frame dataset using 4 processes:
+
+    >>> from pydicom.encaps import encapsulate
+    >>> frames = rle_encode_frames(ds.pixel_array, workers=4)
+    >>> ds.PixelData = encapsulate(list(frames))
+    """
+    owns_executor = True
+    if isinstance(executor, Executor):
+        owns_executor = False
+        pool = executor
+    elif executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=workers)
+    elif executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(
+            "Invalid 'executor' value '{}', must be 'process', 'thread' or "
+            "an Executor instance".format(executor)
+        )
+
+    # Keep enough frames in progress to keep all the workers busy
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    frames = iter(frames)
+    pending = deque()
+    try:
+        while True:
+            for frame in islice(frames, max_pending - len(pending)):
+                pending.append(pool.submit(rle_encode_frame, frame))
+
+            if not pending:
+                return
+
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            pool.shutdown()
+
+
 def _rle_encode_plane(arr):
     """Yield RLE encoded segments from an image plane as bytearray.
 
@@ -470,6 +724,34 @@ def _rle_encode_plane(arr):
         by the DICOM Standard, Part 5, :dcm:`Annex G<part05/chapter_G.html>`.
         The segments are yielded in order from most significant to least.
     """
+    for segment in _rle_plane_segments(arr):
+        yield _rle_encode_segment(segment)
+
+
+def _rle_plane_segments(arr):
+    """Yield the byte segments of an image plane as :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    A plane of N-byte samples must be split into N segments, with each segment
+    containing the same byte of the N-byte samples. For example, in a plane
+    containing 16 bits per sample, the first segment will contain the most
+    significant 8 bits of the samples and the second segment the 8 least
+    significant bits.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        A 2D ndarray containing a single plane of the image data to be RLE
+        encoded. The dtype of the array should be a multiple of 8 (i.e. uint8,
+        uint32, int16, etc.).
+
+    Yields
+    ------
+    numpy.ndarray
+        A uint8 segment of the plane with the same shape as `arr`. The
+        segments are yielded in order from most significant to least.
+    """
     # Determine the byte order of the array
     byte_order = arr.dtype.byteorder
     if byte_order == '=':
@@ -478,16 +760,14 @@ def _rle_encode_plane(arr):
     # Re-view the N-bit array data as N / 8 x uint8s
     arr8 = arr.view(np.uint8)
 
-    # Reshape the uint8 array data into 1 or more segments and encode
+    # Reshape the uint8 array data into 1 or more segments
     bytes_per_sample = arr.dtype.itemsize
     for ii in range(bytes_per_sample):
         # If the original byte order is little endian we need to segment
         #   in reverse order
         if byte_order == '<':
             ii = bytes_per_sample - ii - 1
-        segment = arr8.ravel()[ii::bytes_per_sample].reshape(arr.shape)
-
-        yield _rle_encode_segment(segment)
+        yield arr8.ravel()[ii::bytes_per_sample].reshape(arr.shape)
 
 
 def _rle_encode_segment(arr):
@@ -496,6 +776,12 @@ def _rle_encode_segment(arr):
     Each row of the image is encoded separately as required by the DICOM
     Standard.
 
+    .. versionchanged:: 2.0
+
+        The runs are located and encoded using vectorised NumPy operations
+        rather than row by row, with the same output as encoding each row
+        using :func:`_rle_encode_row`.
+
     Parameters
     ----------
     arr : numpy.ndarray
@@ -509,17 +795,71 @@ def _rle_encode_segment(arr):
         Standard. Odd length encoded segments are padded by a trailing ``0x00``
         to be even length.
     """
-    out = bytearray()
-    if len(arr.shape) > 1:
-        for row in arr:
-            out.extend(_rle_encode_row(row))
-    else:
-        out.extend(_rle_encode_row(arr))
-
-    # Pad odd length data with a trailing 0x00 byte
-    out.extend(b'\x00' * (len(out) % 2))
-
-    return out
+    arr = arr.astype('uint8', copy=False)
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+
+    nr_columns = arr.shape[-1]
+    data = arr.ravel()
+    size = data.size
+    if not size:
+        return bytearray()
+
+    # Find the runs of identical values, each row is encoded separately so
+    #   a new run is always started at the beginning of a row
+    is_start = np.empty(size, dtype='bool')
+    is_start[0] = True
+    np.not_equal(data[1:], data[:-1], out=is_start[1:])
+    is_start[::nr_columns] = True
+    starts = np.flatnonzero(is_start)
+    lengths = np.diff(np.append(starts, size))
+
+    # Runs of length 1 in the same row are combined into literal runs
+    single = lengths == 1
+    is_first = single.copy()
+    is_first[1:] &= ~single[:-1] | (starts[1:] % nr_columns == 0)
+    literal_starts = starts[is_first]
+    literal_lengths = np.bincount(
+        np.cumsum(is_first)[single] - 1, minlength=len(literal_starts)
+    )
+
+    # Literal and replicate runs are split into runs of at most 128 bytes
+    #   and indexed by the position of their first byte so they're in order
+    run_lengths = np.zeros(size, dtype='intp')
+    is_literal = np.zeros(size, dtype='bool')
+    for first, nr_bytes, literal in (
+        (literal_starts, literal_lengths, True),
+        (starts[~single], lengths[~single], False)
+    ):
+        nr_runs = (nr_bytes + 127) // 128
+        run = np.repeat(np.arange(len(first)), nr_runs)
+        offset = np.arange(len(run)) - np.repeat(
+            np.cumsum(nr_runs) - nr_runs, nr_runs
+        )
+        offset *= 128
+        first = first[run] + offset
+        run_lengths[first] = np.minimum(nr_bytes[run] - offset, 128)
+        is_literal[first] = literal
+
+    first = np.flatnonzero(run_lengths)
+    run_lengths = run_lengths[first]
+    # The remaining byte of a replicate run is encoded as a literal run
+    is_literal = is_literal[first] | (run_lengths == 1)
+
+    # Each run is a header byte followed by either the literal bytes or
+    #   the single replicated byte
+    nr_values = np.where(is_literal, run_lengths, 1)
+    header = np.cumsum(nr_values + 1) - nr_values - 1
+    nr_encoded = header[-1] + nr_values[-1] + 1
+    out = np.zeros(nr_encoded + nr_encoded % 2, dtype='uint8')
+    out[header] = np.where(is_literal, run_lengths - 1, 257 - run_lengths)
+
+    values = np.arange(nr_values.sum()) - np.repeat(
+        np.cumsum(nr_values) - nr_values - first, nr_values
+    )
+    out[values + np.repeat(header + 1 - first, nr_values)] = data[values]
+
+    return bytearray(out.tobytes())
 
 
 def _rle_encode_row(arr):
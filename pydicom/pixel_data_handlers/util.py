@@ -1,6 +1,8 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Utility functions used in the pixel data handlers."""
 
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from struct import unpack
 from sys import byteorder
 import warnings
@@ -12,6 +14,9 @@ except ImportError:
     HAVE_NP = False
 
 from pydicom.data import get_palette_files
+from pydicom.encaps import (
+    decode_data_sequence, defragment_data, get_frame_index
+)
 from pydicom.uid import UID
 
 
@@ -578,6 +583,98 @@ def _convert_YBR_FULL_to_RGB(arr):
     return arr.astype(orig_dtype)
 
 
+def decode_frames(ds, decode_frame, workers=None, frames=None, out=None):
+    """Return the decoded frames of encapsulated (7FE0,0010) *Pixel Data* as
+    a 1D uint8 :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.0
+
+    Each decoded frame is written directly into its place in the output
+    array, so the frames don't have to be joined afterwards.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The :class:`~pydicom.dataset.Dataset` containing an Image Pixel
+        module and the encapsulated *Pixel Data*.
+    decode_frame : callable
+        A function that takes the encoded data for a frame and returns the
+        decoded frame as :class:`bytes`, a bytes-like object or a
+        :class:`numpy.ndarray`.
+    workers : int or None, optional
+        If greater than 1 then decode up to `workers` frames at the same
+        time using a :class:`~concurrent.futures.ThreadPoolExecutor`, which
+        is only faster if `decode_frame` releases the GIL while decoding.
+        Otherwise (default) the frames are decoded in turn.
+    frames : list of bytes or None, optional
+        The encoded data for each frame. If ``None`` (default) then the
+        frames are parsed from the *Pixel Data*.
+    out : numpy.ndarray or None, optional
+        If used then the decoded frames are written to `out`, which must be
+        a writeable C-contiguous array with the same size in bytes as the
+        decoded pixel data. If ``None`` (default) then a new array is used.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded pixel data for all the frames as a 1D uint8 array, which
+        is a view of `out` if it's used.
+
+    Raises
+    ------
+    ValueError
+        If the number or length of the decoded frames doesn't match the
+        expected amount, or if `out` isn't suitable.
+    """
+    nr_frames = getattr(ds, 'NumberOfFrames', 1)
+    frame_length = ds.Rows * ds.Columns * ds.SamplesPerPixel
+    frame_length *= ds.BitsAllocated // 8
+
+    if frames is None and nr_frames > 1:
+        frames = decode_data_sequence(ds.PixelData)
+    elif frames is None:
+        frames = [defragment_data(ds.PixelData)]
+
+    if len(frames) != nr_frames:
+        raise ValueError(
+            "The number of frames in the pixel data doesn't match the "
+            "expected amount ({} vs. {} frames)".format(len(frames), nr_frames)
+        )
+
+    if out is None:
+        arr = np.empty(nr_frames * frame_length, dtype='uint8')
+    else:
+        arr = _get_output_array(out, None, nr_frames * frame_length)
+        arr = arr.view('uint8')
+
+    def _decode(index):
+        data = decode_frame(frames[index])
+        if isinstance(data, np.ndarray):
+            data = data.ravel().view('uint8')
+        else:
+            data = np.frombuffer(data, dtype='uint8')
+
+        if data.size != frame_length:
+            raise ValueError(
+                "The length of decoded frame {} doesn't match the expected "
+                "length ({} vs. {} bytes)"
+                .format(index, data.size, frame_length)
+            )
+
+        start = index * frame_length
+        arr[start:start + frame_length] = data
+
+    if workers and workers > 1 and nr_frames > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results to raise any exceptions
+            list(executor.map(_decode, range(nr_frames)))
+    else:
+        for index in range(nr_frames):
+            _decode(index)
+
+    return arr
+
+
 def dtype_corrected_for_endianness(is_little_endian, numpy_dtype):
     """Return a :class:`numpy.dtype` corrected for system and :class:`Dataset`
     endianness.
@@ -715,6 +812,120 @@ def _expand_segmented_lut(data, fmt, nr_segments=None, last_value=None):
     return lut
 
 
+def get_encapsulated_frame(ds, index):
+    """Return the encoded data for a single frame of encapsulated
+    (7FE0,0010) *Pixel Data*.
+
+    .. versionadded:: 2.0
+
+    The first time it's used an index of the frames in the pixel data is
+    built using :func:`~pydicom.encaps.get_frame_index` and stored with
+    `ds`, so the data for any frame can then be returned without having to
+    parse the rest of the pixel data. If `ds` contains the (7FE0,0001)
+    *Extended Offset Table* and (7FE0,0002) *Extended Offset Table Lengths*
+    then they're used to build the index instead of parsing the pixel data.
+    If the value of the pixel data was deferred when the dataset was read
+    then only the item tags and the frame's data are read from the file.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The :class:`~pydicom.dataset.Dataset` containing the encapsulated
+        *Pixel Data*.
+    index : int
+        The index of the frame to return, starting at ``0`` for the first
+        frame. Negative values count back from the last frame.
+
+    Returns
+    -------
+    bytes
+        The encoded frame data, with the frame's fragments joined together.
+
+    Raises
+    ------
+    AttributeError
+        If `ds` has no *Pixel Data*.
+    IndexError
+        If `index` is out of range.
+    ValueError
+        If the pixel data doesn't contain the frame.
+    """
+    elem = ds._dict.get(0x7FE00010)
+    if elem is None:
+        raise AttributeError(
+            "Unable to return the frame as the dataset has no Pixel Data"
+        )
+
+    nr_frames = getattr(ds, 'NumberOfFrames', 1)
+    if not -nr_frames <= index < nr_frames:
+        raise IndexError(
+            "Unable to return frame {} as the pixel data only contains {} "
+            "frame(s)".format(index, nr_frames)
+        )
+    index %= nr_frames
+
+    # The index is only valid for the element it was built from
+    frames = None
+    cached = getattr(ds, '_frame_index', None)
+    if cached and cached[0] is elem and cached[1] == nr_frames:
+        frames = cached[2]
+    is_cached = frames is not None
+
+    extended_offsets = None
+    has_eot = 'ExtendedOffsetTable' in ds
+    if not is_cached and has_eot and 'ExtendedOffsetTableLengths' in ds:
+        extended_offsets = (
+            ds.ExtendedOffsetTable, ds.ExtendedOffsetTableLengths
+        )
+
+    if isinstance(elem, tuple) and elem.value is None and elem.length:
+        # Deferred value: read only the item tags and the frame
+        from pydicom.filereader import _deferred_file
+
+        with _deferred_file(ds.fileobj_type, ds.filename, ds.timestamp) as fp:
+            fp.seek(elem.value_tell)
+            if frames is None:
+                frames = get_frame_index(fp, nr_frames, extended_offsets)
+
+            fragments = frames[index] if index < len(frames) else ()
+            if fragments:
+                start = fragments[0][0]
+                fp.seek(elem.value_tell + start)
+                data = fp.read(fragments[-1][0] + fragments[-1][1] - start)
+    else:
+        value = elem.value or b''
+        if frames is None:
+            frames = get_frame_index(
+                BytesIO(value), nr_frames, extended_offsets
+            )
+
+        fragments = frames[index] if index < len(frames) else ()
+        if fragments:
+            start = fragments[0][0]
+            data = memoryview(value)[start:]
+
+    if not is_cached:
+        ds._frame_index = (elem, nr_frames, frames)
+
+    if not fragments:
+        raise ValueError(
+            "The encapsulated pixel data doesn't contain frame {}"
+            .format(index)
+        )
+
+    frame = b''.join(
+        [data[offset - start:offset - start + length]
+         for offset, length in fragments]
+    )
+    if len(frame) != sum([length for _, length in fragments]):
+        raise ValueError(
+            "The length of the pixel data in the dataset is too short to "
+            "contain frame {}".format(index)
+        )
+
+    return frame
+
+
 def get_expected_length(ds, unit='bytes'):
     """Return the expected length (in terms of bytes or pixels) of the *Pixel
     Data*.
@@ -838,6 +1049,69 @@ def get_image_pixel_ids(ds):
     return {kw: id(getattr(ds, kw, None)) for kw in keywords}
 
 
+def _get_output_array(out, dtype, nr_items):
+    """Return `out` as a 1D view after checking it can be used as the output
+    array for the pixel data.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    out : numpy.ndarray
+        The array to check.
+    dtype : numpy.dtype or None
+        The dtype of the pixel data. The dtype of `out` must have the same
+        kind and item size, but may have a different byte order. If ``None``
+        then `out` may have any dtype and `nr_items` is in bytes.
+    nr_items : int
+        The number of items in the pixel data.
+
+    Returns
+    -------
+    numpy.ndarray
+        A 1D view of `out`.
+
+    Raises
+    ------
+    TypeError
+        If `out` isn't a :class:`numpy.ndarray`.
+    ValueError
+        If `out` has the wrong dtype or size, isn't C-contiguous or isn't
+        writeable.
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError(
+            "'out' must be a numpy ndarray, not '{}'"
+            .format(type(out).__name__)
+        )
+
+    if dtype is None:
+        size, unit = out.nbytes, 'bytes'
+    else:
+        size, unit = out.size, 'items'
+        dtype = np.dtype(dtype)
+        if (out.dtype.kind, out.dtype.itemsize) != (dtype.kind,
+                                                    dtype.itemsize):
+            raise ValueError(
+                "The dtype of 'out' ({}) doesn't match the dtype of the "
+                "pixel data ({})".format(out.dtype, dtype)
+            )
+
+    if size != nr_items:
+        raise ValueError(
+            "The size of 'out' ({0} {2}) doesn't match the size of the pixel "
+            "data ({1} {2})".format(size, nr_items, unit)
+        )
+
+    if not out.flags.c_contiguous:
+        raise ValueError("'out' must be a C-contiguous array")
+
+    if not out.flags.writeable:
+        raise ValueError("'out' must be a writeable array")
+
+    return out.reshape(-1)
+
+
 def pixel_dtype(ds, as_float=False):
     """Return a :class:`numpy.dtype` for the pixel data in `ds`.
 
@@ -939,9 +1213,13 @@ def pixel_dtype(ds, as_float=False):
     return dtype
 
 
-def reshape_pixel_array(ds, arr):
+def reshape_pixel_array(ds, arr, nr_frames=None):
     """Return a reshaped :class:`numpy.ndarray` `arr`.
 
+    .. versionchanged:: 2.0
+
+        Added the `nr_frames` keyword parameter.
+
     +------------------------------------------+-----------+----------+
     | Element                                  | Supported |          |
     +-------------+---------------------+------+ values    |          |
@@ -996,6 +1274,10 @@ def reshape_pixel_array(ds, arr):
         corresponding to the data in `arr`.
     arr : numpy.ndarray
         The 1D array containing the pixel data.
+    nr_frames : int, optional
+        If used then reshape `arr` as if it contained `nr_frames` frames
+        rather than the value of (0028,0008) *Number of Frames*, such as when
+        `arr` contains a single frame of multi-frame pixel data.
 
     Returns
     -------
@@ -1018,7 +1300,8 @@ def reshape_pixel_array(ds, arr):
     if not HAVE_NP:
         raise ImportError("Numpy is required to reshape the pixel array.")
 
-    nr_frames = getattr(ds, 'NumberOfFrames', 1)
+    if nr_frames is None:
+        nr_frames = getattr(ds, 'NumberOfFrames', 1)
     nr_samples = ds.SamplesPerPixel
 
     if nr_frames < 1:
@@ -1,17 +1,62 @@
 # Copyright 2008-2019 pydicom authors. See LICENSE file for details.
 # -*- coding: utf-8 -*-
-"""Access code dictionary information"""
+"""Access code dictionary information
+
+.. versionchanged:: 2.0
+
+    The concept and CID dictionaries are loaded when they're first used
+    rather than when the module is imported.
+"""
 
 from itertools import chain
 import inspect
+import threading
 
+from pydicom.misc import lazy_attributes
 from pydicom.sr.coding import Code
-from pydicom.sr._concepts_dict import concepts
-from pydicom.sr._cid_dict import name_for_cid, cid_concepts
 
 
+# The dictionaries are empty until they're first used, when they're filled
+#   by _load_concepts() and _load_cids()
+concepts = {}
+name_for_cid = {}
+cid_concepts = {}
 # Reverse lookup for cid names
-cid_for_name = {v: k for k, v in name_for_cid.items()}
+cid_for_name = {}
+
+_concepts_loaded = False
+_cids_loaded = False
+_load_lock = threading.Lock()
+
+
+def _load_concepts():
+    """Load the concepts dictionary if not already loaded."""
+    global _concepts_loaded
+
+    with _load_lock:
+        if _concepts_loaded:
+            return
+
+        from pydicom.sr._concepts_dict import concepts as _concepts
+
+        concepts.update(_concepts)
+        _concepts_loaded = True
+
+
+def _load_cids():
+    """Load the CID dictionaries if not already loaded."""
+    global _cids_loaded
+
+    with _load_lock:
+        if _cids_loaded:
+            return
+
+        from pydicom.sr import _cid_dict
+
+        name_for_cid.update(_cid_dict.name_for_cid)
+        cid_concepts.update(_cid_dict.cid_concepts)
+        cid_for_name.update({v: k for k, v in name_for_cid.items()})
+        _cids_loaded = True
 
 
 def _filtered(allnames, filters):
@@ -63,6 +108,10 @@ class _CID_Dict:
         return alldir
 
     def __getattr__(self, name):
+        if not (_cids_loaded and _concepts_loaded):
+            _load_cids()
+            _load_concepts()
+
         matches = [
             scheme
             for scheme, keywords in cid_concepts[self.cid].items()
@@ -140,6 +189,9 @@ class _CID_Dict:
             The matching SR keywords. If no filters are
             used then all keywords are returned.
         """
+        if not _cids_loaded:
+            _load_cids()
+
         allnames = set(chain(*cid_concepts[self.cid].values()))
         return _filtered(allnames, filters)
 
@@ -175,6 +227,7 @@ class _CodesDict:
         if scheme:
             self._dict = {scheme: concepts[scheme]}
         else:
+            # Filled in place when the concepts are loaded
             self._dict = concepts
 
     def __dir__(self):
@@ -209,6 +262,10 @@ class _CodesDict:
             if not self.scheme:
                 return _CID_Dict(int(name[3:]))
             raise AttributeError("Cannot call cid selector on scheme dict")
+
+        if not _concepts_loaded:
+            _load_concepts()
+
         if name in self._dict.keys():
             # Return concepts limited only the specified scheme designator
             return _CodesDict(scheme=name)
@@ -252,10 +309,16 @@ class _CodesDict:
             used then all keywords are returned.
 
         """
+        if not _concepts_loaded:
+            _load_concepts()
+
         allnames = set(chain(*(x.keys() for x in self._dict.values())))
         return _filtered(allnames, filters)
 
     def schemes(self):
+        if not _concepts_loaded:
+            _load_concepts()
+
         return self._dict.keys()
 
     def trait_names(self):
@@ -269,3 +332,10 @@ class _CodesDict:
 
 
 codes = _CodesDict()
+
+lazy_attributes(__name__, {
+    'concepts': _load_concepts,
+    'name_for_cid': _load_cids,
+    'cid_concepts': _load_cids,
+    'cid_for_name': _load_cids,
+})
@@ -1,7 +1,30 @@
 from collections import namedtuple
+import threading
 
 from pydicom.dataset import Dataset
-from pydicom.sr._snomed_dict import mapping as snomed_mapping
+from pydicom.misc import lazy_attributes
+
+
+# The SNOMED mapping is empty until it's first used, when it's filled by
+#   _load_snomed_mapping()
+snomed_mapping = {}
+_snomed_mapping_loaded = False
+_load_lock = threading.Lock()
+
+
+def _load_snomed_mapping():
+    """Load the SNOMED mapping if not already loaded."""
+    global _snomed_mapping_loaded
+
+    with _load_lock:
+        if _snomed_mapping_loaded:
+            return
+
+        from pydicom.sr._snomed_dict import mapping
+
+        snomed_mapping.update(mapping)
+        _snomed_mapping_loaded = True
+
 
 _CodeBase = namedtuple(
     "Code", ("value", "scheme_designator", "meaning", "scheme_version")
@@ -18,6 +41,11 @@ class Code(_CodeBase):
     """
 
     def __eq__(self, other):
+        if not _snomed_mapping_loaded and "SRT" in (
+            self.scheme_designator, other.scheme_designator
+        ):
+            _load_snomed_mapping()
+
         if self.scheme_designator == "SRT":
             self_mapped = Code(
                 value=snomed_mapping["SRT"][self.value],
@@ -54,3 +82,6 @@ class Code(_CodeBase):
 
     def __ne__(self, other):
         return not (self == other)
+
+
+lazy_attributes(__name__, {'snomed_mapping': _load_snomed_mapping})
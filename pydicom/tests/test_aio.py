@@ -0,0 +1,144 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Unit tests for the pydicom.aio module."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+
+import pytest
+
+from pydicom.aio import dcmread_async, scan_directory_async
+from pydicom.data import get_testdata_file
+from pydicom.errors import InvalidDicomError
+from pydicom.filereader import dcmread, close_deferred_handles
+
+
+CT_NAME = get_testdata_file("CT_small.dcm")
+MR_NAME = get_testdata_file("MR_small.dcm")
+
+
+def run(coro):
+    """Run the coroutine `coro` in a new event loop and return the result."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def collect(scan):
+    """Return a list of the items from the asynchronous iterator `scan`."""
+    results = []
+    async for item in scan:
+        results.append(item)
+
+    return results
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    """Return a directory containing DICOM and non-DICOM files."""
+    shutil.copyfile(CT_NAME, str(tmp_path / "a.dcm"))
+    shutil.copyfile(MR_NAME, str(tmp_path / "b.dcm"))
+    (tmp_path / "c.txt").write_bytes(b"not a DICOM file")
+    (tmp_path / "sub").mkdir()
+    shutil.copyfile(MR_NAME, str(tmp_path / "sub" / "d.dcm"))
+    yield tmp_path
+    close_deferred_handles()
+
+
+class TestDcmreadAsync:
+    """Tests for dcmread_async()."""
+
+    def test_read(self):
+        """Test the result matches dcmread()."""
+        ds = run(dcmread_async(CT_NAME))
+        ref = dcmread(CT_NAME)
+        assert CT_NAME == ds.filename
+        assert ref.PixelData == ds.PixelData
+        for elem in ref:
+            assert elem.value == ds[elem.tag].value
+
+    def test_kwargs(self):
+        """Test the dcmread() parameters are used."""
+        ds = run(dcmread_async(
+            CT_NAME, stop_before_pixels=True, specific_tags=['PatientName']
+        ))
+        assert 'PatientName' in ds
+        assert 'PixelData' not in ds
+        assert 'StudyDate' not in ds
+
+    def test_deferred(self):
+        """Test deferred values are read from the original file."""
+        ds = run(dcmread_async(CT_NAME, defer_size=1024))
+        assert dcmread(CT_NAME).PixelData == ds.PixelData
+        close_deferred_handles()
+
+    def test_executor_and_semaphore(self):
+        """Test reading with an executor and semaphore."""
+        async def read_all():
+            semaphore = asyncio.Semaphore(2)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                return await asyncio.gather(*[
+                    dcmread_async(
+                        name, executor=executor, semaphore=semaphore
+                    ) for name in [CT_NAME, MR_NAME, CT_NAME]
+                ])
+
+        datasets = run(read_all())
+        assert ['CT', 'MR', 'CT'] == [ds.Modality for ds in datasets]
+
+    def test_invalid_file_raises(self, tmp_path):
+        """Test an exception while reading is raised."""
+        path = tmp_path / "invalid.dcm"
+        path.write_bytes(b"not a DICOM file")
+        with pytest.raises(InvalidDicomError):
+            run(dcmread_async(path))
+
+
+class TestScanDirectoryAsync:
+    """Tests for scan_directory_async()."""
+
+    def test_scan(self, scan_dir):
+        """Test scanning a directory and its subdirectories."""
+        results = run(collect(scan_directory_async(str(scan_dir))))
+        names = [os.path.relpath(p, str(scan_dir)) for p, _ in results]
+        assert ['a.dcm', 'b.dcm', 'c.txt', os.path.join('sub', 'd.dcm')] == (
+            names
+        )
+        assert 'CT' == results[0][1].Modality
+        assert 'MR' == results[1][1].Modality
+        assert isinstance(results[2][1], InvalidDicomError)
+        assert 'MR' == results[3][1].Modality
+
+    def test_pattern_and_recursive(self, scan_dir):
+        """Test only scanning matching files in the top directory."""
+        scan = scan_directory_async(
+            scan_dir, pattern='*.dcm', recursive=False, concurrency=1,
+            stop_before_pixels=True
+        )
+        results = run(collect(scan))
+        assert ['a.dcm', 'b.dcm'] == [os.path.basename(p) for p, _ in results]
+        assert all('PixelData' not in ds for _, ds in results)
+
+    def test_concurrency_bounded(self, scan_dir):
+        """Test the number of reads in progress is bounded."""
+        async def first():
+            scan = scan_directory_async(scan_dir, concurrency=2)
+            result = await scan.__anext__()
+            assert 1 == len(scan._pending)
+            await scan.aclose()
+            with pytest.raises(StopAsyncIteration):
+                await scan.__anext__()
+
+            return result
+
+        path, ds = run(first())
+        assert 'a.dcm' == os.path.basename(path)
+
+    def test_invalid_concurrency_raises(self, scan_dir):
+        """Test an invalid concurrency raises an exception."""
+        msg = r"'concurrency' must be at least 1"
+        with pytest.raises(ValueError, match=msg):
+            scan_directory_async(scan_dir, concurrency=0)
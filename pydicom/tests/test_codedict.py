@@ -1,5 +1,6 @@
 import pytest
 
+from pydicom.sr import codedict, coding
 from pydicom.sr.codedict import codes
 from pydicom.sr.coding import Code
 
@@ -171,3 +172,52 @@ class TestCodeDict:
     def test_not_contained(self):
         c = Code("130290", "DCM", "Median")
         assert c not in codes.cid244
+
+
+class TestLazyLoading:
+    """Tests for loading the dictionaries on first use."""
+    @pytest.fixture
+    def unloaded(self, monkeypatch):
+        """Reset the codedict and coding modules to their state before
+        loading.
+        """
+        for name in ('name_for_cid', 'cid_concepts', 'cid_for_name'):
+            monkeypatch.setattr(codedict, name, {})
+        concepts = {}
+        monkeypatch.setattr(codedict, 'concepts', concepts)
+        monkeypatch.setattr(codes, '_dict', concepts)
+        monkeypatch.setattr(codedict, '_concepts_loaded', False)
+        monkeypatch.setattr(codedict, '_cids_loaded', False)
+        monkeypatch.setattr(coding, 'snomed_mapping', {})
+        monkeypatch.setattr(coding, '_snomed_mapping_loaded', False)
+
+    def test_scheme(self, unloaded):
+        """Test only the concepts are loaded by a scheme lookup."""
+        assert {} == codedict.__dict__['concepts']
+        assert Code("121139", "DCM", "Modality") == codes.DCM.Modality
+        assert codedict._concepts_loaded
+        assert not codedict._cids_loaded
+        assert not coding._snomed_mapping_loaded
+        assert 'SCT' in codes.schemes()
+
+    def test_cid(self, unloaded):
+        """Test the dictionaries are loaded by a CID lookup."""
+        assert Code("121006", "DCM", "Person") == codes.cid270.Person
+        assert codedict._concepts_loaded
+        assert codedict._cids_loaded
+        assert 'Person' in codes.cid270.dir()
+
+    def test_module_attribute(self, unloaded):
+        """Test the dictionaries are loaded by module attribute access."""
+        assert 270 == codedict.cid_for_name['ObserverType']
+        assert codedict._cids_loaded
+        assert not codedict._concepts_loaded
+        assert 'DCM' in codedict.concepts
+        assert codedict._concepts_loaded
+
+    def test_snomed_mapping(self, unloaded):
+        """Test the SNOMED mapping is loaded when comparing SRT codes."""
+        assert Code("24028007", "SCT", "Right") == Code("24028007", "SCT", "")
+        assert not coding._snomed_mapping_loaded
+        assert Code("10200004", "SCT", "Liver") == Code("T-62000", "SRT", "")
+        assert coding._snomed_mapping_loaded
@@ -4,6 +4,7 @@
 
 # Many tests of DataElement class are implied in test_dataset also
 
+import pickle
 import sys
 
 import pytest
@@ -266,6 +267,32 @@ class TestDataElement:
         elem = DataElement(0x60023000, 'OB', b'\x00')
         assert 'Overlay Data' in elem.__str__()
 
+    def test_slots(self):
+        """Test the standard attributes are stored in slots."""
+        elem = DataElement(0x00100010, 'PN', 'ANON', file_value_tell=10)
+        elem.private_creator = 'TEST'
+        assert {} == elem.__dict__
+        assert 10 == elem.file_tell
+        assert not elem.is_undefined_length
+
+        # Other attributes can still be set
+        elem.showVR = False
+        elem.foo = 'bar'
+        assert {'showVR': False, 'foo': 'bar'} == elem.__dict__
+        assert DataElement.showVR
+
+    def test_pickle(self):
+        """Test pickling and unpickling an element."""
+        elem = DataElement(0x00100010, 'PN', 'ANON', file_value_tell=10)
+        elem.private_creator = 'TEST'
+        elem.showVR = False
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            new = pickle.loads(pickle.dumps(elem, protocol))
+            assert elem == new
+            assert 10 == new.file_tell
+            assert 'TEST' == new.private_creator
+            assert not new.showVR
+
     def test_str_no_vr(self):
         """Test DataElement.__str__ output with no VR"""
         elem = DataElement(0x00100010, 'PN', 'ANON')
@@ -7,11 +7,13 @@ import pydicom
 from pydicom.data import get_testdata_file
 from pydicom.dataelem import DataElement, RawDataElement
 from pydicom.dataset import (
-    Dataset, FileDataset, validate_file_meta, FileMetaDataset
+    Dataset, FileDataset, validate_file_meta, FileMetaDataset, compile_getter
 )
 from pydicom.encaps import encapsulate
 from pydicom import dcmread
 from pydicom.filebase import DicomBytesIO
+from pydicom.filereader import read_dataset
+from pydicom.filewriter import write_dataset
 from pydicom.overlay_data_handlers import numpy_handler as NP_HANDLER
 from pydicom.pixel_data_handlers.util import get_image_pixel_ids
 from pydicom.sequence import Sequence
@@ -218,6 +220,135 @@ class TestDataset:
         with pytest.raises(KeyError):
             self.ds.popitem()
 
+    def test_sorted_tags(self):
+        """Test the sorted tag list is kept up to date."""
+        ds = Dataset()
+        ds.PatientName = 'Test'
+        ds.add_new(0x00080018, 'UI', '1.2.3')
+        ds[0x00200013] = DataElement(0x00200013, 'IS', 1)
+        ds.setdefault(0x00100020, '12345')
+        ds.update({
+            'StudyDate': '20200101',
+            0x00100040: DataElement(0x00100040, 'CS', 'F')
+        })
+        tags = [0x00080018, 0x00080020, 0x00100010, 0x00100020, 0x00100040,
+                0x00200013]
+        assert tags == ds._sorted_tags()
+        assert tags == [elem.tag for elem in ds]
+        assert tags == [elem.tag for elem in ds.elements()]
+
+        del ds.PatientName
+        del ds[0x00100020]
+        del ds[(0x0020, 0x0013)]
+        ds.pop('StudyDate')
+        tags = [0x00080018, 0x00100040]
+        assert tags == ds._sorted_tags()
+
+        tag, elem = ds.popitem()
+        assert [0x00080018] == ds._sorted_tags()
+        ds.clear()
+        assert [] == ds._sorted_tags()
+        assert [] == list(ds)
+
+    def test_sorted_tags_slice_delete(self):
+        """Test the sorted tag list after deleting a slice."""
+        ds = Dataset()
+        ds.CommandGroupLength = 100
+        ds.SOPInstanceUID = '1.2.3'
+        ds.PatientName = 'CITIZEN^Jan'
+        ds.PatientID = '12345'
+        del ds[:]
+        assert [] == ds._sorted_tags()
+
+        ds.CommandGroupLength = 100
+        ds.SOPInstanceUID = '1.2.3'
+        ds.PatientName = 'CITIZEN^Jan'
+        del ds[0x00080000:0x00100020]
+        assert [0x00000000] == ds._sorted_tags()
+
+    def test_sorted_tags_from_dict(self):
+        """Test the sorted tag list for a dataset created from a dict."""
+        elements = {
+            Tag(0x00100020): DataElement(0x00100020, 'LO', '12345'),
+            Tag(0x00080018): DataElement(0x00080018, 'UI', '1.2.3'),
+        }
+        ds = Dataset(elements)
+        assert [0x00080018, 0x00100020] == [elem.tag for elem in ds]
+
+        # Changes to the dict itself are picked up
+        elements[0x00100010] = DataElement(0x00100010, 'PN', 'Test')
+        assert [0x00080018, 0x00100010, 0x00100020] == ds._sorted_tags()
+
+        # Datasets sharing the same dict stay in sync
+        other = Dataset(ds)
+        del other.PatientID
+        ds.PatientSex = 'F'
+        assert [0x00080018, 0x00100010, 0x00100040] == other._sorted_tags()
+
+    def test_sorted_tags_dict_replaced(self):
+        """Test the sorted tags are rebuilt if an element in the dict is
+        replaced directly."""
+        ds = Dataset()
+        ds.SOPInstanceUID = '1.2.3'
+        ds.PatientName = 'Test'
+        ds.PatientID = '12345'
+        elem = ds._dict.pop(0x00100010)
+        elem.tag = Tag(0x00100040)
+        ds._dict[elem.tag] = elem
+        assert [0x00080018, 0x00100020, 0x00100040] == [e.tag for e in ds]
+        assert [0x00080018, 0x00100020, 0x00100040] == ds._sorted_tags()
+
+        elem = ds._dict.pop(0x00080018)
+        elem.tag = Tag(0x00080016)
+        ds._dict[elem.tag] = elem
+        tags = [0x00080016, 0x00100020, 0x00100040]
+        assert tags == [e.tag for e in ds.elements()]
+
+        ds._dict.pop(0x00100020)
+        ds._dict[Tag(0x00100030)] = DataElement(0x00100030, 'DA', '20000101')
+        walked = []
+        ds.walk(lambda ds, elem: walked.append(elem.tag))
+        assert [0x00080016, 0x00100030, 0x00100040] == walked
+
+        ds._dict.pop(0x00100030)
+        ds._dict[Tag(0x00100010)] = DataElement(0x00100010, 'PN', 'Test')
+        ds.is_little_endian = True
+        ds.is_implicit_VR = True
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        fp.is_implicit_VR = True
+        write_dataset(fp, ds)
+        fp.seek(0)
+        ds_read = read_dataset(fp, True, True)
+        assert [0x00080016, 0x00100010, 0x00100040] == list(ds_read.keys())
+
+    def test_iter_deleting_later_element(self):
+        """Test deleting a later element while iterating."""
+        ds = Dataset()
+        ds.PatientName = 'Test'
+        ds.PatientID = '12345'
+        ds.PatientSex = 'F'
+        tags = []
+        for elem in ds:
+            tags.append(elem.tag)
+            if 'PatientID' in ds:
+                del ds.PatientID
+
+        assert [0x00100010, 0x00100040] == tags
+        assert [0x00100010, 0x00100040] == ds._sorted_tags()
+
+    def test_iter_while_deleting(self):
+        """Test deleting elements while iterating."""
+        ds = Dataset()
+        ds.PatientName = 'Test'
+        ds.PatientID = '12345'
+        ds.PatientSex = 'F'
+        for elem in ds:
+            del ds[elem.tag]
+
+        assert 0 == len(ds)
+        assert [] == ds._sorted_tags()
+
     def test_setdefault(self):
         elem = self.ds.setdefault(0x300a00b2, 'foo')
         assert 'unit001' == elem.value
@@ -1834,3 +1965,86 @@ class TestFileMeta:
         assert shown.startswith("(0010, 0010) Patient's Name")
 
         pydicom.config.show_file_meta = orig_show
+
+
+class TestCompileGetter:
+    """Tests for dataset.compile_getter()."""
+    def setup(self):
+        """Setup the tests."""
+        self.ds = dcmread(get_testdata_file('rtplan.dcm'))
+
+    def test_single_path(self):
+        """Test a getter for a single path returns the value."""
+        getter = compile_getter('PatientID')
+        assert 'id00001' == getter(self.ds)
+        assert compile_getter is pydicom.compile_getter
+
+    def test_multiple_paths(self):
+        """Test a getter for a list of paths returns a tuple."""
+        getter = compile_getter([
+            'PatientID',
+            'BeamSequence[0].BeamName',
+            'BeamSequence[-1].ControlPointSequence[0].GantryAngle',
+            'FractionGroupSequence[0].ReferencedBeamSequence[0].BeamMeterset',
+            'BeamSequence[0].300A00B2',
+        ])
+        assert (
+            'id00001', 'Field 1', 0.0, 116.0036697, 'unit001'
+        ) == getter(self.ds)
+        assert () == compile_getter([])(self.ds)
+
+    def test_matches_attribute_access(self):
+        """Test the values match those from attribute access."""
+        ds = dcmread(get_testdata_file('CT_small.dcm'))
+        getter = compile_getter(
+            ['ImagePositionPatient', 'ImagePositionPatient[2]', 'Rows']
+        )
+        values = getter(ds)
+        assert ds.ImagePositionPatient == values[0]
+        assert ds.ImagePositionPatient[2] == values[1]
+        assert ds.Rows == values[2]
+
+    def test_missing(self):
+        """Test the default is returned for missing elements."""
+        getter = compile_getter([
+            'PatientComments',
+            'BeamSequence[1].BeamName',
+            'ReferencedSeriesSequence[0].SeriesInstanceUID',
+            'PatientID[0]',
+        ])
+        assert (None, None, None, 'i') == getter(self.ds)
+
+        getter = compile_getter('BeamSequence[5].BeamName', default='')
+        assert '' == getter(self.ds)
+        assert '' == getter(Dataset())
+
+        ds = Dataset()
+        ds.BeamSequence = []
+        ds.PatientName = None
+        getter = compile_getter(['BeamSequence[0].BeamName', 'PatientName'])
+        assert (None, ds.PatientName) == getter(ds)
+
+    def test_raw_elements(self):
+        """Test raw elements are converted and stored in the dataset."""
+        elem = self.ds.get_item('PatientID')
+        assert isinstance(elem, RawDataElement)
+        assert 'id00001' == compile_getter('PatientID')(self.ds)
+        assert isinstance(self.ds.get_item('PatientID'), DataElement)
+
+    def test_invalid_path_raises(self):
+        """Test invalid paths raise an exception."""
+        msg = r"'Unknown' is not a valid int or DICOM keyword"
+        with pytest.raises(ValueError, match=msg):
+            compile_getter('Unknown')
+
+        msg = r"Invalid element path 'BeamSequence\[a\].BeamName'"
+        with pytest.raises(ValueError, match=msg):
+            compile_getter(['PatientID', 'BeamSequence[a].BeamName'])
+
+        msg = r"the sequence 'BeamSequence' requires an item index"
+        with pytest.raises(ValueError, match=msg):
+            compile_getter('BeamSequence.BeamName')
+
+        msg = r"'PatientID' is not a sequence"
+        with pytest.raises(ValueError, match=msg):
+            compile_getter('PatientID[0].BeamName')
@@ -3,14 +3,15 @@
 
 import pytest
 
-from pydicom import DataElement
+from pydicom import DataElement, datadict
 from pydicom.dataset import Dataset
 from pydicom.datadict import (keyword_for_tag, dictionary_description,
                               dictionary_has_tag, repeater_has_tag,
                               repeater_has_keyword, get_private_entry,
                               dictionary_VM, private_dictionary_VR,
                               private_dictionary_VM, add_private_dict_entries,
-                              add_private_dict_entry)
+                              add_private_dict_entry, dictionary_VR,
+                              tag_for_keyword)
 from pydicom.datadict import add_dict_entry, add_dict_entries
 
 
@@ -149,3 +150,62 @@ class TestDict:
     def test_private_dict_VM(self):
         """Test private_dictionary_VM"""
         assert private_dictionary_VM(0x00090000, 'ACUSON') == '1'
+
+
+class TestLazyLoading:
+    """Tests for loading the dictionaries on first use."""
+    @pytest.fixture
+    def unloaded(self, monkeypatch):
+        """Reset the datadict module to its state before loading."""
+        for name in ('DicomDictionary', 'RepeatersDictionary', 'masks',
+                     'keyword_dict', 'private_dictionaries'):
+            monkeypatch.setattr(datadict, name, {})
+        monkeypatch.setattr(datadict, 'REPEATER_KEYWORDS', [])
+        monkeypatch.setattr(datadict, '_dicom_dictionary_loaded', False)
+        monkeypatch.setattr(datadict, '_private_dictionaries_loaded', False)
+
+    def test_tag_for_keyword(self, unloaded):
+        """Test the dictionary is loaded by a keyword lookup."""
+        assert {} == datadict.__dict__['keyword_dict']
+        assert 0x00100010 == tag_for_keyword('PatientName')
+        assert datadict._dicom_dictionary_loaded
+        assert not datadict._private_dictionaries_loaded
+        assert tag_for_keyword('Unknown') is None
+
+    def test_get_entry(self, unloaded):
+        """Test the dictionary is loaded by a tag lookup."""
+        assert 'PN' == dictionary_VR(0x00100010)
+        assert datadict._dicom_dictionary_loaded
+        assert 'Overlay Rows' == dictionary_description(0x60100010)
+
+    def test_repeaters(self, unloaded):
+        """Test the dictionary is loaded by a repeaters lookup."""
+        assert repeater_has_keyword('OverlayData')
+        assert datadict._dicom_dictionary_loaded
+
+    def test_module_attribute(self, unloaded):
+        """Test the dictionaries are loaded by module attribute access."""
+        assert 0x00100010 in datadict.DicomDictionary
+        assert datadict._dicom_dictionary_loaded
+        assert not datadict._private_dictionaries_loaded
+
+        assert 'ACUSON' in datadict.private_dictionaries
+        assert datadict._private_dictionaries_loaded
+
+    def test_private_dictionaries(self, unloaded):
+        """Test the private dictionaries are loaded separately."""
+        entry = get_private_entry(0x00091000, 'ACUSON')
+        assert not datadict._dicom_dictionary_loaded
+        assert datadict._private_dictionaries_loaded
+        assert 'IS' == entry[0]
+
+    def test_added_entries_kept(self, unloaded):
+        """Test entries added before loading aren't overwritten."""
+        datadict.__dict__['DicomDictionary'][0x00100010] = (
+            'LO', '1', 'Test Name', '', 'PatientName'
+        )
+        private = datadict.__dict__['private_dictionaries']
+        private['ACUSON'] = {'0009xx00': ('LO', '1', 'Test Entry', '')}
+        assert 'LO' == dictionary_VR(0x00100010)
+        assert 'LO' == get_private_entry(0x00091000, 'ACUSON')[0]
+        assert 'IS' == get_private_entry(0x00091001, 'ACUSON')[0]
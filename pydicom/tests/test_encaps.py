@@ -1,12 +1,16 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Test for encaps.py"""
 
+from io import BytesIO
+from struct import unpack
+
 import pytest
 
-from pydicom import dcmread
+from pydicom import dcmread, encaps
 from pydicom.data import get_testdata_file
 from pydicom.encaps import (
     generate_pixel_data_fragment,
+    get_frame_index,
     get_frame_offsets,
     get_nr_fragments,
     generate_pixel_data_frame,
@@ -16,7 +20,8 @@ from pydicom.encaps import (
     read_item,
     fragment_frame,
     itemise_frame,
-    encapsulate
+    encapsulate,
+    encapsulate_extended
 )
 from pydicom.filebase import DicomBytesIO
 
@@ -741,6 +746,203 @@ class TestGeneratePixelData:
         pytest.raises(StopIteration, next, frames)
 
 
+class TestGeneratePixelDataExtendedOffsets:
+    """Test encaps.generate_pixel_data with an Extended Offset Table."""
+    def test_frames(self):
+        """Test the frames are located using the offsets."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        frames = decode_data_sequence(ds.PixelData)
+        data, eot, eot_lengths = encapsulate_extended(frames)
+        for frame, ref in zip(
+            generate_pixel_data(data, extended_offsets=(eot, eot_lengths)),
+            frames
+        ):
+            assert (ref, ) == frame
+
+        test_frames = generate_pixel_data_frame(
+            data, extended_offsets=(eot, eot_lengths)
+        )
+        assert frames == list(test_frames)
+
+    def test_odd_length_frames(self):
+        """Test the frame lengths exclude the padding."""
+        frames = [b'\x01\x02\x03', b'\x04\x05\x06']
+        data, eot, eot_lengths = encapsulate_extended(frames)
+        test_frames = generate_pixel_data_frame(
+            data, extended_offsets=(eot, eot_lengths)
+        )
+        assert frames == list(test_frames)
+
+
+class TestGetFrameIndex:
+    """Test encaps.get_frame_index"""
+    def test_bad_tag(self):
+        """Test raises exception if no item tag."""
+        # (fffe,e100)
+        fp = BytesIO(b'\xFE\xFF\x00\xE1\x08\x00\x00\x00'
+                     b'\x01\x02\x03\x04\x05\x06\x07\x08')
+        msg = r"Unexpected tag '\(fffe, e100\)' when parsing the Basic"
+        with pytest.raises(ValueError, match=msg):
+            get_frame_index(fp)
+
+    def test_bad_length_multiple(self):
+        """Test raises exception if the BOT length is not a multiple of 4."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x0A\x00\x00\x00'
+                     b'\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0A')
+        with pytest.raises(ValueError, match="multiple of 4"):
+            get_frame_index(fp)
+
+    def test_item_undefined_length(self):
+        """Test exception raised if item length undefined."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\xFF\xFF\xFF\xFF\x00\x00\x00\x01')
+        with pytest.raises(ValueError, match="Undefined item length at "
+                                             "offset 12"):
+            get_frame_index(fp)
+
+    def test_item_bad_tag(self):
+        """Test exception raised if unexpected fragment tag."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\x10\x00\x10\x00\x04\x00\x00\x00\x01\x00\x00\x00')
+        with pytest.raises(ValueError, match=r"Unexpected tag '\(0010, "
+                                             r"0010\)' at offset 8"):
+            get_frame_index(fp)
+
+    def test_empty_bot_single_fragment(self):
+        """Test a single fragment and a sequence delimiter."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\xDD\xE0\x00\x00\x00\x00')
+        assert [((16, 4), )] == get_frame_index(fp)
+
+    def test_empty_bot_one_to_one(self):
+        """Test one fragment per frame without a BOT."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x02\x00\x00\x00\x02\x00')
+        assert [((16, 4), ), ((28, 2), )] == get_frame_index(fp, 2)
+
+    def test_empty_bot_single_frame(self):
+        """Test multiple fragments in a single frame without a BOT."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x02\x00\x00\x00\x02\x00')
+        assert [((16, 4), (28, 2))] == get_frame_index(fp, 1)
+
+    def test_empty_bot_no_nr_frames_raises(self):
+        """Test multiple fragments without a BOT or number of frames."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x02\x00\x00\x00\x02\x00')
+        msg = r"`nr_frames` parameter is None"
+        with pytest.raises(ValueError, match=msg):
+            get_frame_index(fp)
+
+    def test_empty_bot_too_few_fragments(self):
+        """Test fewer fragments than frames without a BOT."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x02\x00\x00\x00\x02\x00')
+        msg = r"there are fewer fragments then frames"
+        with pytest.raises(ValueError, match=msg):
+            get_frame_index(fp, 3)
+
+    def test_empty_bot_multi_fragments_per_frame(self):
+        """Test the frame boundaries are found using the EOI marker."""
+        fp = BytesIO(
+            b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\xD9\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\xD9\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\xFF\xD9'
+        )
+        index = get_frame_index(fp, 3)
+        assert [
+            ((16, 4), (28, 4)), ((40, 4), (52, 4)), ((64, 4), )
+        ] == index
+
+    def test_empty_bot_missing_marker(self):
+        """Test a warning is issued if a frame boundary is missed."""
+        fp = BytesIO(
+            b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\xD9\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\xFF\x00\x00'
+        )
+        msg = r"one or more frame boundaries may have been missed"
+        with pytest.warns(UserWarning, match=msg):
+            index = get_frame_index(fp, 3)
+
+        assert 2 == len(index)
+
+    def test_bot_varied_ratio(self):
+        """Test a multi-frame image using the BOT."""
+        # 3 frames, 1st is 1 fragment, 2nd is 3 fragments, 3rd is 2 fragments
+        fp = BytesIO(b'\xFE\xFF\x00\xE0'
+                     b'\x0C\x00\x00\x00'
+                     b'\x00\x00\x00\x00'
+                     b'\x0E\x00\x00\x00'
+                     b'\x32\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x06\x00\x00\x00\x01\x00\x00\x00\x00\x01'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x02\x00\x00\x00\x02\x00'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x04\x00\x00\x00\x02\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x06\x00\x00\x00\x03\x00\x00\x00\x00\x02'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x04\x00\x00\x00\x03\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0'
+                     b'\x02\x00\x00\x00\x02\x04')
+        assert [
+            ((28, 6), ),
+            ((42, 2), (52, 4), (64, 6)),
+            ((78, 4), (90, 2)),
+        ] == get_frame_index(fp)
+
+    def test_offset_from_start(self):
+        """Test the offsets are from the position of `fp` when called."""
+        fp = BytesIO(b'\x00\x01\x02\x03'
+                     b'\xFE\xFF\x00\xE0\x00\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x04\x00\x00\x00\x01\x00\x00\x00'
+                     b'\xFE\xFF\x00\xE0\x02\x00\x00\x00\x02\x00')
+        fp.seek(4)
+        assert [((16, 4), ), ((28, 2), )] == get_frame_index(fp, 2)
+
+    def test_extended_offsets(self):
+        """Test using the Extended Offset Table."""
+        data, eot, eot_lengths = encapsulate_extended(
+            [b'\x01\x02\x03', b'\x04\x05', b'\x06\x07\x08\x09']
+        )
+        index = [((16, 3), ), ((28, 2), ), ((38, 4), )]
+        extended_offsets = (eot, eot_lengths)
+        assert index == get_frame_index(BytesIO(data), None, extended_offsets)
+        assert index == get_frame_index(
+            BytesIO(data), extended_offsets=([0, 12, 22], [3, 2, 4])
+        )
+
+    def test_extended_offsets_mismatch_raises(self):
+        """Test an invalid Extended Offset Table raises."""
+        fp = BytesIO(b'\xFE\xFF\x00\xE0\x00\x00\x00\x00')
+        msg = r"doesn't match the number of values in the Extended Offset"
+        with pytest.raises(ValueError, match=msg):
+            get_frame_index(fp, extended_offsets=([0, 12], [3]))
+
+    def test_matches_generate_pixel_data(self):
+        """Test the index matches the frames from generate_pixel_data."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        index = get_frame_index(BytesIO(ds.PixelData), ds.NumberOfFrames)
+        frames = generate_pixel_data(ds.PixelData, ds.NumberOfFrames)
+        for fragments, ref in zip(index, frames):
+            assert ref == tuple(
+                ds.PixelData[offset:offset + length]
+                for offset, length in fragments
+            )
+
+
 class TestDecodeDataSequence:
     """Test encaps.decode_data_sequence"""
     def test_empty_bot_single_fragment(self):
@@ -1199,3 +1401,49 @@ class TestEncapsulate:
             b'\xfe\xff\x00\xe0'  # Next item tag
             b'\xe6\x0e\x00\x00'  # Next item length
         )
+
+    def test_encapsulate_bot_too_large_raises(self, monkeypatch):
+        """Test encapsulating raises if the BOT offsets would overflow."""
+        class Item(bytes):
+            """An item that reports a length of 4 GB."""
+            def __len__(self):
+                return 2**32
+
+        def itemise_frame(frame, nr_fragments=1):
+            yield Item(frame)
+
+        monkeypatch.setattr(encaps, 'itemise_frame', itemise_frame)
+        msg = r"use encapsulate_extended\(\) to encapsulate the frames"
+        with pytest.raises(ValueError, match=msg):
+            encapsulate([b'\x00\x01', b'\x02\x03'])
+
+        # OK with no BOT values or only one frame
+        encapsulate([b'\x00\x01', b'\x02\x03'], has_bot=False)
+        encapsulate([b'\x00\x01'])
+
+
+class TestEncapsulateExtended:
+    """Test encaps.encapsulate_extended."""
+    def test_encapsulate(self):
+        """Test the encapsulated data and the Extended Offset Table."""
+        ds = dcmread(JP2K_10FRAME_NOBOT)
+        frames = decode_data_sequence(ds.PixelData)
+        data, eot, eot_lengths = encapsulate_extended(frames)
+
+        # BOT is empty
+        assert data == encapsulate(frames, has_bot=False)
+        assert 80 == len(eot)
+        assert 80 == len(eot_lengths)
+        offsets = unpack('<10Q', eot)
+        lengths = unpack('<10Q', eot_lengths)
+        assert [len(frame) for frame in frames] == list(lengths)
+        for offset, length, frame in zip(offsets, lengths, frames):
+            start = offset + 16
+            assert frame == data[start:start + length]
+
+    def test_no_frames(self):
+        """Test encapsulating no frames."""
+        data, eot, eot_lengths = encapsulate_extended([])
+        assert b'\xFE\xFF\x00\xE0\x00\x00\x00\x00' == data
+        assert b'' == eot
+        assert b'' == eot_lengths
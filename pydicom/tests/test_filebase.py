@@ -1,12 +1,17 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Test for filebase.py"""
 
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation
+import os
+import zlib
 
 import pytest
 
 from pydicom.data import get_testdata_files
-from pydicom.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom.filebase import (
+    DicomIO, DicomFileLike, DicomFile, DicomBytesIO, DicomMemoryMap,
+    DicomStreamReader, DicomInflateReader, DicomBuffer
+)
 from pydicom.tag import Tag
 
 
@@ -262,3 +267,191 @@ class TestDicomFile:
             assert not fp.parent.closed
             assert 'CT_small.dcm' in fp.name
             assert fp.read(2) == b'\x49\x49'
+
+
+class TestDicomMemoryMap:
+    """Test filebase.DicomMemoryMap class"""
+    def test_filename(self):
+        """Test mapping a file by name"""
+        with DicomMemoryMap(TEST_FILE) as fp:
+            assert 'CT_small.dcm' in fp.name
+            assert fp.read(2) == b'\x49\x49'
+            assert fp.tell() == 2
+            assert bytes(fp.view[:2]) == b'\x49\x49'
+            assert fp._fp.closed is False
+        assert fp._fp.closed
+
+    def test_file_object(self):
+        """Test mapping an open file doesn't close it"""
+        with open(TEST_FILE, 'rb') as f:
+            fp = DicomMemoryMap(f)
+            fp.close()
+            assert not f.closed
+            assert fp.read(2) == b'\x49\x49'
+
+    def test_seek(self):
+        """Test seeking is clamped to the end of the mapping"""
+        fp = DicomMemoryMap(TEST_FILE)
+        length = len(fp.view)
+        fp.seek(length + 10)
+        assert fp.tell() == length
+        assert fp.read(1) == b''
+        fp.seek(-2, 2)
+        assert fp.tell() == length - 2
+        fp.seek(1, 1)
+        assert fp.tell() == length - 1
+
+    def test_file_object_position(self):
+        """Test mapping an open file starts at its current position"""
+        with open(TEST_FILE, 'rb') as f:
+            f.seek(128)
+            fp = DicomMemoryMap(f)
+            assert fp.tell() == 128
+            assert fp.read(4) == b'DICM'
+
+    def test_empty_file(self, tmp_path):
+        """Test mapping an empty file"""
+        path = str(tmp_path / 'empty.dcm')
+        open(path, 'wb').close()
+        with DicomMemoryMap(path) as fp:
+            assert fp.read(4) == b''
+            assert fp.tell() == 0
+            assert len(fp.view) == 0
+            fp.seek(10)
+            assert fp.tell() == 0
+
+
+class TestDicomBuffer:
+    """Test filebase.DicomBuffer class"""
+    def test_read(self):
+        """Test reading from the buffer"""
+        with DicomBuffer(b'\x00\x01\x02\x03') as fp:
+            assert fp.read(2) == b'\x00\x01'
+            assert fp.tell() == 2
+            fp.seek(-1, 2)
+            assert fp.read() == b'\x03'
+            assert bytes(fp.view[1:3]) == b'\x01\x02'
+            assert fp.view.readonly
+        # Still usable after closing
+        fp.seek(0)
+        assert fp.read(1) == b'\x00'
+
+    def test_bytearray(self):
+        """Test a bytearray is copied"""
+        data = bytearray(b'\x00\x01')
+        fp = DicomBuffer(data)
+        data[0] = 1
+        assert fp.read(1) == b'\x00'
+        assert fp.view.readonly
+
+
+class ChunkedStream:
+    """A stream that only has read() and returns at most 3 bytes per call"""
+    def __init__(self, data):
+        self._fp = BytesIO(data)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return self._fp.read()
+        return self._fp.read(min(size, 3))
+
+
+class TestDicomStreamReader:
+    """Test filebase.DicomStreamReader class"""
+    def test_read(self):
+        """Test reading from a stream returning partial reads"""
+        fp = DicomStreamReader(ChunkedStream(b'\x00\x01\x02\x03\x04\x05'))
+        assert fp.read(4) == b'\x00\x01\x02\x03'
+        assert fp.tell() == 4
+        assert fp.read() == b'\x04\x05'
+        assert fp.read(2) == b''
+        assert fp.tell() == 6
+
+    def test_read_exact_length(self):
+        """Test DicomIO.read with need_exact_length"""
+        fp = DicomStreamReader(ChunkedStream(b'\x00' * 10))
+        fp.is_little_endian = True
+        assert fp.read_UL() == 0
+        with pytest.raises(EOFError):
+            fp.read(10, need_exact_length=True)
+
+    def test_rewind(self):
+        """Test rewinding within the buffer"""
+        fp = DicomStreamReader(ChunkedStream(bytes(range(20))), buffer_size=8)
+        assert fp.read(10) == bytes(range(10))
+        fp.seek(4)
+        assert fp.read(2) == b'\x04\x05'
+        fp.seek(-2, 1)
+        assert fp.tell() == 4
+        assert fp.read(8) == bytes(range(4, 12))
+        assert fp.read() == bytes(range(12, 20))
+
+    def test_rewind_too_far_raises(self):
+        """Test rewinding past the buffer raises"""
+        fp = DicomStreamReader(ChunkedStream(bytes(range(20))), buffer_size=8)
+        fp.read(12)
+        fp.seek(4)
+        msg = r"stream can only be rewound to position 0x4"
+        with pytest.raises(IOError, match=msg):
+            fp.seek(3)
+        fp.read(1000)
+        fp.seek(12)
+        assert fp.read(1) == b'\x0c'
+
+    def test_seek_forward(self):
+        """Test seeking forwards skips data"""
+        fp = DicomStreamReader(ChunkedStream(bytes(range(20))), buffer_size=4)
+        fp.seek(15)
+        assert fp.tell() == 15
+        assert fp.read(1) == b'\x0f'
+        fp.seek(100)
+        assert fp.tell() == 20
+        assert fp.read(1) == b''
+
+    def test_seek_end_raises(self):
+        """Test seeking relative to the end raises"""
+        fp = DicomStreamReader(ChunkedStream(b'\x00'))
+        with pytest.raises(UnsupportedOperation):
+            fp.seek(0, 2)
+
+    def test_close(self):
+        """Test closing doesn't close the stream"""
+        stream = BytesIO(b'\x00\x01')
+        with DicomStreamReader(stream) as fp:
+            fp.read(1)
+        assert not stream.closed
+
+
+def deflate(data):
+    """Return `data` as a raw deflate stream"""
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class TestDicomInflateReader:
+    """Test filebase.DicomInflateReader class"""
+    def test_read(self):
+        """Test inflating the data as it's read"""
+        data = bytes(range(256)) * 1000
+        fp = DicomInflateReader(ChunkedStream(deflate(data)))
+        assert fp.read(10) == data[:10]
+        fp.seek(5)
+        assert fp.read(10) == data[5:15]
+        fp.seek(200000)
+        assert fp.read(3) == data[200000:200003]
+        assert fp.read() == data[200003:]
+        assert fp.read(1) == b''
+        assert fp.tell() == len(data)
+
+    def test_inflates_on_demand(self):
+        """Test only the deflated data that's needed is read"""
+        src = BytesIO(deflate(bytes(256) + os.urandom(1000000)))
+        fp = DicomInflateReader(src)
+        assert fp.read(4) == b'\x00' * 4
+        assert src.tell() < len(src.getvalue())
+
+    def test_trailing_data(self):
+        """Test data after the end of the deflate stream is ignored"""
+        fp = DicomInflateReader(BytesIO(deflate(b'\x01\x02') + b'\x00'))
+        assert fp.read() == b'\x01\x02'
+        assert fp.read(1) == b''
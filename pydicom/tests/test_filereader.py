@@ -2,32 +2,41 @@
 # -*- coding: utf-8 -*-
 """Unit tests for the pydicom.filereader module."""
 
+import copy
 import gzip
 import io
 from io import BytesIO
 import os
+import pickle
 import shutil
 from pathlib import Path
 from struct import unpack
 import sys
 import tempfile
+import threading
 
 import pytest
 
 import pydicom.config
 from pydicom import config
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
-from pydicom.data import get_testdata_file
+from pydicom.data import get_testdata_file, get_charset_files
 from pydicom.datadict import add_dict_entries
-from pydicom.filereader import dcmread, read_dataset
+from pydicom.filereader import (
+    dcmread, dcmread_many, read_dataset, read_columns, create_index,
+    save_index, load_index, close_deferred_handles
+)
 from pydicom.dataelem import DataElement, DataElement_from_raw
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomBytesIO
-from pydicom.filereader import data_element_generator
+from pydicom.filebase import DicomBytesIO, DicomStreamReader
+from pydicom import filereader
+from pydicom.filereader import data_element_generator, skip_sequence
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag
-from pydicom.uid import ImplicitVRLittleEndian
+from pydicom.uid import (
+    ImplicitVRLittleEndian, DeflatedExplicitVRLittleEndian
+)
 import pydicom.valuerep
 from pydicom import values
 
@@ -272,6 +281,27 @@ class TestReader:
         ds = dcmread(deflate_name)
         assert "WSD" == ds.ConversionType
 
+    def test_deflate_stop_before_pixels(self):
+        """Test only the deflated data that's needed is inflated."""
+        ds = dcmread(ct_name)
+        ds.file_meta.TransferSyntaxUID = DeflatedExplicitVRLittleEndian
+        ds.is_implicit_VR = False
+        # Incompressible pixel data
+        ds.PixelData = os.urandom(1000000)
+        fp = BytesIO()
+        ds.save_as(fp)
+        fp.seek(0)
+        ds = dcmread(fp, stop_before_pixels=True)
+        assert fp.tell() < 100000
+        assert "CT" == ds.Modality
+        assert "PixelData" not in ds
+
+    def test_deflate_deferred(self):
+        """Test deferred reads from a deflated dataset."""
+        ds = dcmread(deflate_name, defer_size=1024)
+        assert 'WSD' == ds.ConversionType
+        assert dcmread(deflate_name).PixelData == ds.PixelData
+
     def test_bad_sequence(self):
         """Test that automatic UN conversion can be switched off."""
         with pytest.raises(NotImplementedError):
@@ -360,6 +390,33 @@ class TestReader:
                 specific_tags=[unknown_len_tag],
             )
 
+    def test_specific_tags_stops_early(self):
+        """Test reading stops after the largest specific tag."""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(f, specific_tags=["PatientName", "PatientID"])
+            assert f.tell() < 1000
+            # Rewound to the start of the element after (0010,0020)
+            assert (0x0010, 0x0030) == unpack("<HH", f.read(4))
+        assert ["PatientID", "PatientName", "SpecificCharacterSet"] == (
+            ds.dir()
+        )
+
+    def test_specific_tags_skips_unwanted_SQ(self, monkeypatch):
+        """Test unwanted undefined length sequences are skipped unparsed."""
+        def read_sequence(*args, **kwargs):
+            raise RuntimeError("Sequence parsed")
+
+        monkeypatch.setattr(
+            pydicom.filereader, "read_sequence", read_sequence
+        )
+        fname = get_testdata_file("liver_1frame.dcm")
+        ds = dcmread(fname, specific_tags=["PixelData"])
+        assert "PixelData" in ds
+        assert "ReferencedSeriesSequence" not in ds
+
+        with pytest.raises(RuntimeError, match=r"Sequence parsed"):
+            dcmread(fname)
+
     def test_private_SQ(self):
         """Can read private undefined length SQ without error."""
         # From issues 91, 97, 98. Bug introduced by fast reading, due to
@@ -1333,6 +1390,8 @@ class TestDeferredRead:
         shutil.copyfile(ct_name, self.testfile_name)
 
     def teardown(self):
+        close_deferred_handles()
+        config.deferred_read_handles = 8
         if os.path.exists(self.testfile_name):
             os.remove(self.testfile_name)
 
@@ -1386,6 +1445,791 @@ class TestDeferredRead:
         dataset = pydicom.dcmread(filelike, defer_size=1024)
         assert 32768 == len(dataset.PixelData)
 
+    def test_handle_reused(self):
+        """Test deferred reads from the same file share one handle."""
+        ds = dcmread(self.testfile_name, defer_size=2000)
+        ds_other = dcmread(self.testfile_name, defer_size=10)
+        opened = []
+
+        def fileobj_type(*args):
+            opened.append(args)
+            return open(*args)
+
+        ds.fileobj_type = fileobj_type
+        ds_other.fileobj_type = fileobj_type
+        ds.PixelData
+        ds_other.PixelData
+        ds_other.ImageType
+        assert [(self.testfile_name, 'rb')] == opened
+        assert 32768 == len(ds_other.PixelData)
+
+    def test_handle_replaced_file(self):
+        """Test a replaced file is only checked when its handle is opened."""
+        ds = dcmread(self.testfile_name, defer_size=10)
+        ds.ImageType
+        key = (open, self.testfile_name)
+        fp = filereader._deferred_handles[key].fp
+        os.remove(self.testfile_name)
+        shutil.copyfile(ct_name, self.testfile_name)
+        # The pooled handle is still used
+        ds.PatientName
+        assert fp is filereader._deferred_handles[key].fp
+
+        close_deferred_handles()
+        assert fp.closed
+        msg = r"Deferred read warning -- file modification time has changed"
+        with pytest.warns(UserWarning, match=msg):
+            assert dcmread(ct_name).PixelData == ds.PixelData
+        assert fp is not filereader._deferred_handles[key].fp
+
+    def test_pooled_handle_not_checked(self, monkeypatch):
+        """Test reusing a pooled handle doesn't stat the file."""
+        ds = dcmread(self.testfile_name, defer_size=10)
+        ds.ImageType
+        calls = []
+
+        class CountingOS:
+            def __getattr__(self, name):
+                return getattr(os, name)
+
+            def stat(self, *args, **kwargs):
+                calls.append(args)
+                return os.stat(*args, **kwargs)
+
+        monkeypatch.setattr(filereader, 'os', CountingOS())
+        ds.PatientName
+        assert 32768 == len(ds.PixelData)
+        assert [] == calls
+
+        close_deferred_handles()
+        ds.StudyInstanceUID
+        assert [(self.testfile_name, )] == calls
+
+    def test_handle_pool_limit(self):
+        """Test the number of pooled handles is bounded."""
+        config.deferred_read_handles = 1
+        other_name = self.testfile_name + "2"
+        shutil.copyfile(ct_name, other_name)
+        try:
+            ds = dcmread(self.testfile_name, defer_size=2000)
+            ds_other = dcmread(other_name, defer_size=2000)
+            ds.PixelData
+            ds_other.PixelData
+            handles = list(filereader._deferred_handles.values())
+            assert 1 == len(handles)
+            assert other_name == handles[0].fp.name
+        finally:
+            close_deferred_handles()
+            os.remove(other_name)
+
+    def test_handle_pool_disabled(self):
+        """Test no handles are kept if the pool size is 0."""
+        config.deferred_read_handles = 0
+        ds = dcmread(self.testfile_name, defer_size=2000)
+        assert 32768 == len(ds.PixelData)
+        assert not filereader._deferred_handles
+
+    def test_close_deferred_handles(self):
+        """Test closing the pooled handles."""
+        ds = dcmread(self.testfile_name, defer_size=2000)
+        ds.PixelData
+        fp = filereader._deferred_handles[(open, self.testfile_name)].fp
+        close_deferred_handles()
+        assert fp.closed
+        assert not filereader._deferred_handles
+
+    def test_handle_closed_after_use(self):
+        """Test an evicted handle isn't closed while it's being read."""
+        ds = dcmread(self.testfile_name, defer_size=2000)
+        with filereader._deferred_file(open, self.testfile_name, None) as fp:
+            close_deferred_handles()
+            assert not fp.closed
+            assert not filereader._deferred_handles
+            assert 32768 == len(ds.PixelData)
+
+        assert fp.closed
+
+    def test_concurrent_files(self):
+        """Test reads from different files don't wait on each other."""
+        other_name = self.testfile_name + "2"
+        shutil.copyfile(ct_name, other_name)
+        try:
+            ds = dcmread(self.testfile_name, defer_size=2000)
+            ds_other = dcmread(other_name, defer_size=2000)
+            with filereader._deferred_file(open, other_name, None):
+                thread = threading.Thread(target=lambda: ds.PixelData)
+                thread.start()
+                thread.join(5)
+                assert not thread.is_alive()
+                assert 32768 == len(ds.PixelData)
+
+            assert 32768 == len(ds_other.PixelData)
+        finally:
+            close_deferred_handles()
+            os.remove(other_name)
+
+
+class ReadOnlyStream:
+    """A non-seekable stream that returns at most 1000 bytes per read."""
+    def __init__(self, fname):
+        with open(fname, "rb") as f:
+            self._fp = BytesIO(f.read())
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return self._fp.read()
+        return self._fp.read(min(size, 1000))
+
+
+class TestBufferRead:
+    """Test dcmread() with bytes, bytearray and memoryview"""
+
+    @pytest.mark.parametrize(
+        "fname, force",
+        [
+            (ct_name, False),
+            (mr_name, False),
+            (get_testdata_file("MR_small_implicit.dcm"), False),
+            (emri_big_endian_name, False),
+            (jpeg_lossless_name, False),
+            (deflate_name, False),
+            (rtplan_name, False),
+            (rtstruct_name, True),
+            (explicit_vr_le_no_meta, True),
+            (truncated_mr_name, False),
+        ]
+    )
+    def test_values_identical(self, fname, force):
+        """Test parsing a buffer matches reading the file."""
+        ds_norm = dcmread(fname, force=force)
+        with open(fname, "rb") as f:
+            data = f.read()
+        ds_buffer = dcmread(data, force=force)
+        assert ds_norm.file_meta == ds_buffer.file_meta
+        elems_norm = list(ds_norm.iterall())
+        elems_buffer = list(ds_buffer.iterall())
+        assert len(elems_norm) == len(elems_buffer)
+        for elem, elem_buffer in zip(elems_norm, elems_buffer):
+            assert elem.tag == elem_buffer.tag
+            assert elem.VR == elem_buffer.VR
+            if elem.VR != 'SQ':
+                assert elem.value == elem_buffer.value
+
+    @pytest.mark.parametrize("cls", [bytes, bytearray, memoryview])
+    def test_buffer_types(self, cls):
+        """Test the supported buffer types."""
+        with open(ct_name, "rb") as f:
+            data = cls(f.read())
+        ds = dcmread(data)
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds.PixelData.readonly
+        assert dcmread(ct_name).PixelData == ds.PixelData
+        assert isinstance(ds._dict[0x00100010].value, bytes)
+        assert 'CompressedSamples^CT1' == ds.PatientName
+
+    def test_binary_values_bytes(self):
+        """Test only the pixel data values are memoryviews."""
+        with open(ct_name, "rb") as f:
+            data = f.read()
+        ds = dcmread(data)
+        version = ds.file_meta.FileMetaInformationVersion
+        assert isinstance(version, bytes)
+        assert b'\x00\x01' == version
+        assert isinstance(dcmread(BytesIO(data)).PixelData, bytes)
+        for elem, elem_ref in zip(ds.iterall(), dcmread(ct_name).iterall()):
+            if elem.tag != 0x7FE00010:
+                assert type(elem_ref.value) is type(elem.value)
+
+    def test_bytearray_copied(self):
+        """Test changing a bytearray doesn't change the parsed values."""
+        with open(ct_name, "rb") as f:
+            data = bytearray(f.read())
+        ds = dcmread(data)
+        data[:] = b'\x00' * len(data)
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_read_options(self):
+        """Test the dcmread() options with a buffer."""
+        with open(ct_name, "rb") as f:
+            data = f.read()
+        ds = dcmread(data, stop_before_pixels=True)
+        assert 'PixelData' not in ds
+        assert 'PatientName' in ds
+        ds = dcmread(data, specific_tags=['PatientName', 'Rows'])
+        assert ['PatientName', 'Rows', 'SpecificCharacterSet'] == ds.dir()
+        ds = dcmread(data, defer_size=1024)
+        assert ds._dict[0x7FE00010].value is None
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_lazy_sequences(self):
+        """Test undefined length sequences in a buffer."""
+        with open(rtstruct_name, "rb") as f:
+            data = f.read()
+        ds_norm = dcmread(rtstruct_name, force=True)
+        ds = dcmread(data, force=True, lazy_sequences=True)
+        assert isinstance(ds._dict[0x30060020].value, memoryview)
+        assert ds_norm.StructureSetROISequence == ds.StructureSetROISequence
+
+    def test_debugging(self):
+        """Test the file-based parser is used when debugging."""
+        with open(mr_name, "rb") as f:
+            data = f.read()
+        config.debug(True, False)
+        try:
+            ds = dcmread(data)
+        finally:
+            config.debug(False, False)
+        assert dcmread(mr_name).PixelData == ds.PixelData
+
+
+class TestStreamRead:
+    """Test dcmread() with non-seekable streams"""
+
+    @pytest.mark.parametrize(
+        "fname, force",
+        [
+            (ct_name, False),
+            (mr_name, False),
+            (get_testdata_file("MR_small_implicit.dcm"), False),
+            (emri_big_endian_name, False),
+            (jpeg_lossless_name, False),
+            (deflate_name, False),
+            (rtstruct_name, True),
+            (explicit_vr_le_no_meta, True),
+            (get_testdata_file("SC_rgb_rle_2frame.dcm"), False),
+        ]
+    )
+    def test_values_identical(self, fname, force):
+        """Test reading a stream matches reading the file."""
+        ds_norm = dcmread(fname, force=force)
+        ds_stream = dcmread(ReadOnlyStream(fname), force=force)
+        assert ds_norm.file_meta == ds_stream.file_meta
+        for elem in ds_norm:
+            assert elem.value == ds_stream[elem.tag].value
+
+    def test_non_seekable_file_object(self):
+        """Test a file object that reports it isn't seekable."""
+        class Unseekable(io.BytesIO):
+            def seekable(self):
+                return False
+
+            def seek(self, *args):
+                raise io.UnsupportedOperation("seek")
+
+        with open(ct_name, "rb") as f:
+            ds = dcmread(Unseekable(f.read()))
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_stop_before_pixels(self):
+        """Test the stream is only read up to the pixel data."""
+        stream = ReadOnlyStream(ct_name)
+        ds = dcmread(stream, stop_before_pixels=True)
+        assert 'PixelData' not in ds
+        assert 'PatientName' in ds
+        # Only the header of the element is read
+        pixel_tell = dcmread(ct_name)['PixelData'].file_tell
+        assert stream._fp.tell() <= pixel_tell + 12
+
+    def test_specific_tags(self):
+        """Test reading specific tags from a stream."""
+        ds = dcmread(ReadOnlyStream(rtplan_name), specific_tags=['PatientID'])
+        assert ['PatientID'] == ds.dir()
+
+    def test_deferred_read_raises(self):
+        """Test deferred values can't be read from a stream."""
+        fp = DicomStreamReader(ReadOnlyStream(ct_name), buffer_size=1024)
+        ds = dcmread(fp, defer_size=1024)
+        with pytest.raises(IOError, match=r"stream can only be rewound"):
+            ds.PixelData
+
+
+class TestMemoryMappedRead:
+    """Test dcmread(mmap=True)"""
+
+    def test_values_identical(self):
+        """Test memory-mapped values match a normal read."""
+        ds_norm = dcmread(ct_name)
+        ds_mmap = dcmread(ct_name, mmap=True)
+        assert isinstance(ds_mmap.PixelData, memoryview)
+        assert ds_mmap.PixelData.readonly
+        for elem in ds_norm:
+            assert elem.value == ds_mmap[elem.tag].value
+
+    def test_only_pixel_data_mapped(self):
+        """Test only the pixel data values are memoryviews."""
+        ds = dcmread(ct_name, mmap=True)
+        assert isinstance(ds.file_meta.FileMetaInformationVersion, bytes)
+        for elem in ds.iterall():
+            if elem.tag != 0x7FE00010:
+                assert not isinstance(elem.value, memoryview)
+
+    def test_str(self):
+        """Test the string representation of a memory-mapped dataset."""
+        ds = dcmread(ct_name, mmap=True)
+        assert str(dcmread(ct_name)) == str(ds)
+        assert '<memory at' not in str(ds)
+
+        elem = ds['PixelData']
+        elem.value = elem.value[:4]
+        assert repr(elem.value.tobytes()) in str(elem)
+        assert '<memory at' not in repr(elem)
+
+    def test_file_object_position(self):
+        """Test reading starts at the position of a file object."""
+        with open(ct_name, "rb") as f:
+            data = f.read()
+        path = os.path.join(tempfile.mkdtemp(), "prefixed.dcm")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 10 + data)
+
+        with open(path, "rb") as f:
+            f.seek(10)
+            ds = dcmread(f, mmap=True)
+
+        for elem in dcmread(ct_name):
+            assert elem.value == ds[elem.tag].value
+        os.remove(path)
+
+    def test_empty_file_raises(self):
+        """Test an empty file raises the same exception as normal."""
+        path = os.path.join(tempfile.mkdtemp(), "empty.dcm")
+        open(path, "wb").close()
+        with pytest.raises(InvalidDicomError):
+            dcmread(path, mmap=True)
+
+        assert 0 == len(dcmread(path, mmap=True, force=True))
+        os.remove(path)
+
+    def test_implicit_vr(self):
+        """Test memory-mapped implicit VR pixel data."""
+        fname = get_testdata_file("MR_small_implicit.dcm")
+        ds = dcmread(fname, mmap=True)
+        assert ds.is_implicit_VR
+        assert isinstance(ds.PixelData, memoryview)
+        assert dcmread(fname).PixelData == ds.PixelData
+
+    def test_file_object(self):
+        """Test mapping a file object owned by the caller."""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(f, mmap=True)
+            assert not f.closed
+        assert isinstance(ds.PixelData, memoryview)
+        assert 128 * 128 * 2 == len(ds.PixelData)
+
+    def test_file_like_raises(self):
+        """Test a file-like without a file descriptor can't be mapped."""
+        with open(ct_name, "rb") as f:
+            file_like = BytesIO(f.read())
+        with pytest.raises(io.UnsupportedOperation):
+            dcmread(file_like, mmap=True)
+
+    def test_deferred(self):
+        """Test deferred reads from a memory-mapped file."""
+        ds = dcmread(ct_name, mmap=True, defer_size=2000)
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_deflated(self):
+        """Test mapping a deflated file."""
+        ds = dcmread(deflate_name, mmap=True)
+        assert dcmread(deflate_name).PixelData == ds.PixelData
+
+    def test_truncated(self):
+        """Test mapping a file with truncated pixel data."""
+        ds = dcmread(truncated_mr_name, mmap=True)
+        assert 8130 == len(ds.PixelData)
+
+    @pytest.mark.skipif(not have_numpy, reason="Numpy not available")
+    def test_pixel_array_read_only(self):
+        """Test getting a read-only array over the mapped pixel data."""
+        from pydicom.pixel_data_handlers import numpy_handler
+
+        ds = dcmread(ct_name, mmap=True)
+        arr = numpy_handler.get_pixeldata(ds, read_only=True)
+        assert not arr.flags.writeable
+        assert numpy.shares_memory(
+            arr, numpy.frombuffer(ds.PixelData, dtype=numpy.uint8)
+        )
+        assert numpy.array_equal(dcmread(ct_name).pixel_array,
+                                 arr.reshape(128, 128))
+        assert ds.pixel_array.flags.writeable
+
+    def test_copy_and_pickle(self):
+        """Test copying and pickling a memory-mapped dataset."""
+        ds = dcmread(ct_name, mmap=True)
+        # Raw elements
+        ds_copy = copy.deepcopy(ds)
+        ds_pickle = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds_copy._dict[0x7FE00010].value, bytes)
+        assert isinstance(ds_pickle._dict[0x7FE00010].value, bytes)
+        assert ds == ds_copy
+        assert ds == ds_pickle
+
+        # Converted elements
+        ds = dcmread(ct_name, mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+        ds_copy = copy.deepcopy(ds)
+        assert isinstance(ds_copy.PixelData, bytes)
+        assert ds.PixelData == ds_copy.PixelData
+        ds_pickle = pickle.loads(pickle.dumps(ds))
+        assert isinstance(ds_pickle.PixelData, bytes)
+        assert ds.PixelData == ds_pickle.PixelData
+        assert isinstance(ds.PixelData, memoryview)
+
+
+class TestLazySequences:
+    """Test dcmread(lazy_sequences=True)"""
+
+    def test_undefined_length_sequences_not_parsed(self):
+        """Test undefined length sequences are kept as raw elements."""
+        fname = get_testdata_file("liver_1frame.dcm")
+        ds = dcmread(fname, lazy_sequences=True)
+        raw = ds._dict[0x00081115]
+        assert raw.is_raw
+        assert "SQ" == raw.VR
+        assert 0xFFFFFFFF == raw.length
+        assert isinstance(raw.value, bytes)
+        assert 458 == len(raw.value)
+
+    def test_values_identical(self):
+        """Test lazily parsed sequences match the eager ones."""
+        for fname in (rtstruct_name, priv_SQ_name, nested_priv_SQ_name,
+                      get_testdata_file("reportsi.dcm"),
+                      get_testdata_file("liver_1frame.dcm")):
+            ds_eager = dcmread(fname, force=True)
+            ds_lazy = dcmread(fname, force=True, lazy_sequences=True)
+            assert ds_eager == ds_lazy
+            for elem in ds_eager:
+                lazy_elem = ds_lazy[elem.tag]
+                assert (
+                    elem.is_undefined_length == lazy_elem.is_undefined_length
+                )
+                if elem.VR == "SQ":
+                    assert elem.value == lazy_elem.value
+                    for eager_item, lazy_item in zip(elem, lazy_elem):
+                        assert eager_item.file_tell == lazy_item.file_tell
+
+    def test_write(self):
+        """Test writing a dataset read with lazy sequences."""
+        ds = dcmread(rtstruct_name, force=True, lazy_sequences=True)
+        fp = BytesIO()
+        ds.save_as(fp, write_like_original=True)
+        with open(rtstruct_name, "rb") as f:
+            assert f.read() == fp.getvalue()
+
+    def test_specific_tags(self):
+        """Test lazy sequences with specific_tags."""
+        ds = dcmread(
+            rtstruct_name,
+            specific_tags=["PatientName", "ROIContourSequence"],
+            force=True,
+            lazy_sequences=True
+        )
+        assert 3 == len(ds)
+        assert ds._dict[0x30060039].is_raw
+        assert 3 == len(ds.ROIContourSequence)
+
+    def test_mmap(self):
+        """Test lazy sequences with a memory-mapped file."""
+        ds = dcmread(
+            rtstruct_name, force=True, lazy_sequences=True, mmap=True
+        )
+        assert isinstance(ds._dict[0x30060039].value, memoryview)
+        ds_eager = dcmread(rtstruct_name, force=True)
+        assert ds_eager.ROIContourSequence == ds.ROIContourSequence
+
+    def test_skip_sequence(self):
+        """Test skip_sequence() with nested undefined length items."""
+        # Sequence of two items, the first of undefined length containing
+        #   an undefined length sequence, the second of defined length
+        bytestream = (
+            b"\xfe\xff\x00\xe0\xff\xff\xff\xff"
+            b"\x08\x00\x40\x11" b"SQ" b"\x00\x00\xff\xff\xff\xff"
+            b"\xfe\xff\x00\xe0\xff\xff\xff\xff"
+            b"\x10\x00\x10\x00" b"PN" b"\x06\x00" b"ABCDEF"
+            b"\xfe\xff\x0d\xe0\x00\x00\x00\x00"
+            b"\xfe\xff\xdd\xe0\x00\x00\x00\x00"
+            b"\xfe\xff\x0d\xe0\x00\x00\x00\x00"
+            b"\xfe\xff\x00\xe0\x0e\x00\x00\x00"
+            b"\x10\x00\x10\x00" b"PN" b"\x06\x00" b"ABCDEF"
+            b"\xfe\xff\xdd\xe0\x00\x00\x00\x00"
+            b"\x10\x00\x20\x00" b"LO" b"\x02\x00" b"AB"
+        )
+        fp = BytesIO(bytestream)
+        assert [0, 66] == skip_sequence(fp, False, True)
+        assert 96 == fp.tell()
+
+    def test_skip_sequence_eof(self):
+        """Test skip_sequence() raises if the delimiter is missing."""
+        fp = BytesIO(b"\xfe\xff\x00\xe0\x00\x00\x00\x00")
+        msg = r"End of file reached before the end of the sequence"
+        with pytest.raises(EOFError, match=msg):
+            skip_sequence(fp, True, True)
+
+
+class TestIndex:
+    """Test create_index(), save_index(), load_index() and dcmread(index)"""
+
+    def setup(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tdir.name, "CT_small.dcm")
+        shutil.copyfile(ct_name, self.fname)
+
+    def teardown(self):
+        self.tdir.cleanup()
+
+    def test_create_index(self):
+        """Test the contents of the index."""
+        index = create_index(self.fname)
+        assert os.path.getsize(self.fname) == index["size"]
+        assert os.stat(self.fname).st_mtime == index["mtime"]
+        assert not index["is_implicit_VR"]
+        assert index["is_little_endian"]
+        ds = dcmread(self.fname)
+        assert len(ds) == len(index["elements"])
+        assert [344, 10, "CS"] == index["elements"]["00080005"]
+        value_tell, length, VR = index["elements"]["7FE00010"]
+        assert 128 * 128 * 2 == length
+        assert "OW" == VR
+        with open(self.fname, "rb") as f:
+            f.seek(value_tell)
+            assert ds.PixelData == f.read(length)
+
+    def test_create_index_file_like(self):
+        """Test indexing a file-like."""
+        with open(ct_name, "rb") as f:
+            file_like = BytesIO(f.read())
+        index = create_index(file_like)
+        assert index["mtime"] is None
+        assert len(file_like.getvalue()) == index["size"]
+        assert create_index(ct_name)["elements"] == index["elements"]
+        file_like.seek(0)
+        ds = dcmread(file_like, index=index)
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_create_index_deflated_raises(self):
+        """Test indexing a deflated dataset raises."""
+        msg = r"Indexing datasets with the Deflated Explicit VR Little"
+        with pytest.raises(ValueError, match=msg):
+            create_index(deflate_name)
+
+    def test_save_load(self):
+        """Test saving and loading an index."""
+        index = create_index(self.fname)
+        save_index(index, self.fname + ".idx")
+        assert index == load_index(Path(self.fname + ".idx"))
+
+    def test_read_with_index(self):
+        """Test reading using an index matches parsing the file."""
+        for fname in (ct_name, mr_name, rtstruct_name, priv_SQ_name,
+                      get_testdata_file("liver_1frame.dcm")):
+            index = create_index(fname, force=True)
+            ds = dcmread(fname, force=True)
+            assert ds == dcmread(fname, force=True, index=index)
+
+    def test_read_with_index_no_parsing(self):
+        """Test the index is used instead of parsing the file."""
+        index = create_index(self.fname)
+        # Values are read from the offsets in the index
+        index["elements"]["00100010"] = index["elements"]["00100020"]
+        ds = dcmread(self.fname, index=index)
+        assert ds.PatientID == ds.PatientName
+
+    def test_read_with_index_options(self):
+        """Test reading using an index with other dcmread options."""
+        index = create_index(self.fname)
+        ds = dcmread(self.fname, index=index, stop_before_pixels=True)
+        assert "PixelData" not in ds
+        assert "PatientName" in ds
+
+        ds = dcmread(self.fname, index=index,
+                     specific_tags=["PatientName", "Rows"])
+        assert 3 == len(ds)
+        assert 128 == ds.Rows
+
+        ds = dcmread(self.fname, index=index, defer_size=1024)
+        assert ds._dict[0x7FE00010].value is None
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+        ds = dcmread(self.fname, index=index, mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+
+    def test_changed_file_ignores_index(self):
+        """Test a warning is issued and the index ignored if the file
+        changes."""
+        index = create_index(self.fname)
+        index["elements"]["00100010"] = index["elements"]["00100020"]
+        with open(self.fname, "ab") as f:
+            f.write(b"\x00" * 2)
+
+        msg = r"The file has changed since the index was created"
+        with pytest.warns(UserWarning, match=msg):
+            ds = dcmread(self.fname, index=index)
+
+        assert "CompressedSamples^CT1" == ds.PatientName
+
+
+class TestDcmreadMany:
+    """Test dcmread_many()"""
+
+    def setup(self):
+        self.paths = [ct_name, mr_name, "missing.dcm", Path(rtplan_name)]
+
+    def check_results(self, results):
+        assert [ct_name, mr_name, "missing.dcm", rtplan_name] == [
+            path for path, _ in results
+        ]
+        assert "CompressedSamples^CT1" == results[0][1].PatientName
+        assert "CompressedSamples^MR1" == results[1][1].PatientName
+        assert isinstance(results[2][1], FileNotFoundError)
+        assert "Last^First^mid^pre" == results[3][1].PatientName
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_executor(self, executor):
+        """Test reading with the thread and process executors."""
+        results = list(
+            dcmread_many(self.paths, workers=2, executor=executor)
+        )
+        self.check_results(results)
+
+    def test_executor_instance(self):
+        """Test reading with an existing executor."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(dcmread_many(self.paths, executor=executor))
+            self.check_results(results)
+            # Not shut down
+            assert 1 == executor.submit(int, "1").result()
+
+    def test_batches(self):
+        """Test results are in order for multiple batches."""
+        paths = [ct_name, mr_name] * 10
+        results = dcmread_many(
+            iter(paths), workers=2, executor="thread", batch_size=3
+        )
+        assert paths == [path for path, _ in results]
+
+    def test_options(self):
+        """Test passing dcmread() options."""
+        results = list(dcmread_many(
+            self.paths,
+            executor="thread",
+            specific_tags=["PatientName"],
+            stop_before_pixels=True
+        ))
+        self.check_results(results)
+        for _, ds in results:
+            if not isinstance(ds, Exception):
+                assert "PixelData" not in ds
+
+    def test_raw_values(self):
+        """Test returning the raw values only."""
+        results = list(
+            dcmread_many(self.paths, executor="process", raw_values=True)
+        )
+        assert isinstance(results[0][1], dict)
+        assert b"CompressedSamples^CT1 " == results[0][1][0x00100010].value
+        assert isinstance(results[2][1], FileNotFoundError)
+
+    def test_invalid_options_raise(self):
+        """Test invalid executor or batch size raise when called."""
+        msg = r"Invalid 'executor' value 'foo'"
+        with pytest.raises(ValueError, match=msg):
+            dcmread_many(self.paths, executor="foo")
+
+        msg = r"'batch_size' must be at least 1"
+        with pytest.raises(ValueError, match=msg):
+            dcmread_many(self.paths, batch_size=0)
+
+
+@pytest.mark.skipif(not have_numpy, reason="Numpy not available")
+class TestReadColumns:
+    """Test read_columns()"""
+
+    def setup(self):
+        self.paths = [
+            ct_name,
+            Path(mr_name),
+            get_testdata_file("MR_small_bigendian.dcm"),
+            get_testdata_file("MR_small_implicit.dcm"),
+        ]
+        self.keywords = [
+            "SOPInstanceUID",
+            "InstanceNumber",
+            "ImagePositionPatient",
+            "ImageType",
+            "Rows",
+            "PatientName",
+        ]
+
+    def test_columns(self):
+        """Test reading the values into columns."""
+        columns = read_columns(self.paths, self.keywords)
+        assert self.keywords == list(columns.keys())
+        for ii, path in enumerate(self.paths):
+            ds = dcmread(path)
+            assert ds.SOPInstanceUID == columns["SOPInstanceUID"][ii]
+            assert ds.InstanceNumber == columns["InstanceNumber"][ii]
+            assert numpy.allclose(
+                [float(v) for v in ds.ImagePositionPatient],
+                columns["ImagePositionPatient"][ii]
+            )
+            assert tuple(ds.ImageType) == columns["ImageType"][ii]
+            assert ds.Rows == columns["Rows"][ii]
+            assert ds.PatientName == columns["PatientName"][ii]
+
+        assert numpy.float64 == columns["InstanceNumber"].dtype
+        assert (4, 3) == columns["ImagePositionPatient"].shape
+        assert "U" == columns["SOPInstanceUID"].dtype.kind
+        assert object == columns["ImageType"].dtype
+
+    def test_missing_values(self):
+        """Test missing values are NaN, empty strings or empty tuples."""
+        columns = read_columns(
+            [rtplan_name, ct_name],
+            ["SliceThickness", "PixelSpacing", "PatientID", "ImageType"],
+            force=True
+        )
+        assert numpy.isnan(columns["SliceThickness"][0])
+        assert 5.0 == columns["SliceThickness"][1]
+        assert numpy.isnan(columns["PixelSpacing"][0]).all()
+        assert "id00001" == columns["PatientID"][0]
+        assert () == columns["ImageType"][0]
+
+    def test_deflated(self):
+        """Test reading a deflated dataset."""
+        columns = read_columns([deflate_name], ["PatientName", "Rows"])
+        ds = dcmread(deflate_name)
+        assert ds.PatientName == columns["PatientName"][0]
+        assert ds.Rows == columns["Rows"][0]
+
+    def test_character_set(self):
+        """Test text values are decoded using the Specific Character Set."""
+        fname = get_charset_files("chrH31.dcm")[0]
+        columns = read_columns([fname], ["PatientName"])
+        assert dcmread(fname).PatientName == columns["PatientName"][0]
+
+    def test_structured(self):
+        """Test returning a structured array."""
+        arr = read_columns(self.paths, self.keywords, structured=True)
+        assert 4 == len(arr)
+        assert tuple(self.keywords) == arr.dtype.names
+        assert (3, ) == arr.dtype["ImagePositionPatient"].shape
+        assert "CompressedSamples^CT1" == arr[0]["PatientName"]
+        assert 64 == arr["Rows"][1]
+
+    def test_invalid_keyword_raises(self):
+        """Test unknown or unsupported keywords raise."""
+        with pytest.raises(ValueError, match=r"Unknown keyword 'Foo'"):
+            read_columns(self.paths, ["Foo"])
+
+        msg = (
+            r"The element for 'PixelData' has a VR of 'OB or OW' which "
+            r"can't be read into a column"
+        )
+        with pytest.raises(ValueError, match=msg):
+            read_columns(self.paths, ["PixelData"])
+
 
 class TestReadTruncatedFile:
     def testReadFileWithMissingPixelData(self):
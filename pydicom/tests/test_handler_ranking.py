@@ -0,0 +1,199 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Tests for the pixel_data_handlers.ranking module."""
+
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    import numpy as np
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom import config, dcmread
+from pydicom.data import get_testdata_files
+from pydicom.pixel_data_handlers import (
+    numpy_handler as NP_HANDLER,
+    rle_handler as RLE_HANDLER,
+    gdcm_handler as GDCM_HANDLER,
+    pillow_handler as PILLOW_HANDLER,
+    jpeg_ls_handler as JPEG_LS_HANDLER,
+)
+from pydicom.pixel_data_handlers import ranking
+from pydicom.uid import ExplicitVRLittleEndian, RLELossless
+
+
+# 16/16-bit, 1 sample/pixel, 10 frame
+EXPL_16_1_10F = get_testdata_files("emri_small.dcm")[0]
+RLE_16_1_10F = get_testdata_files("emri_small_RLE.dcm")[0]
+
+
+def _make_handler(name):
+    """Return a stand-in handler that supports RLE Lossless."""
+    return SimpleNamespace(
+        __name__='pydicom.pixel_data_handlers.{}'.format(name),
+        supports_transfer_syntax=lambda uid: uid == RLELossless,
+    )
+
+
+class TestHandlerName:
+    """Tests for ranking.handler_name()."""
+    def test_names(self):
+        """Test the handler names."""
+        assert 'numpy' == ranking.handler_name(NP_HANDLER)
+        assert 'rle' == ranking.handler_name(RLE_HANDLER)
+        assert 'gdcm' == ranking.handler_name(GDCM_HANDLER)
+        assert 'pillow' == ranking.handler_name(PILLOW_HANDLER)
+        assert 'jpeg_ls' == ranking.handler_name(JPEG_LS_HANDLER)
+
+
+class TestGetHandlers:
+    """Tests for ranking.get_handlers()."""
+    def setup(self):
+        """Setup the tests."""
+        self.original_handlers = config.pixel_data_handlers
+
+    def teardown(self):
+        """Restore the configuration."""
+        config.pixel_data_handlers = self.original_handlers
+        config.pixel_data_handler_ranking = None
+
+    def test_default_order(self):
+        """Test the handlers are in the configured order by default."""
+        assert config.pixel_data_handler_ranking is None
+        expected = [
+            hh for hh in config.pixel_data_handlers
+            if hh.supports_transfer_syntax(RLELossless)
+        ]
+        assert expected == ranking.get_handlers(RLELossless)
+        assert [NP_HANDLER] == ranking.get_handlers(ExplicitVRLittleEndian)
+
+    def test_ranking(self):
+        """Test the ranked handlers are first."""
+        foo, bar, baz = (
+            _make_handler('foo_handler'),
+            _make_handler('bar_handler'),
+            _make_handler('baz_handler'),
+        )
+        config.pixel_data_handlers = [foo, bar, baz]
+        assert [foo, bar, baz] == ranking.get_handlers(RLELossless)
+
+        config.pixel_data_handler_ranking = {RLELossless: ['baz']}
+        assert [baz, foo, bar] == ranking.get_handlers(RLELossless)
+
+        config.pixel_data_handler_ranking = {
+            RLELossless: ['bar', 'unknown', 'baz']
+        }
+        assert [bar, baz, foo] == ranking.get_handlers(RLELossless)
+
+        # Other transfer syntaxes are unaffected
+        assert [] == ranking.get_handlers(ExplicitVRLittleEndian)
+
+    def test_config_change(self):
+        """Test the dispatch table is rebuilt when the config changes."""
+        config.pixel_data_handlers = [NP_HANDLER, RLE_HANDLER]
+        assert [RLE_HANDLER] == ranking.get_handlers(RLELossless)
+        foo = _make_handler('foo_handler')
+        config.pixel_data_handlers = [foo]
+        assert [foo] == ranking.get_handlers(RLELossless)
+
+    def test_config_changed_in_place(self):
+        """Test the dispatch table is rebuilt when the config is modified."""
+        foo, bar = _make_handler('foo_handler'), _make_handler('bar_handler')
+        config.pixel_data_handlers = [foo]
+        assert [foo] == ranking.get_handlers(RLELossless)
+        config.pixel_data_handlers.append(bar)
+        assert [foo, bar] == ranking.get_handlers(RLELossless)
+
+        config.pixel_data_handler_ranking = {RLELossless: []}
+        assert [foo, bar] == ranking.get_handlers(RLELossless)
+        config.pixel_data_handler_ranking[RLELossless].append('bar')
+        assert [bar, foo] == ranking.get_handlers(RLELossless)
+
+    def test_table_used(self, monkeypatch):
+        """Test the handlers aren't ranked again if the config is the
+        same."""
+        config.pixel_data_handler_ranking = {RLELossless: ['rle']}
+        expected = ranking.get_handlers(RLELossless)
+
+        def raise_error(handler):
+            raise RuntimeError('handler_name() called')
+
+        monkeypatch.setattr(ranking, 'handler_name', raise_error)
+        assert expected == ranking.get_handlers(RLELossless)
+        config.pixel_data_handler_ranking = {RLELossless: ['rle']}
+        assert expected == ranking.get_handlers(RLELossless)
+
+    def test_result_is_copy(self):
+        """Test modifying the returned list doesn't affect the table."""
+        handlers = ranking.get_handlers(RLELossless)
+        handlers.clear()
+        assert ranking.get_handlers(RLELossless)
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestCalibrate:
+    """Tests for ranking.calibrate()."""
+    def setup(self):
+        """Setup the tests."""
+        self.original_handlers = config.pixel_data_handlers
+
+    def teardown(self):
+        """Restore the configuration."""
+        config.pixel_data_handlers = self.original_handlers
+        config.pixel_data_handler_ranking = None
+
+    def test_calibrate(self):
+        """Test calibrating the available handlers."""
+        config.pixel_data_handlers = [NP_HANDLER, RLE_HANDLER, GDCM_HANDLER]
+        datasets = [dcmread(EXPL_16_1_10F), dcmread(RLE_16_1_10F)]
+        result = ranking.calibrate(datasets, repeats=1)
+        assert ['numpy'] == result[ExplicitVRLittleEndian]
+        assert 'rle' in result[RLELossless]
+        if not GDCM_HANDLER.is_available():
+            assert ['rle'] == result[RLELossless]
+
+        # The sample datasets aren't modified
+        assert 'PixelData' in datasets[1]
+        assert not hasattr(datasets[1], '_pixel_array')
+
+    def test_failed_handler_excluded(self):
+        """Test handlers that raise aren't ranked."""
+        config.pixel_data_handlers = [NP_HANDLER, RLE_HANDLER]
+        ds = dcmread(RLE_16_1_10F)
+        del ds.Rows
+        assert {RLELossless: []} == ranking.calibrate([ds], repeats=1)
+
+    def test_ranking_used(self):
+        """Test a calibrated ranking can be used to decode."""
+        ds = dcmread(RLE_16_1_10F)
+        config.pixel_data_handler_ranking = ranking.calibrate([ds])
+        ref = dcmread(EXPL_16_1_10F)
+        assert np.array_equal(ref.pixel_array, ds.pixel_array)
+        assert np.array_equal(ref.pixel_array[2], ds.get_frame(2))
+
+    def test_invalid_repeats_raises(self):
+        """Test an invalid number of repeats raises an exception."""
+        with pytest.raises(ValueError, match=r"'repeats' must be at least 1"):
+            ranking.calibrate([], repeats=0)
+
+
+class TestSaveLoadRanking:
+    """Tests for ranking.save_ranking() and ranking.load_ranking()."""
+    def test_roundtrip(self, tmp_path):
+        """Test saving and loading a ranking."""
+        path = str(tmp_path / 'ranking.json')
+        ref = {RLELossless: ['rle', 'gdcm'], ExplicitVRLittleEndian: []}
+        ranking.save_ranking(ref, path)
+        assert ref == ranking.load_ranking(path)
+
+    def test_invalid_raises(self, tmp_path):
+        """Test loading an invalid ranking raises an exception."""
+        path = str(tmp_path / 'ranking.json')
+        with open(path, 'w') as f:
+            f.write('{"1.2.840.10008.1.2.5": "rle"}')
+
+        msg = r"doesn't contain a valid handler ranking"
+        with pytest.raises(ValueError, match=msg):
+            ranking.load_ranking(path)
@@ -16,7 +16,9 @@ except ImportError:
 from pydicom import dcmread
 from pydicom.data import get_testdata_files, get_palette_files
 from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.encaps import encapsulate
 from pydicom.pixel_data_handlers.util import (
+    decode_frames,
     dtype_corrected_for_endianness,
     reshape_pixel_array,
     convert_color_space,
@@ -784,6 +786,96 @@ class TestGetExpectedLength:
         assert length[2] == get_expected_length(ds, unit='bytes')
 
 
+@pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
+class TestNumpy_DecodeFrames:
+    """Tests for util.decode_frames()."""
+    def setup(self):
+        """Setup the tests."""
+        self.ds = Dataset()
+        self.ds.Rows = 2
+        self.ds.Columns = 3
+        self.ds.SamplesPerPixel = 1
+        self.ds.BitsAllocated = 16
+        self.ds.NumberOfFrames = 3
+        self.frames = [bytes(range(ii, ii + 12)) for ii in range(3)]
+        self.ds.PixelData = encapsulate(self.frames)
+
+    def test_single_frame(self):
+        """Test decoding a single frame."""
+        del self.ds.NumberOfFrames
+        self.ds.PixelData = encapsulate([self.frames[0]])
+        arr = decode_frames(self.ds, bytes)
+        assert 'uint8' == arr.dtype
+        assert self.frames[0] == arr.tobytes()
+
+    def test_multiple_frames(self):
+        """Test decoding multiple frames in turn."""
+        arr = decode_frames(self.ds, bytes)
+        assert (36,) == arr.shape
+        assert b''.join(self.frames) == arr.tobytes()
+
+    @pytest.mark.parametrize("workers", [2, 3, 8])
+    def test_workers(self, workers):
+        """Test decoding multiple frames concurrently."""
+        arr = decode_frames(self.ds, bytes, workers=workers)
+        assert b''.join(self.frames) == arr.tobytes()
+
+    def test_ndarray_frames(self):
+        """Test decoding to ndarray frames."""
+        def decode(frame):
+            return np.frombuffer(frame, '<u2').reshape(2, 3).T
+
+        arr = decode_frames(self.ds, decode)
+        ref = b''.join(
+            [np.frombuffer(f, '<u2').reshape(2, 3).T.tobytes()
+             for f in self.frames]
+        )
+        assert ref == arr.tobytes()
+
+    def test_frames(self):
+        """Test decoding frames that have already been parsed."""
+        frames = self.frames[::-1]
+        arr = decode_frames(self.ds, bytes, frames=frames)
+        assert b''.join(frames) == arr.tobytes()
+
+    def test_number_of_frames_mismatch_raises(self):
+        """Test an exception is raised if the number of frames is wrong."""
+        self.ds.NumberOfFrames = 4
+        msg = (
+            r"The number of frames in the pixel data doesn't match the "
+            r"expected amount \(3 vs. 4 frames\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            decode_frames(self.ds, bytes)
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_frame_length_mismatch_raises(self, workers):
+        """Test an exception is raised if a frame has the wrong length."""
+        msg = (
+            r"The length of decoded frame 0 doesn't match the expected "
+            r"length \(11 vs. 12 bytes\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            decode_frames(self.ds, lambda f: f[:-1], workers=workers)
+
+    def test_out(self):
+        """Test decoding into an output array."""
+        out = np.zeros((3, 2, 3), dtype='uint16')
+        arr = decode_frames(self.ds, bytes, out=out)
+        assert 'uint8' == arr.dtype
+        assert np.shares_memory(arr, out)
+        assert b''.join(self.frames) == out.tobytes()
+
+    def test_out_size_mismatch_raises(self):
+        """Test an output array with the wrong size raises."""
+        msg = (
+            r"The size of 'out' \(34 bytes\) doesn't match the size of the "
+            r"pixel data \(36 bytes\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            decode_frames(self.ds, bytes, out=np.zeros(17, 'uint16'))
+
+
 @pytest.mark.skipif(not HAVE_NP, reason="Numpy is not available")
 class TestNumpy_ModalityLUT:
     """Tests for util.apply_modality_lut()."""
@@ -2,11 +2,13 @@
 """Tests for misc.py"""
 
 import os
+import sys
+import types
 
 import pytest
 
 from pydicom.data import get_testdata_files
-from pydicom.misc import is_dicom, size_in_bytes
+from pydicom.misc import is_dicom, size_in_bytes, lazy_attributes
 
 test_file = get_testdata_files('CT_small.dcm')[0]
 no_meta_file = get_testdata_files('ExplVR_LitEndNoMeta.dcm')[0]
@@ -49,3 +51,24 @@ class TestMisc:
             size_in_bytes('2 TB')
         with pytest.raises(ValueError):
             size_in_bytes('KB 2')
+
+    def test_lazy_attributes(self, monkeypatch):
+        """Test lazy_attributes() loads the data on attribute access."""
+        module = types.ModuleType('pydicom_lazy_test')
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        module.data = {}
+        module.other = 1
+        calls = []
+
+        def load():
+            calls.append(1)
+            module.__dict__['data']['a'] = 1
+
+        lazy_attributes(module.__name__, {'data': load})
+        assert 1 == module.other
+        assert [] == calls
+        assert {'a': 1} == module.data
+        assert [1] == calls
+
+        module.data = {'b': 2}
+        assert {'b': 2} == module.__dict__['data']
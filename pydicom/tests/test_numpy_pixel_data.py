@@ -1092,6 +1092,103 @@ class TestNumpy_NumpyHandler:
 
 
 # Tests for numpy_handler module with Numpy available
+GET_FRAME_DATASETS = [
+    (EXPL_1_1_1F, False),
+    (EXPL_1_1_3F, False),
+    (EXPB_1_1_3F, False),
+    (DEFL_8_1_1F, False),
+    (EXPL_8_1_2F, False),
+    (EXPL_8_3_1F_ODD, False),
+    (EXPL_8_3_1F_YBR422, False),
+    (EXPL_8_3_2F, False),
+    (EXPB_8_3_2F, False),
+    (IMPL_16_1_1F, False),
+    (EXPL_16_1_10F, False),
+    (EXPB_16_1_10F, False),
+    (EXPL_16_3_2F, False),
+    (IMPL_32_1_15F, False),
+    (EXPB_32_3_2F, False),
+    (EXPL_16_1_10F, True),
+    (EXPL_8_3_2F, True),
+    (EXPL_1_1_3F, True),
+]
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestNumpy_GetFrame:
+    """Tests for Dataset.get_frame() and numpy_handler.get_frame()."""
+    @pytest.mark.parametrize('fpath, deferred', GET_FRAME_DATASETS)
+    def test_frames_match_pixel_array(self, fpath, deferred):
+        """Test each frame matches the corresponding part of pixel_array."""
+        ds = dcmread(fpath, defer_size=256 if deferred else None)
+        arr = dcmread(fpath).pixel_array
+        nr_frames = getattr(ds, 'NumberOfFrames', 1)
+        if nr_frames == 1:
+            arr = arr[None, ...]
+
+        frames = list(ds.iter_frames())
+        assert nr_frames == len(frames)
+        for frame, ref in zip(frames, arr):
+            assert ref.shape == frame.shape
+            assert ref.dtype == frame.dtype
+            assert frame.flags.writeable
+            assert np.array_equal(ref, frame)
+
+        assert np.array_equal(arr[-1], ds.get_frame(-1))
+        if deferred:
+            # Only the frames have been read, not the whole value
+            assert ds._dict[0x7FE00010].value is None
+
+    def test_float_pixel_data(self):
+        """Test getting a frame of Float Pixel Data."""
+        ds = dcmread(IMPL_32_1_15F)
+        ds.FloatPixelData = ds.PixelData
+        del ds.PixelData
+        assert np.array_equal(ds.pixel_array[3], ds.get_frame(3))
+        assert ds.get_frame(3).dtype.kind == 'f'
+
+    def test_read_only(self):
+        """Test getting a read-only frame."""
+        ds = dcmread(EXPL_16_1_10F)
+        arr = NP_HANDLER.get_frame(ds, 2, read_only=True)
+        assert not arr.flags.writeable
+        assert np.array_equal(ds.pixel_array[2], arr)
+
+    def test_index_out_of_range_raises(self):
+        """Test an invalid frame index raises."""
+        ds = dcmread(EXPL_16_1_10F)
+        msg = r"Unable to return frame 10 as the pixel data only contains 10"
+        with pytest.raises(IndexError, match=msg):
+            ds.get_frame(10)
+        with pytest.raises(IndexError):
+            ds.get_frame(-11)
+
+    def test_truncated_raises(self):
+        """Test pixel data too short for the frame raises."""
+        ds = dcmread(EXPL_16_1_10F)
+        ref = dcmread(EXPL_16_1_10F).pixel_array
+        ds.PixelData = ds.PixelData[:-10]
+        assert np.array_equal(ref[8], ds.get_frame(8))
+        msg = r"too short to contain frame 9"
+        with pytest.raises(ValueError, match=msg):
+            ds.get_frame(9)
+
+    def test_unsupported_syntax_raises(self):
+        """Test a transfer syntax with no frame support raises."""
+        ds = dcmread(JPEG_LS_LOSSLESS)
+        msg = r"Unable to return a single frame of the pixel data"
+        with pytest.raises(NotImplementedError, match=msg):
+            ds.get_frame(0)
+
+    def test_no_pixel_data_raises(self):
+        """Test get_frame raises if dataset has no pixel data."""
+        ds = dcmread(EXPL_16_1_1F)
+        del ds.PixelData
+        msg = r"one of Pixel Data, Float Pixel Data or Double Float Pixel"
+        with pytest.raises(AttributeError, match=msg):
+            ds.get_frame(0)
+
+
 @pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
 class TestNumpy_GetPixelData:
     """Tests for numpy_handler.get_pixeldata with numpy."""
@@ -1266,6 +1363,67 @@ class TestNumpy_GetPixelData:
         arr = get_pixeldata(ds)
         assert 'float64' == arr.dtype
 
+    @pytest.mark.parametrize(
+        'fpath', [EXPL_16_1_10F, EXPB_16_1_10F, EXPL_1_1_3F, EXPB_32_3_2F]
+    )
+    def test_out(self, fpath):
+        """Test get_pixeldata with an output array."""
+        ds = dcmread(fpath)
+        ref = get_pixeldata(ds)
+        out = np.zeros(ref.size, dtype=ref.dtype.newbyteorder('='))
+        arr = get_pixeldata(ds, out=out)
+        assert np.shares_memory(arr, out)
+        assert np.array_equal(ref, out)
+
+    def test_out_raises(self):
+        """Test get_pixeldata raises if the output array isn't suitable."""
+        ds = dcmread(EXPL_16_1_1F)
+        msg = r"'out' must be a numpy ndarray, not 'bytearray'"
+        with pytest.raises(TypeError, match=msg):
+            get_pixeldata(ds, out=bytearray(8192))
+
+        msg = (
+            r"The dtype of 'out' \(uint16\) doesn't match the dtype of the "
+            r"pixel data \(int16\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(ds, out=np.empty(4096, 'uint16'))
+
+        msg = (
+            r"The size of 'out' \(4095 items\) doesn't match the size of the "
+            r"pixel data \(4096 items\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(ds, out=np.empty(4095, 'int16'))
+
+        msg = r"'out' must be a C-contiguous array"
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(ds, out=np.empty((64, 64), 'int16').T)
+
+        out = np.empty(4096, 'int16')
+        out.flags.writeable = False
+        msg = r"'out' must be a writeable array"
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(ds, out=out)
+
+    def test_convert_pixel_data_out(self):
+        """Test Dataset.convert_pixel_data() with an output array."""
+        datasets = [dcmread(EXPL_16_1_1F), dcmread(EXPB_16_1_1F)]
+        volume = np.zeros((2, 64, 64), dtype='int16')
+        for ds, plane in zip(datasets, volume):
+            ds.convert_pixel_data(out=plane)
+            assert np.shares_memory(plane, ds.pixel_array)
+
+        ref = dcmread(EXPL_16_1_1F).pixel_array
+        assert np.array_equal(ref, volume[0])
+        assert np.array_equal(ref, volume[1])
+
+        # Always converts if `out` is used
+        out = np.zeros((64, 64), dtype='int16')
+        datasets[0].convert_pixel_data(out=out)
+        assert np.array_equal(ref, out)
+        assert np.shares_memory(out, datasets[0].pixel_array)
+
 
 REFERENCE_PACK_UNPACK = [
     (b'', []),
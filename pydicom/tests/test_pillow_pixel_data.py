@@ -601,6 +601,43 @@ class TestPillowHandler_JPEG:
         assert pixel_data.shape == (3, 3, 3)
 
 
+@pytest.mark.skipif(not HAVE_JPEG, reason='Pillow or JPEG not available')
+class TestPillowHandler_GetFrame:
+    """Tests for Dataset.get_frame() with the handler."""
+    def setup(self):
+        """Setup the test datasets and the environment."""
+        self.original_handlers = pydicom.config.pixel_data_handlers
+        pydicom.config.pixel_data_handlers = [NP_HANDLER, PIL_HANDLER]
+
+    def teardown(self):
+        """Restore the environment."""
+        pydicom.config.pixel_data_handlers = self.original_handlers
+
+    def test_jpeg_baseline_multi_frame(self):
+        """Test getting single frames of JPEG Baseline data."""
+        ds = dcmread(JPGB_08_08_3_0_120F_YBR_FULL_422)
+        ref = dcmread(JPGB_08_08_3_0_120F_YBR_FULL_422).pixel_array
+        for index in (0, 59, -1):
+            arr = ds.get_frame(index)
+            assert ref[index].shape == arr.shape
+            assert np.array_equal(ref[index], arr)
+
+    def test_jpeg_baseline_deferred(self):
+        """Test only the frame is read for a deferred value."""
+        ds = dcmread(JPGB_08_08_3_0_120F_YBR_FULL_422, defer_size=256)
+        ref = dcmread(JPGB_08_08_3_0_120F_YBR_FULL_422).pixel_array
+        assert np.array_equal(ref[100], ds.get_frame(100))
+        assert ds._dict[0x7FE00010].value is None
+
+    @pytest.mark.skipif(not HAVE_JPEG2K, reason='JPEG2K not available')
+    def test_jpeg2k_multi_frame(self):
+        """Test getting single frames of JPEG 2000 data."""
+        ds = dcmread(J2KR_16_16_1_0_10F_M2)
+        ref = dcmread(J2KR_16_16_1_0_10F_M2).pixel_array
+        for index, frame in enumerate(ds.iter_frames()):
+            assert np.array_equal(ref[index], frame)
+
+
 class TestPillow_GetJ2KPrecision:
     """Tests for _get_j2k_precision."""
     def test_precision(self):
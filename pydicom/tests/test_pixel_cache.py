@@ -0,0 +1,176 @@
+# Copyright 2008-2020 pydicom authors. See LICENSE file for details.
+"""Tests for the pixel_data_handlers.cache module."""
+
+import gc
+
+import pytest
+
+try:
+    import numpy as np
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom import config, dcmread
+from pydicom.data import get_testdata_files
+from pydicom.pixel_data_handlers import cache
+
+
+# 16/16-bit, 1 sample/pixel, 1 frame, 8192 bytes decoded
+EXPL_16_1_1F = get_testdata_files("MR_small.dcm")[0]
+# 16/16-bit, 1 sample/pixel, 10 frame, 8192 bytes per frame
+EXPL_16_1_10F = get_testdata_files("emri_small.dcm")[0]
+RLE_16_1_10F = get_testdata_files("emri_small_RLE.dcm")[0]
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestPixelCache:
+    """Tests for the process-wide pixel cache."""
+    def setup(self):
+        """Setup the tests."""
+        cache.clear()
+
+    def teardown(self):
+        """Reset the cache and configuration."""
+        config.pixel_cache_size = None
+        cache.clear()
+
+    def test_disabled(self):
+        """Test the pixel array is stored with the dataset by default."""
+        assert config.pixel_cache_size is None
+        assert not cache.is_enabled()
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        assert arr is ds._pixel_array
+        assert arr is ds.pixel_array
+        assert (0, 0, 0, 0, 0, None) == cache.cache_info()
+
+    def test_pixel_array(self):
+        """Test the pixel array is stored in the cache."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        assert not hasattr(ds, '_pixel_array')
+        assert (0, 1, 0, 1, 8192, 100000) == cache.cache_info()
+
+        assert arr is ds.pixel_array
+        assert (1, 1, 0, 1, 8192, 100000) == cache.cache_info()
+
+    def test_lru_eviction(self):
+        """Test the least recently used arrays are evicted."""
+        config.pixel_cache_size = 8192 * 2
+        datasets = [dcmread(EXPL_16_1_1F) for ii in range(3)]
+        arrays = [ds.pixel_array for ds in datasets[:2]]
+        # Use the first array so the second is evicted
+        assert arrays[0] is datasets[0].pixel_array
+        datasets[2].pixel_array
+        info = cache.cache_info()
+        assert 1 == info.evictions
+        assert 2 == info.count
+        assert 8192 * 2 == info.nbytes
+
+        assert arrays[0] is datasets[0].pixel_array
+        arr = datasets[1].pixel_array
+        assert arr is not arrays[1]
+        assert np.array_equal(arr, arrays[1])
+        assert 2 == cache.cache_info().evictions
+
+    def test_too_large(self):
+        """Test arrays larger than the budget aren't cached."""
+        config.pixel_cache_size = 8191
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        assert (0, 1, 0, 0, 0, 8191) == cache.cache_info()
+        assert arr is not ds.pixel_array
+        assert not hasattr(ds, '_pixel_array')
+
+    def test_pixel_data_changed(self):
+        """Test the cached array isn't used if the pixel data changes."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        ds.PixelData = b'\x00' * 8192
+        new = ds.pixel_array
+        assert not np.array_equal(arr, new)
+        assert 0 == new.max()
+        info = cache.cache_info()
+        assert 0 == info.hits
+        assert 1 == info.count
+
+    def test_convert_pixel_data_out(self):
+        """Test converting into an output array replaces the cached
+        array."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        out = np.zeros((64, 64), dtype=arr.dtype)
+        ds.convert_pixel_data(out=out)
+        assert not hasattr(ds, '_pixel_array')
+        assert 1 == cache.cache_info().count
+        new = ds.pixel_array
+        assert new is not arr
+        assert np.shares_memory(out, new)
+        assert np.array_equal(arr, new)
+        out[0, 0] = 1234
+        assert 1234 == ds.pixel_array[0, 0]
+
+    def test_convert_pixel_data(self):
+        """Test convert_pixel_data() stores the array in the cache."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_1F)
+        ds.convert_pixel_data()
+        assert not hasattr(ds, '_pixel_array')
+        assert (0, 0, 0, 1, 8192, 100000) == cache.cache_info()
+        ds.pixel_array
+        assert (1, 0, 0, 1, 8192, 100000) == cache.cache_info()
+
+    def test_garbage_collected(self):
+        """Test the arrays are evicted when the dataset is collected."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_10F)
+        ds.get_frame(0)
+        ds.get_frame(1)
+        assert 2 == cache.cache_info().count
+        del ds
+        gc.collect()
+        assert 0 == cache.cache_info().count
+        assert 0 == cache.cache_info().nbytes
+
+    def test_garbage_collected_other_datasets(self):
+        """Test only the collected dataset's arrays are evicted."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_10F)
+        ds_other = dcmread(EXPL_16_1_10F)
+        ds.get_frame(0)
+        ds.get_frame(1)
+        arr = ds_other.get_frame(0)
+        ref = cache._refs[id(ds_other)]
+        assert {(id(ds_other), 0)} == ref.keys
+        del ds
+        gc.collect()
+        assert 1 == cache.cache_info().count
+        assert [id(ds_other)] == list(cache._refs)
+        assert arr is ds_other.get_frame(0)
+
+    @pytest.mark.parametrize('fpath', [EXPL_16_1_10F, RLE_16_1_10F])
+    def test_get_frame(self, fpath):
+        """Test frames are cached by Dataset.get_frame()."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(fpath)
+        arr = ds.get_frame(9)
+        assert arr is ds.get_frame(-1)
+        assert (1, 1, 0, 1, 8192, 100000) == cache.cache_info()
+        # Out of range frames aren't looked up
+        with pytest.raises(IndexError):
+            ds.get_frame(10)
+        assert (1, 1, 0, 1, 8192, 100000) == cache.cache_info()
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        config.pixel_cache_size = 100000
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        assert arr is ds.pixel_array
+        cache.clear()
+        assert (0, 0, 0, 0, 0, 100000) == cache.cache_info()
+        assert arr is not ds.pixel_array
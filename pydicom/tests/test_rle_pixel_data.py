@@ -22,6 +22,7 @@ There are the following possibilities:
 * NumberOfFrames (1, 2, ...)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from struct import pack, unpack
 import sys
 
@@ -31,7 +32,10 @@ from pydicom import dcmread, Dataset, config
 import pydicom.config
 from pydicom.data import get_testdata_files
 from pydicom.dataset import FileMetaDataset
-from pydicom.encaps import defragment_data
+from pydicom.encaps import (
+    defragment_data, encapsulate, encapsulate_extended,
+    generate_pixel_data_frame
+)
 from pydicom.uid import RLELossless, UID
 from pydicom.tests._handler_common import ALL_TRANSFER_SYNTAXES
 
@@ -47,11 +51,14 @@ except ImportError:
 try:
     from pydicom.pixel_data_handlers import rle_handler as RLE_HANDLER
     from pydicom.pixel_data_handlers.rle_handler import (
+        get_frame,
         get_pixeldata,
         _rle_decode_frame,
         _rle_decode_segment,
+        _rle_decode_segment_np,
         _parse_rle_header,
         rle_encode_frame,
+        rle_encode_frames,
         _rle_encode_plane,
         _rle_encode_segment,
         _rle_encode_row,
@@ -790,6 +797,225 @@ class TestNumpy_GetPixelData:
         assert (28161, 27393, 16897) == tuple(arr[31, :3])
         assert (22789, 26884, 24067) == tuple(arr[-1, -3:])
 
+    @pytest.mark.parametrize('fpath', [RLE_8_3_2F, RLE_16_1_10F, RLE_32_3_2F])
+    def test_workers(self, fpath):
+        """Test decoding the frames concurrently."""
+        ds = dcmread(fpath)
+        ref = get_pixeldata(ds)
+        arr = get_pixeldata(ds, workers=4)
+        assert ref.dtype == arr.dtype
+        assert np.array_equal(ref, arr)
+
+    def test_convert_pixel_data_workers(self):
+        """Test Dataset.convert_pixel_data() with workers."""
+        ds = dcmread(RLE_16_1_10F)
+        ds.convert_pixel_data(workers=2)
+        assert np.array_equal(_get_pixel_array(EXPL_16_1_10F), ds.pixel_array)
+
+        ds = dcmread(RLE_16_1_10F)
+        ds.convert_pixel_data('rle', workers=2)
+        assert np.array_equal(_get_pixel_array(EXPL_16_1_10F), ds.pixel_array)
+
+    @pytest.mark.parametrize(
+        'fpath, dtype',
+        [(RLE_8_3_2F, 'uint8'), (RLE_16_1_10F, '<u2'), (RLE_16_1_10F, '>u2'),
+         (RLE_32_3_2F, '<u4')]
+    )
+    def test_out(self, fpath, dtype):
+        """Test decoding into an output array."""
+        ds = dcmread(fpath)
+        ref = get_pixeldata(ds)
+        out = np.zeros(ref.size, dtype=dtype)
+        arr = get_pixeldata(ds, workers=2, out=out)
+        assert np.shares_memory(arr, out)
+        assert np.array_equal(ref, arr)
+        assert np.array_equal(ref, out)
+
+    def test_out_raises(self):
+        """Test an unsuitable output array raises an exception."""
+        ds = dcmread(RLE_16_1_10F)
+        msg = (
+            r"The size of 'out' \(10 items\) doesn't match the size of the "
+            r"pixel data \(40960 items\)"
+        )
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(ds, out=np.empty(10, 'uint16'))
+
+    def test_convert_pixel_data_out(self):
+        """Test Dataset.convert_pixel_data() with an output array."""
+        ds = dcmread(RLE_16_1_10F)
+        out = np.zeros((10, 64, 64), dtype='uint16')
+        ds.convert_pixel_data(out=out)
+        assert np.shares_memory(out, ds.pixel_array)
+        assert np.array_equal(_get_pixel_array(EXPL_16_1_10F), out)
+
+    @pytest.mark.parametrize(
+        'fpath, ref_path, shape',
+        [(RLE_8_3_1F, EXPL_8_3_1F, (100, 100, 3)),
+         (RLE_8_3_2F, EXPL_8_3_2F, (2, 100, 100, 3)),
+         (RLE_16_3_1F, EXPL_16_3_1F, (100, 100, 3)),
+         (RLE_16_3_2F, EXPL_16_3_2F, (2, 100, 100, 3)),
+         (RLE_32_3_1F, EXPL_32_3_1F, (100, 100, 3)),
+         (RLE_32_3_2F, EXPL_32_3_2F, (2, 100, 100, 3))]
+    )
+    def test_convert_pixel_data_out_samples(self, fpath, ref_path, shape):
+        """Test Dataset.convert_pixel_data() with an output array and
+        multi-sample data."""
+        ref = _get_pixel_array(ref_path)
+        ds = dcmread(fpath)
+        out = np.zeros(shape, dtype=ref.dtype)
+        ds.convert_pixel_data(out=out)
+        assert np.shares_memory(out, ds.pixel_array)
+        assert np.array_equal(ref, out)
+        assert np.array_equal(out, ds.pixel_array)
+
+    def test_convert_pixel_data_out_volume(self):
+        """Test decoding multi-sample data into a volume."""
+        ref = _get_pixel_array(EXPL_8_3_1F)
+        volume = np.zeros((2, 100, 100, 3), dtype='uint8')
+        for fpath, plane in zip([RLE_8_3_1F, EXPL_8_3_1F], volume):
+            dcmread(fpath).convert_pixel_data(out=plane)
+
+        assert np.array_equal(ref, volume[0])
+        assert np.array_equal(ref, volume[1])
+
+
+GET_FRAME_DATASETS = [
+    (RLE_8_1_1F, False),
+    (RLE_8_1_2F, False),
+    (RLE_8_3_2F, False),
+    (RLE_16_1_10F, False),
+    (RLE_16_3_2F, False),
+    (RLE_32_1_15F, False),
+    (RLE_32_3_2F, False),
+    (RLE_16_1_10F, True),
+    (RLE_8_3_2F, True),
+]
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestNumpy_GetFrame:
+    """Tests for Dataset.get_frame() and rle_handler.get_frame()."""
+    @pytest.mark.parametrize('fpath, deferred', GET_FRAME_DATASETS)
+    def test_frames_match_pixel_array(self, fpath, deferred):
+        """Test each frame matches the corresponding part of pixel_array."""
+        ds = dcmread(fpath, defer_size=256 if deferred else None)
+        arr = dcmread(fpath).pixel_array
+        nr_frames = getattr(ds, 'NumberOfFrames', 1)
+        if nr_frames == 1:
+            arr = arr[None, ...]
+
+        frames = list(ds.iter_frames())
+        assert nr_frames == len(frames)
+        for frame, ref in zip(frames, arr):
+            assert ref.shape == frame.shape
+            assert ref.dtype == frame.dtype
+            assert frame.flags.writeable
+            assert np.array_equal(ref, frame)
+
+        assert np.array_equal(arr[-1], ds.get_frame(-1))
+        if deferred:
+            # Only the frames have been read, not the whole value
+            assert ds._dict[0x7FE00010].value is None
+
+    def test_only_frame_decoded(self):
+        """Test only the requested frame is decoded."""
+        ds = dcmread(RLE_16_1_10F)
+        ref = ds.pixel_array
+        orig_fn = RLE_HANDLER._rle_decode_frame
+        decoded = []
+
+        def decode(data, *args):
+            decoded.append(data)
+            return orig_fn(data, *args)
+
+        RLE_HANDLER._rle_decode_frame = decode
+        try:
+            assert np.array_equal(ref[7], ds.get_frame(7))
+        finally:
+            RLE_HANDLER._rle_decode_frame = orig_fn
+
+        assert 1 == len(decoded)
+
+    def test_index_reused(self):
+        """Test the frame index is only rebuilt if the pixel data changes."""
+        ds = dcmread(RLE_16_1_10F)
+        get_frame(ds, 0)
+        index = ds._frame_index
+        get_frame(ds, 1)
+        assert index is ds._frame_index
+
+        ds.PixelData = dcmread(RLE_16_1_10F).PixelData
+        get_frame(ds, 1)
+        assert index is not ds._frame_index
+
+    @pytest.mark.parametrize('deferred', (False, True))
+    def test_extended_offset_table(self, deferred, tmpdir):
+        """Test getting frames using the Extended Offset Table."""
+        ds = dcmread(RLE_16_1_10F)
+        ref = ds.pixel_array
+        frames = list(generate_pixel_data_frame(ds.PixelData, 10))
+        ds.PixelData, eot, eot_lengths = encapsulate_extended(frames)
+        ds.ExtendedOffsetTable = eot
+        ds.ExtendedOffsetTableLengths = eot_lengths
+        fpath = str(tmpdir.join('eot.dcm'))
+        ds.save_as(fpath)
+
+        ds = dcmread(fpath, defer_size=256 if deferred else None)
+        assert eot == ds.ExtendedOffsetTable
+        assert eot_lengths == ds.ExtendedOffsetTableLengths
+        assert np.array_equal(ref[9], ds.get_frame(9))
+        if deferred:
+            assert ds._dict[0x7FE00010].value is None
+        else:
+            for index, frame in enumerate(ds.iter_frames()):
+                assert np.array_equal(ref[index], frame)
+
+    def test_little_endian_segment_order(self):
+        """Test interpreting segment order as little endian."""
+        ds = dcmread(RLE_16_1_1F)
+        arr = get_frame(ds, 0, rle_segment_order='<')
+        assert (64, 64) == arr.shape
+        assert (-23039, 16129, 26881) == tuple(arr[0, 31:34])
+
+    def test_index_out_of_range_raises(self):
+        """Test an invalid frame index raises."""
+        ds = dcmread(RLE_16_1_10F)
+        msg = r"Unable to return frame 10 as the pixel data only contains 10"
+        with pytest.raises(IndexError, match=msg):
+            ds.get_frame(10)
+        with pytest.raises(IndexError):
+            ds.get_frame(-11)
+
+    def test_missing_frame_raises(self):
+        """Test pixel data with too few frames raises."""
+        ds = dcmread(RLE_8_1_2F)
+        ds.NumberOfFrames = 3
+        msg = r"there are fewer fragments then frames"
+        with pytest.raises(ValueError, match=msg):
+            ds.get_frame(2)
+
+        # With a Basic Offset Table
+        frames = generate_pixel_data_frame(ds.PixelData, 2)
+        ds.PixelData = encapsulate(list(frames))
+        msg = r"The encapsulated pixel data doesn't contain frame 2"
+        with pytest.raises(ValueError, match=msg):
+            ds.get_frame(2)
+
+    def test_no_pixel_data_raises(self):
+        """Test get_frame raises if dataset has no PixelData."""
+        ds = dcmread(RLE_16_1_1F)
+        del ds.PixelData
+        with pytest.raises(AttributeError, match=' dataset: PixelData'):
+            get_frame(ds, 0)
+
+    def test_unsupported_syntax_raises(self):
+        """Test get_frame raises if unsupported Transfer Syntax."""
+        ds = dcmread(EXPL_16_1_1F)
+        with pytest.raises(NotImplementedError,
+                           match='syntax is not supported by the RLE pixel'):
+            get_frame(ds, 0)
+
 
 # RLE encodes data by first splitting a frame into 8-bit segments
 BAD_SEGMENT_DATA = [
@@ -1143,6 +1369,83 @@ class TestNumpy_RLEDecodeSegment:
         assert b'\x02' * 128 == bytes(_rle_decode_segment(data))
 
 
+DECODE_SEGMENT_DATA = [
+    # (encoded, decoded)
+    (b'', b''),
+    (b'\x80\x80\x80', b''),
+    (b'\x80\x80\x05\x01\x02\x03\x04\x05\x06\xFE\x01\x80',
+     b'\x01\x02\x03\x04\x05\x06\x01\x01\x01'),
+    (b'\x05\x01\x02\x03\x04\x05\x06\x80\xFE\x01\x80',
+     b'\x01\x02\x03\x04\x05\x06\x01\x01\x01'),
+    (b'\x00\x02\x80', b'\x02'),
+    (b'\x01\x02\x03\x80', b'\x02\x03'),
+    (b'\x7f' + b'\x40' * 128 + b'\x80', b'\x40' * 128),
+    (b'\xFF\x02\x80', b'\x02\x02'),
+    (b'\x81\x02\x80', b'\x02' * 128),
+    (b'\x81\x02' * 100, b'\x02' * 12800),
+    (b'\x00\x01\xff\x02' * 100, b'\x01\x02\x02' * 100),
+    # Truncated runs
+    (b'\x05\x01\x02', b'\x01\x02'),
+    (b'\x00\x01\xFE', b'\x01'),
+]
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestNumpy_RLEDecodeSegmentNumpy:
+    """Tests for rle_handler._rle_decode_segment_np."""
+    def setup(self):
+        """Setup the tests."""
+        self.original_decoder = config.rle_segment_decoder
+
+    def teardown(self):
+        """Restore the environment."""
+        config.rle_segment_decoder = self.original_decoder
+
+    @pytest.mark.parametrize('data, output', DECODE_SEGMENT_DATA)
+    def test_decode(self, data, output):
+        """Test the decoded output matches the reference."""
+        assert output == bytes(_rle_decode_segment(data))
+        result = _rle_decode_segment_np(data)
+        assert result.dtype == np.uint8
+        assert output == result.tobytes()
+
+    def test_random(self):
+        """Test matches the Python decoder for random data."""
+        rng = np.random.RandomState(1234)
+        for length in rng.randint(0, 2000, 50):
+            data = rng.randint(0, 256, length).astype('uint8').tobytes()
+            result = _rle_decode_segment_np(data)
+            assert bytes(_rle_decode_segment(data)) == result.tobytes()
+
+    def test_encoded_frame(self):
+        """Test decoding the segments of an encoded frame."""
+        arr = np.add.outer(np.arange(300), np.arange(200)) // 3
+        arr = arr.astype('uint16')
+        data = rle_encode_frame(arr)
+        config.rle_segment_decoder = 'numpy'
+        decoded = _rle_decode_frame(data, 300, 200, 1, 16)
+        assert np.array_equal(arr, np.frombuffer(decoded, '>u2').reshape(
+            300, 200
+        ))
+
+    @pytest.mark.parametrize(
+        'fpath', [RLE_8_3_2F, RLE_16_1_10F, RLE_16_3_2F, RLE_32_1_15F,
+                  RLE_32_3_2F]
+    )
+    def test_pixel_array(self, fpath):
+        """Test the pixel data matches the Python decoder."""
+        ref = dcmread(fpath).pixel_array
+        config.rle_segment_decoder = 'numpy'
+        assert np.array_equal(ref, dcmread(fpath).pixel_array)
+
+    def test_invalid_decoder_raises(self):
+        """Test an unknown decoder raises."""
+        config.rle_segment_decoder = 'fortran'
+        msg = r"Invalid 'config.rle_segment_decoder' value 'fortran'"
+        with pytest.raises(ValueError, match=msg):
+            get_pixeldata(dcmread(RLE_16_1_1F))
+
+
 # Tests for RLE encoding
 REFERENCE_ENCODE_ROW = [
     # Input, output
@@ -1415,6 +1718,64 @@ class TestNumpy_RLEEncodeFrame:
             b'\x04\x00\x01\x02\x03\x04'
         ) == encoded[64:]
 
+    def test_executor(self):
+        """Test encoding the segments using an executor."""
+        ref = _get_pixel_array(EXPL_16_3_2F)[0]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            encoded = rle_encode_frame(ref, executor=executor)
+
+        assert rle_encode_frame(ref) == encoded
+
+
+@pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
+class TestNumpy_RLEEncodeFrames:
+    """Tests for rle_handler.rle_encode_frames."""
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_executor(self, executor):
+        """Test encoding with the thread and process executors."""
+        ref = _get_pixel_array(EXPL_16_1_10F)
+        encoded = list(rle_encode_frames(ref, workers=2, executor=executor))
+        assert 10 == len(encoded)
+        for frame, data in zip(ref, encoded):
+            assert rle_encode_frame(frame) == data
+
+    def test_executor_instance(self):
+        """Test encoding with an existing executor."""
+        ref = _get_pixel_array(EXPL_8_3_2F)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            encoded = list(rle_encode_frames(ref, executor=executor))
+            # The executor isn't shut down
+            assert 1 == executor.submit(int, "1").result()
+
+        assert [rle_encode_frame(frame) for frame in ref] == encoded
+
+    def test_iterable(self):
+        """Test encoding frames from an iterable."""
+        ref = _get_pixel_array(EXPL_16_1_10F)
+        frames = (frame for frame in ref)
+        encoded = list(rle_encode_frames(frames, workers=1, executor='thread'))
+        assert [rle_encode_frame(frame) for frame in ref] == encoded
+
+    def test_encapsulate(self):
+        """Test the encoded frames can be encapsulated and decoded."""
+        ds = dcmread(EXPL_16_1_10F)
+        ref = ds.pixel_array
+        ds.PixelData = encapsulate(
+            list(rle_encode_frames(ref, workers=2, executor='thread'))
+        )
+        ds['PixelData'].is_undefined_length = True
+        ds.file_meta.TransferSyntaxUID = RLELossless
+        assert np.array_equal(ref, get_pixeldata(ds).reshape(ref.shape))
+
+    def test_invalid_executor(self):
+        """Test an invalid executor raises an exception."""
+        msg = (
+            r"Invalid 'executor' value 'foo', must be 'process', 'thread' or "
+            r"an Executor instance"
+        )
+        with pytest.raises(ValueError, match=msg):
+            next(rle_encode_frames([], executor='foo'))
+
 
 @pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
 class TestNumpy_RLEEncodePlane:
@@ -1664,3 +2025,23 @@ class TestNumpy_RLEEncodeSegment:
         redecoded = _rle_decode_segment(encoded)
         assert ds.Rows * ds.Columns == len(redecoded)
         assert decoded == redecoded
+
+    def test_empty(self):
+        """Test encoding an empty segment."""
+        assert bytearray() == _rle_encode_segment(np.zeros((0, 4), 'uint8'))
+
+    @pytest.mark.parametrize('nr_values, run_length', [
+        (2, 1), (3, 1), (256, 1), (2, 50), (256, 200)
+    ])
+    def test_matches_encode_row(self, nr_values, run_length):
+        """Test the output is the same as encoding each row in turn."""
+        rng = np.random.RandomState(nr_values + run_length)
+        arr = rng.randint(0, nr_values, size=(10, 500), dtype='uint8')
+        arr = np.repeat(arr, run_length, axis=1)[:, :500]
+
+        ref = bytearray()
+        for row in arr:
+            ref.extend(_rle_encode_row(row))
+        ref.extend(b'\x00' * (len(ref) % 2))
+
+        assert ref == _rle_encode_segment(arr)